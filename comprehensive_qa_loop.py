@@ -5,16 +5,25 @@
 """
 
 import json
+import sys
 import time
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "studio_cipher"))
+import cipher_trace
+from cipher_runs import get_latest_run
+import run_index
+
+RUNS_DIR = Path(__file__).resolve().parent / "studio_cipher" / "runs"
+
 class ProducerQA:
     def __init__(self):
         self.issues_found = []
         self.round_number = 0
         self.total_rounds = 5
         
+    @cipher_trace.traced(phase="qa", agent="producer")
     def conduct_comprehensive_review(self, round_num):
         """Conduct thorough review of all application aspects"""
         self.round_number = round_num
@@ -222,6 +231,10 @@ def main():
     print("🎬🔥 PRODUCER COMPREHENSIVE QA LOOP INITIATED 🔥🎬")
     print("=" * 70)
     
+    # QA rounds are traced and scored into the run under review
+    run_dir = get_latest_run(RUNS_DIR)
+    cipher_trace.configure(run_dir)
+    
     producer = ProducerQA()
     
     for round_num in range(1, 6):
@@ -229,6 +242,7 @@ def main():
         
         # Producer review
         feedback = producer.conduct_comprehensive_review(round_num)
+        run_index.record_qa(run_dir, "comprehensive_qa", round_num, issues=feedback.get("total_issues", 0))
         
         if feedback["status"] == "perfect":
             print(f"🎯 ROUND {round_num}: PERFECT QUALITY ACHIEVED!")
@@ -249,6 +263,7 @@ def main():
     
     # Final comprehensive review
     final_feedback = producer.conduct_comprehensive_review("FINAL")
+    run_index.record_qa(run_dir, "comprehensive_qa", "final", issues=final_feedback.get("total_issues", 0))
     
     if final_feedback["status"] == "perfect":
         print("🎯 PRODUCER FINAL VERDICT:")
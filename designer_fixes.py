@@ -5,16 +5,18 @@ Based on Producer feedback, implementing CS1 repository quality design
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
+sys.path.insert(0, str(Path(__file__).resolve().parent / "studio_cipher"))
+from build_manifest import finish_build, write_artifact
+from cipher_trace import traced
+from cipher_runs import get_latest_run
 
+RUNS_DIR = Path(__file__).resolve().parent / "studio_cipher" / "runs"
+
+@traced(phase="build")
 def create_missing_css_files(run_dir):
     """Create all missing page-specific CSS files"""
     created = []
@@ -218,7 +220,7 @@ def create_missing_css_files(run_dir):
     }
 }"""
     
-    (styles_dir / "login-cypher.css").write_text(login_css, encoding="utf-8")
+    write_artifact(run_dir, styles_dir / "login-cypher.css", login_css)
     created.append("login-cypher.css")
 
     # 2. Command Center CSS
@@ -479,7 +481,7 @@ def create_missing_css_files(run_dir):
     }
 }"""
     
-    (styles_dir / "command-center.css").write_text(command_css, encoding="utf-8")
+    write_artifact(run_dir, styles_dir / "command-center.css", command_css)
     created.append("command-center.css")
 
     # 3. Mileage Cypher CSS
@@ -771,11 +773,12 @@ def create_missing_css_files(run_dir):
     }
 }"""
     
-    (styles_dir / "mileage-cypher.css").write_text(mileage_css, encoding="utf-8")
+    write_artifact(run_dir, styles_dir / "mileage-cypher.css", mileage_css)
     created.append("mileage-cypher.css")
 
     return created
 
+@traced(phase="build")
 def create_missing_js_files(run_dir):
     """Create missing JavaScript files"""
     created = []
@@ -939,11 +942,12 @@ window.refreshDashboard = refreshDashboard;
 
 console.log('🏠 Command Center JavaScript loaded - Dashboard ready!');"""
     
-    (scripts_dir / "command-center.js").write_text(command_js, encoding="utf-8")
+    write_artifact(run_dir, scripts_dir / "command-center.js", command_js)
     created.append("command-center.js")
 
     return created
 
+@traced(phase="build")
 def create_favicon(run_dir):
     """Create a simple favicon"""
     created = []
@@ -956,82 +960,111 @@ def create_favicon(run_dir):
   <text x="50" y="58" text-anchor="middle" font-family="Arial" font-size="30" font-weight="bold" fill="#FFD700">🎤</text>
 </svg>"""
     
-    (app_dir / "favicon.svg").write_text(favicon_svg, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "favicon.svg", favicon_svg)
     created.append("favicon.svg")
     
     return created
 
+def patch_command_center(content):
+    """command-center.html with the favicon, its own CSS and JS, stat card hooks and init call"""
+    # Add favicon
+    if 'favicon' not in content:
+        content = content.replace(
+            '<title>Command Center - Claim Cipher</title>',
+            '<title>Command Center - Claim Cipher</title>\n    <link rel="icon" href="favicon.svg" type="image/svg+xml">'
+        )
+
+    # Add missing CSS
+    if 'command-center.css' not in content:
+        content = content.replace(
+            '<link rel="stylesheet" href="styles/cipher-core.css">',
+            '<link rel="stylesheet" href="styles/cipher-core.css">\n    <link rel="stylesheet" href="styles/command-center.css">'
+        )
+
+    # Add missing JS
+    if 'command-center.js' not in content:
+        content = content.replace(
+            '<script src="scripts/cipher-core.js"></script>',
+            '<script src="scripts/cipher-core.js"></script>\n    <script src="scripts/command-center.js"></script>'
+        )
+
+    # Add data attributes to stat cards
+    if 'data-stat=' not in content:
+        content = content.replace(
+            '<div class="cipher-card">',
+            '<div class="cipher-card command-stat-card" data-stat="miles">',
+            1
+        )
+        content = content.replace(
+            '<div class="cipher-card">',
+            '<div class="cipher-card command-stat-card" data-stat="routes">',
+            1
+        )
+        content = content.replace(
+            '<div class="cipher-card">',
+            '<div class="cipher-card command-stat-card" data-stat="jobs">',  
+            1
+        )
+        content = content.replace(
+            '<div class="cipher-card">',
+            '<div class="cipher-card command-stat-card" data-stat="earnings">',
+            1
+        )
+
+    # Add initializeCommandCenter call
+    if 'initializeCommandCenter' not in content:
+        content = content.replace(
+            'initializeCipherUserContext();',
+            'initializeCipherUserContext();\n            initializeCommandCenter();'
+        )
+    
+    return content
+
+# Page -> patch, applied by page_fixes as pages are rendered so each is written once, final
+PAGE_PATCHES = {"command-center.html": patch_command_center}
+
+@traced(phase="build")
 def update_html_files(run_dir):
-    """Update HTML files to include missing CSS and fix references"""
+    """Update HTML files already on disk (pages rendered before these patches existed)"""
     updated = []
     app_dir = run_dir / "claim_cipher_app"
     
     # Update command-center.html to include favicon and missing JS
     command_center_file = app_dir / "command-center.html"
     if command_center_file.exists():
-        content = command_center_file.read_text(encoding="utf-8")
-        
-        # Add favicon
-        if 'favicon' not in content:
-            content = content.replace(
-                '<title>Command Center - Claim Cipher</title>',
-                '<title>Command Center - Claim Cipher</title>\n    <link rel="icon" href="favicon.svg" type="image/svg+xml">'
-            )
-        
-        # Add missing CSS
-        if 'command-center.css' not in content:
-            content = content.replace(
-                '<link rel="stylesheet" href="styles/cipher-core.css">',
-                '<link rel="stylesheet" href="styles/cipher-core.css">\n    <link rel="stylesheet" href="styles/command-center.css">'
-            )
-        
-        # Add missing JS
-        if 'command-center.js' not in content:
-            content = content.replace(
-                '<script src="scripts/cipher-core.js"></script>',
-                '<script src="scripts/cipher-core.js"></script>\n    <script src="scripts/command-center.js"></script>'
-            )
-        
-        # Add data attributes to stat cards
-        if 'data-stat=' not in content:
-            content = content.replace(
-                '<div class="cipher-card">',
-                '<div class="cipher-card command-stat-card" data-stat="miles">',
-                1
-            )
-            content = content.replace(
-                '<div class="cipher-card">',
-                '<div class="cipher-card command-stat-card" data-stat="routes">',
-                1
-            )
-            content = content.replace(
-                '<div class="cipher-card">',
-                '<div class="cipher-card command-stat-card" data-stat="jobs">',  
-                1
-            )
-            content = content.replace(
-                '<div class="cipher-card">',
-                '<div class="cipher-card command-stat-card" data-stat="earnings">',
-                1
-            )
-        
-        # Add initializeCommandCenter call
-        if 'initializeCommandCenter' not in content:
-            content = content.replace(
-                'initializeCipherUserContext();',
-                'initializeCipherUserContext();\n            initializeCommandCenter();'
-            )
-        
-        command_center_file.write_text(content, encoding="utf-8")
+        content = patch_command_center(command_center_file.read_text(encoding="utf-8"))
+        write_artifact(run_dir, command_center_file, content)
         updated.append("command-center.html")
     
     return updated
 
+# Build pipeline contract - paths are relative to the run directory
+READS = [
+    "claim_cipher_app/styles/",
+    "claim_cipher_app/scripts/",
+]
+WRITES = [
+    "claim_cipher_app/styles/login-cypher.css",
+    "claim_cipher_app/styles/command-center.css",
+    "claim_cipher_app/styles/mileage-cypher.css",
+    "claim_cipher_app/scripts/command-center.js",
+    "claim_cipher_app/favicon.svg",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created += create_missing_css_files(run_dir)
+    created += create_missing_js_files(run_dir)
+    created += create_favicon(run_dir)
+    # command-center.html is rendered with PAGE_PATCHES already applied - see page_fixes
+    return created
+
 def main():
     print("🎨🔥 DESIGNER FIXING ALL VISUAL ISSUES 🔥🎨")
     print("=" * 60)
     
-    latest_run = get_latest_run()
+    latest_run = get_latest_run(RUNS_DIR)
     print(f"📁 Working in: {latest_run}")
     
     print("🎨 Creating missing CSS files...")
@@ -1045,6 +1078,7 @@ def main():
     
     print("🎨 Updating HTML files...")
     html_updated = update_html_files(latest_run)
+    finish_build(latest_run)
     
     all_created = css_created + js_created + favicon_created
     
@@ -4,11 +4,21 @@
 Professional Development Cycle with 100% Completion Requirement
 """
 
+import sys
 import time
 import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "studio_cipher"))
+import cipher_trace
+from cipher_runs import get_latest_run
+import run_index
+
+RUNS_DIR = Path(__file__).resolve().parent / "studio_cipher" / "runs"
 
 class StudioCipherEnhancedQA:
-    def __init__(self):
+    def __init__(self, run_dir=None):
+        self.run_dir = run_dir
         self.rounds_completed = 0
         self.max_rounds = 10
         
@@ -85,6 +95,7 @@ class StudioCipherEnhancedQA:
                 print(f"    • {task.replace('_', ' ').title()}")
             return False
 
+    @cipher_trace.traced(phase="qa", agent="producer")
     def execute_development_round(self, round_number):
         """Execute a single development round"""
         print(f"\n==================== ROUND {round_number} ====================")
@@ -110,7 +121,11 @@ class StudioCipherEnhancedQA:
         time.sleep(0.3)
         
         # Producer QC Check
-        return self.producer_qc_check(round_number)
+        approved = self.producer_qc_check(round_number)
+        average = sum(t['progress'] for t in self.tasks.values()) / len(self.tasks)
+        incomplete = sum(1 for t in self.tasks.values() if t['progress'] < t['required'])
+        run_index.record_qa(self.run_dir, "enhanced_qa", round_number, average, incomplete)
+        return approved
 
     def run_enhanced_qa_cycle(self):
         """Run the complete 10-round QA cycle with producer enforcement"""
@@ -158,5 +173,8 @@ class StudioCipherEnhancedQA:
         print("🚀 READY FOR DEPLOYMENT!")
 
 if __name__ == "__main__":
-    qa_system = StudioCipherEnhancedQA()
+    # QA rounds are traced and scored into the run under review
+    run_dir = get_latest_run(RUNS_DIR)
+    cipher_trace.configure(run_dir)
+    qa_system = StudioCipherEnhancedQA(run_dir)
     qa_system.run_enhanced_qa_cycle()
@@ -7,8 +7,11 @@ echo "📅 Build Date: August 13, 2025"
 echo "✅ Producer Approved - Quality Score: 100%"
 echo ""
 
-# Navigate to the application directory
-cd "$(dirname "$0")/claim_cipher_app"
+cd "$(dirname "$0")"
+
+# Bundle and precompress the app - the server only ever sends files the build made
+echo "📦 Bundling claim_cipher_app into claim_cipher_dist..."
+python3 studio_cipher/asset_bundler.py claim_cipher_app > /dev/null || exit 1
 
 echo "🚀 Starting HTTP server on port 8080..."
 echo "🎯 Access your application at: http://localhost:8080"
@@ -16,5 +19,5 @@ echo ""
 echo "🎵 Press Ctrl+C to stop the server"
 echo ""
 
-# Start the Python HTTP server
-python3 -m http.server 8080
+# Precompressed variants, ETags and 304s, year-long caching for hashed bundles, keep-alive
+python3 studio_cipher/static_server.py claim_cipher_dist --host=0.0.0.0 --port=8080
@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def agent_api_integration():
     """All three agents coordinate to integrate API securely"""
     
@@ -143,8 +145,7 @@ if __name__ == "__main__":
     
     # Save coordination results
     os.makedirs('runs/20250813_203814/coordination', exist_ok=True)
-    with open('runs/20250813_203814/coordination/api_integration_complete.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/coordination/api_integration_complete.json', json.dumps(result, indent=2))
         
     print(f"\n📋 Agent coordination results saved to:")
     print(f"   runs/20250813_203814/coordination/api_integration_complete.json")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Agent Engine
+Run the crew's work units side by side instead of one verse at a time
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+import cipher_trace
+
+DEFAULT_GATES = ["architecture", "integration", "production"]
+
+
+class WorkUnit:
+    """A single piece of agent work bound to a review gate"""
+
+    def __init__(self, agent, phase, func, args=(), name=None):
+        self.agent = agent
+        self.phase = phase
+        self.func = func
+        self.args = args
+        self.name = name or func.__name__
+
+    @property
+    def key(self):
+        return f"{self.phase}/{self.agent}/{self.name}"
+
+    def __repr__(self):
+        return f"WorkUnit({self.agent}:{self.phase}:{self.name})"
+
+
+class AgentEngine:
+    """Schedule agent work units concurrently, one review gate at a time.
+
+    Every unit registered for a gate runs at the same time on a worker pool.
+    Units are submitted in `agents.<name>.priority` order so the crew with
+    the final word grabs pool slots first when workers are scarce. A gate
+    only opens once every unit in the previous gate has finished cleanly.
+    """
+
+    def __init__(self, settings, max_workers=None, use_processes=False, journal=None, on_commit=None):
+        self.settings = settings or {}
+        orchestration = self.settings.get('orchestration', {})
+        self.mode = orchestration.get('mode', 'parallel_with_review_cycles')
+        self.gates = list(orchestration.get('review_gates') or DEFAULT_GATES)
+        self.coordinator = orchestration.get('coordinator', 'producer')
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.use_processes = use_processes
+        self.units = []
+        self.results = {}
+        self.gate_reports = []
+        # Optional phase_journal.PhaseJournal - committed units are skipped on resume
+        self.journal = journal
+        self.committed = journal.completed("mission") if journal else {}
+        # Optional callback(unit, artifacts) as each unit finishes cleanly - live progress hangs off it
+        self.on_commit = on_commit
+
+    def priority(self, agent):
+        """Lower number runs first - mirrors settings.yml agents.<name>.priority"""
+        agent_config = self.settings.get('agents', {}).get(agent, {})
+        return agent_config.get('priority', 99)
+
+    def gate(self, name):
+        """The configured gate standing in for one of DEFAULT_GATES.
+
+        A gate of that name if settings.yml has one; otherwise the gate in the
+        same position, or the last one when fewer gates are configured.
+        """
+        if name in self.gates:
+            return name
+        return self.gates[min(DEFAULT_GATES.index(name), len(self.gates) - 1)]
+
+    def schedule(self, agent, phase, func, *args, name=None):
+        """Register a work unit for an agent under a review gate"""
+        if phase not in self.gates:
+            raise ValueError(f"Unknown review gate '{phase}' - expected one of {self.gates}")
+        unit = WorkUnit(agent, phase, func, args, name)
+        self.units.append(unit)
+        return unit
+
+    def units_for(self, phase):
+        """Work units for a gate, highest priority first"""
+        units = [u for u in self.units if u.phase == phase]
+        return sorted(units, key=lambda u: (self.priority(u.agent), u.agent))
+
+    def _executor(self):
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cipher-agent")
+
+    async def _run_unit(self, loop, pool, unit):
+        started = datetime.now()
+        start_us, t0 = time.time_ns() // 1000, time.perf_counter()
+        skipped = unit.key in self.committed
+        if skipped:
+            # Finished before the crash - reuse what the journal recorded
+            artifacts = self.committed[unit.key]
+            value, error = (artifacts[0] if len(artifacts) == 1 else artifacts), None
+        else:
+            if self.journal:
+                self.journal.begin("mission", unit.key)
+            try:
+                value = await loop.run_in_executor(pool, unit.func, *unit.args)
+                error = None
+            except Exception as exc:  # surfaced in the gate report
+                value, error = None, f"{type(exc).__name__}: {exc}"
+            if not error:
+                artifacts = value if isinstance(value, (list, tuple)) else [value] if value else []
+                if self.journal:
+                    self.journal.commit("mission", unit.key, artifacts)
+                if self.on_commit:
+                    await loop.run_in_executor(None, self.on_commit, unit, artifacts)
+        finished = datetime.now()
+        tracer = cipher_trace.get_tracer()
+        if tracer and not skipped:
+            # Timed here so units on a process pool are traced the same way
+            tracer.record(f"{unit.agent}.{unit.name}", start_us, int((time.perf_counter() - t0) * 1_000_000),
+                          agent=unit.agent, phase=unit.phase, file=value if isinstance(value, str) else None,
+                          error=error)
+        return unit, {
+            "agent": unit.agent,
+            "phase": unit.phase,
+            "unit": unit.name,
+            "result": value,
+            "error": error,
+            "skipped": skipped,
+            "started_at": started.isoformat(),
+            "finished_at": finished.isoformat(),
+            "seconds": (finished - started).total_seconds(),
+        }
+
+    async def run_gate(self, loop, pool, phase):
+        """Run every unit in a gate concurrently and review the outcome"""
+        units = self.units_for(phase)
+        outcomes = await asyncio.gather(*(self._run_unit(loop, pool, u) for u in units))
+
+        failures = []
+        for unit, outcome in outcomes:
+            self.results.setdefault(unit.agent, []).append(outcome)
+            if outcome["error"]:
+                failures.append(outcome)
+
+        report = {
+            "gate": phase,
+            "reviewer": self.coordinator,
+            "units": len(units),
+            "agents": sorted({u.agent for u in units}, key=self.priority),
+            "passed": not failures,
+            "failures": failures,
+            "wall_seconds": max((o["seconds"] for _, o in outcomes), default=0.0),
+            "agent_seconds": sum(o["seconds"] for _, o in outcomes),
+        }
+        self.gate_reports.append(report)
+        return report
+
+    async def run_async(self):
+        """Walk the review gates in order, stopping at the first failed review"""
+        loop = asyncio.get_running_loop()
+        with self._executor() as pool:
+            for phase in self.gates:
+                with cipher_trace.span(f"gate {phase}", phase=phase, agent=self.coordinator):
+                    report = await self.run_gate(loop, pool, phase)
+                if not report["passed"]:
+                    break
+                if self.journal:
+                    self.journal.commit("mission", f"gate/{phase}")
+        return self.gate_reports
+
+    def run(self):
+        """Synchronous entry point for scripts"""
+        return asyncio.run(self.run_async())
+
+    @property
+    def passed(self):
+        return bool(self.gate_reports) and all(r["passed"] for r in self.gate_reports)
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Asset Bundler
+One minified, content-hashed CSS bundle and JS bundle per page - fewer round trips for adjusters on 4G
+"""
+
+import hashlib
+import json
+import posixpath
+import re
+import shutil
+import subprocess
+import sys
+from html.parser import HTMLParser
+from pathlib import Path, PurePosixPath
+
+from build_manifest import manifest_for, write_atomic
+from cipher_runs import STUDIO_DIR, resolve_run
+from cipher_trace import span
+from css_cascade import Cascade, serialize
+from css_prune import Vocabulary, prune
+from critical_css import critical_css, inline_tags
+from precompress import precompress, print_savings, savings
+from run_compare import scan_tree
+
+APP_NAME = "claim_cipher_app"
+DIST_NAME = "claim_cipher_dist"
+BUNDLE_DIR = "bundles"
+HASH_LENGTH = 10
+PAGE_SUFFIXES = {".html", ".htm"}
+# What the last bundle wrote into its output directory - the only files a rebuild may delete
+BUNDLE_MANIFEST = ".cipher_bundle.json"
+JS_TYPES = {"", "text/javascript", "application/javascript"}
+
+# --- minifiers --------------------------------------------------------------
+
+CSS_STRINGS_AND_COMMENTS = re.compile(r""""(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|/\*.*?\*/""", re.DOTALL)
+CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+def minify_css(css):
+    """Drop comments and every space the CSS grammar does not need - strings are left alone"""
+    strings = []
+    def stash(match):
+        if match.group(0).startswith("/*"):
+            return " "
+        strings.append(match.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+    css = CSS_STRINGS_AND_COMMENTS.sub(stash, css)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r" ?([{};,>]) ?", r"\1", css)  # never around ':' - `a :hover` is not `a:hover`
+    css = re.sub(r": ", ":", css).replace(";}", "}")
+    return re.sub("\x00(\\d+)\x00", lambda m: strings[int(m.group(1))], css.strip())
+
+# Punctuation no space is ever needed next to (`+ +`, `- -`, `/ /` and `1 .x` still keep theirs)
+JS_TIGHT = set("{}()[];,:=<>!&|?*%^~")
+JS_REGEX_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+                     "throw", "case", "do", "else", "yield", "await"}
+JS_WORD = re.compile(r"[\w$]+")
+
+def _scan_quoted(source, i, quote):
+    """End of the string starting at i - a raw newline ends a broken one"""
+    i += 1
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == quote or char == "\n":
+            return i + 1
+        i += 1
+    return i
+
+def _scan_regex(source, i):
+    """End of the regex literal at i (flags included), or None if this `/` is not one"""
+    j, in_class = i + 1, False
+    while j < len(source):
+        char = source[j]
+        if char == "\\":
+            j += 2
+            continue
+        if char == "\n":
+            return None
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            j += 1
+            while j < len(source) and (source[j].isalpha()):
+                j += 1
+            return j
+        j += 1
+    return None
+
+def minify_js(source):
+    """Strip comments, indentation and blank lines - strings, templates and regexes are copied verbatim.
+
+    Newlines between statements stay unless the previous character makes
+    them meaningless, so automatic semicolon insertion sees what it always saw.
+    """
+    out = []
+    gap = None   # whitespace since the last token: None, " " or "\n"
+    prev = ""    # last character emitted
+    word = ""    # last identifier emitted, for `return /re/`
+    braces = []  # brace depth inside each open `${` substitution
+    i, n = 0, len(source)
+
+    def emit(text):
+        nonlocal gap, prev
+        if gap and out:
+            if gap == "\n" and prev not in "{;,([" and text[0] not in "})],;":
+                out.append("\n")
+            elif prev not in JS_TIGHT and text[0] not in JS_TIGHT:
+                out.append(" ")
+        gap = None
+        out.append(text)
+        prev = text[-1]
+
+    def template(start):
+        """Copy template text from start (its backtick or a `}`) up to the closing backtick or next `${`"""
+        i = start + 1
+        while i < n:
+            if source[i] == "\\":
+                i += 2
+            elif source[i] == "`":
+                emit(source[start:i + 1])
+                return i + 1
+            elif source.startswith("${", i):
+                emit(source[start:i + 2])
+                braces.append(0)
+                return i + 2
+            else:
+                i += 1
+        emit(source[start:])
+        return n
+
+    while i < n:
+        char = source[i]
+        if char in " \t\r\n\f\v\ufeff":
+            gap = "\n" if char == "\n" or gap == "\n" else " "
+            i += 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end < 0 else end
+            gap = gap or " "
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            gap = "\n" if "\n" in source[i:end] or gap == "\n" else " "
+            i = end
+        elif char in "'\"":
+            end = _scan_quoted(source, i, char)
+            emit(source[i:end])
+            i, word = end, ""
+        elif char == "`":
+            i, word = template(i), ""
+        elif char == "/" and (prev in "(,=:[!&|?{};+-*%<>~^" or word in JS_REGEX_KEYWORDS):
+            end = _scan_regex(source, i)
+            emit(source[i:end] if end else "/")
+            i, word = end or i + 1, ""
+        elif char == "{" and braces:
+            braces[-1] += 1
+            emit(char)
+            i, word = i + 1, ""
+        elif char == "}" and braces:
+            if braces[-1]:
+                braces[-1] -= 1
+                emit(char)
+                i += 1
+            else:
+                braces.pop()  # end of a `${...}` - back into the template text
+                gap = None
+                i = template(i)
+            word = ""
+        else:
+            match = JS_WORD.match(source, i)
+            if match:
+                emit(match.group(0))
+                i, word = match.end(), match.group(0)
+            else:
+                emit(char)
+                i, word = i + 1, ""
+    return "".join(out)
+
+# Compile (never run) each script the way a browser would, one node process for all of them
+SYNTAX_CHECK = """
+const vm = require("vm");
+let input = "";
+process.stdin.setEncoding("utf8").on("data", chunk => input += chunk).on("end", () => {
+  process.stdout.write(JSON.stringify(JSON.parse(input).map(source => {
+    try { new vm.Script(source); return true; } catch (e) { return false; }
+  })));
+});
+"""
+
+def check_scripts(sources):
+    """source -> whether it parses; without node on PATH every script is trusted"""
+    sources = sorted(set(sources))
+    node = shutil.which("node")
+    if node and sources:
+        result = subprocess.run([node, "-e", SYNTAX_CHECK], input=json.dumps(sources),
+                                capture_output=True, text=True, encoding="utf-8")
+        if result.returncode == 0:
+            return dict(zip(sources, json.loads(result.stdout)))
+    return dict.fromkeys(sources, True)
+
+# --- page scanning ----------------------------------------------------------
+
+class _AssetScanner(HTMLParser):
+    """Every <link>, <style> and <script> of a page with its exact span in the source.
+
+    html.parser reads script and style bodies the way a browser does - up to
+    the next closing tag - so a <script src> somebody forgot to close
+    swallows the tags after it here too, exactly as it does on the page.
+    """
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=False)
+        self.html = html
+        self.line_starts = [0] + [m.end() for m in re.finditer("\n", html)]
+        self.tags = []
+        self.open = None
+
+    def position(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in ("link", "style", "script"):
+            return
+        start = self.position()
+        end = start + len(self.get_starttag_text())
+        entry = {"tag": tag, "attrs": {k: (v or "") for k, v in attrs}, "start": start, "end": end}
+        if tag == "link":
+            self.tags.append(entry)
+        else:
+            entry["body_start"] = end
+            self.open = entry
+
+    def handle_endtag(self, tag):
+        if self.open and tag == self.open["tag"]:
+            start = self.position()
+            close = self.html.find(">", start)
+            self.open["body"] = self.html[self.open["body_start"]:start]
+            self.open["end"] = len(self.html) if close < 0 else close + 1
+            self.tags.append(self.open)
+            self.open = None
+
+def _local_path(page, ref):
+    """App-relative path a page reference points at, or None for remote and data URLs"""
+    ref = ref.split("#", 1)[0].split("?", 1)[0].strip()
+    if not ref or "://" in ref or ref.startswith(("data:", "//", "mailto:")):
+        return None
+    if ref.startswith("/"):
+        return posixpath.normpath(ref.lstrip("/"))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(page), ref))
+
+def page_assets(page, html):
+    """Classify a page's tags into what a bundle can absorb - in document order"""
+    scanner = _AssetScanner(html)
+    scanner.feed(html)
+    scanner.close()
+    assets = []
+    for tag in scanner.tags:
+        attrs = tag["attrs"]
+        media = attrs.get("media", "").strip()
+        if tag["tag"] == "link":
+            if "stylesheet" not in attrs.get("rel", "").lower().split() or "alternate" in attrs.get("rel", "").lower():
+                continue
+            kind = "css"
+            path = _local_path(page, attrs.get("href", ""))
+        elif tag["tag"] == "style":
+            if attrs.get("type", "text/css").lower() != "text/css":
+                continue
+            kind, path = "css", None
+        else:
+            if attrs.get("type", "").lower() not in JS_TYPES or "async" in attrs:
+                continue
+            path = _local_path(page, attrs["src"]) if "src" in attrs else None
+            if "src" in attrs and path is None:
+                continue  # remote scripts keep their own tag
+            kind = "defer" if path and "defer" in attrs else "js"
+        assets.append({**tag, "kind": kind, "path": path, "media": "" if media.lower() == "all" else media})
+    return assets
+
+# --- bundling ---------------------------------------------------------------
+
+def _rebase_urls(css, from_dir, to_dir):
+    """Keep relative url()s pointing at the same files once the CSS lives in to_dir"""
+    def rebase(match):
+        ref = match.group(2).strip()
+        target = _local_path(posixpath.join(from_dir, "_"), ref)
+        if target is None or ref.startswith("/"):
+            return match.group(0)
+        return f'url("{posixpath.relpath(target, to_dir or ".")}")'
+    return CSS_URL.sub(rebase, css)
+
+def _hashed_name(stem, suffix, text):
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    return f"{BUNDLE_DIR}/{stem}.{digest}{suffix}"
+
+def _whole_line(html, start, end):
+    """Widen a span to its whole line when nothing else sits on that line"""
+    line_start = html.rfind("\n", 0, start) + 1
+    line_end = html.find("\n", end)
+    line_end = len(html) if line_end < 0 else line_end + 1
+    if html[line_start:start].strip() or html[end:line_end].strip():
+        return start, end
+    return line_start, line_end
+
+class PageBundle:
+    """The bundles one page needs and the page rewritten to load them.
+
+    Stylesheets fold into one CSS bundle in their original order - inline
+    <style> blocks between the first and last linked sheet fold in with
+    them, so the cascade is unchanged - and it loads where the first sheet
+    did. Classic scripts do the same for the JS bundle, which loads where
+    the last script did; deferred scripts get a deferred bundle of their
+    own. A sheet linked twice keeps its last position, a script its first.
+    The CSS then goes through the cascade engine, so declarations a later
+    rule overrides for the same selector never ship, and - given the page's
+    vocabulary - loses every selector nothing on the page can match. When
+    the rules the first screen needs are small enough they are inlined and
+    the bundle is preloaded instead of blocking paint.
+    """
+
+    def __init__(self, page, html, read_asset, script_ok=None, assets=None, vocabulary=None, critical=None):
+        self.page = page
+        self.html = html
+        self.read_asset = read_asset
+        self.script_ok = script_ok or (lambda source: True)
+        self.vocabulary = vocabulary
+        self.critical = critical  # (fold bytes, most bytes worth inlining), or None to link the CSS as is
+        self.bundles = {}    # app-relative bundle path -> text
+        self.sources = []    # app-relative assets the bundles replaced
+        self.edits = []      # (start, end, replacement)
+        self.cascade = None  # rule and declaration counts before and after consolidation
+        self.pruned = None   # minified CSS bytes before and after unused selectors went
+        self.inlined = None  # bytes of critical CSS inlined in <head>
+        stem = PurePosixPath(page).with_suffix("").as_posix().replace("/", "-")
+        assets = page_assets(page, html) if assets is None else assets
+
+        self._fold([a for a in assets if a["kind"] == "css"], stem, ".css", keep="last")
+        self._fold([a for a in assets if a["kind"] == "js"], stem, ".js", keep="first")
+        self._fold([a for a in assets if a["kind"] == "defer"], f"{stem}-defer", ".js", keep="first")
+
+    def _text(self, asset):
+        return self.read_asset(asset["path"]) if asset["path"] else asset["body"]
+
+    def _foldable(self, asset):
+        """Sheets with @import or @charset only work at the top of their own file, and a script
+        that does not parse must not take the rest of the bundle down with it"""
+        text = self._text(asset)
+        if text is None:
+            return False
+        if asset["kind"] == "css":
+            return re.search(r"@(import|charset)\b", text, re.IGNORECASE) is None
+        return self.script_ok(text)
+
+    def _fold(self, assets, stem, suffix, keep):
+        foldable = [a for a in assets if self._foldable(a)]
+        linked = [a for a in foldable if a["path"]]
+        if not linked:
+            return
+        first, last = linked[0]["start"], linked[-1]["start"]
+        # Inline blocks between the first and last linked file run in between them - fold those too
+        group = [a for a in foldable if a["path"] or first < a["start"] < last]
+        seen = set()
+        kept = []
+        for asset in (group if keep == "first" else reversed(group)):
+            if asset["path"] and asset["path"] in seen:
+                continue
+            seen.add(asset["path"])
+            kept.append(asset)
+        if keep == "last":
+            kept.reverse()
+
+        is_css = suffix == ".css"
+        parts = []
+        for asset in kept:
+            text = self._text(asset)
+            if is_css:
+                text = _rebase_urls(text, posixpath.dirname(asset["path"] or self.page), BUNDLE_DIR)
+                parts.append(f"@media {asset['media']}{{{text}}}" if asset["media"] else text)
+            else:
+                parts.append(minify_js(text))
+        if is_css:
+            # The page's sheets in cascade order - everything a later rule overrides goes
+            cascade = Cascade("\n".join(parts))
+            self.cascade = cascade.stats()
+            css = minify_css(cascade.css())
+            if self.vocabulary is not None:
+                pruned = minify_css(serialize(prune(cascade.nodes, self.vocabulary)))
+                self.pruned = (len(css.encode("utf-8")), len(pruned.encode("utf-8")))
+                css = pruned
+            text = css + "\n"
+        else:
+            text = "\n;".join(parts) + "\n"
+        bundle = _hashed_name(stem, suffix, text)
+        self.bundles[bundle] = text
+        self.sources.extend(sorted({a["path"] for a in kept if a["path"]}))
+
+        href = posixpath.relpath(bundle, posixpath.dirname(self.page) or ".")
+        if is_css:
+            tag = f'<link rel="stylesheet" href="{href}">'
+            if self.critical:
+                fold_bytes, max_bytes = self.critical
+                critical = minify_css(critical_css(text, self.html, fold_bytes))
+                if critical and len(critical.encode("utf-8")) <= max_bytes:
+                    tag = inline_tags(href, critical)
+                    self.inlined = len(critical.encode("utf-8"))
+        else:
+            tag = f'<script src="{href}"{" defer" if group[0]["kind"] == "defer" else ""}></script>'
+        anchor = linked[0] if is_css else linked[-1]
+        for asset in group:
+            if asset is anchor:
+                self.edits.append((asset["start"], asset["end"], tag))
+            else:
+                self.edits.append((*_whole_line(self.html, asset["start"], asset["end"]), ""))
+
+    def rewritten(self):
+        html, last = [], 0
+        for start, end, replacement in sorted(self.edits):
+            if start < last:
+                continue
+            html.append(self.html[last:start])
+            html.append(replacement)
+            last = end
+        html.append(self.html[last:])
+        return "".join(html)
+
+class AppBundle:
+    """Bundle every page of an app directory - the output is a deployable copy of it.
+
+    Pages are rewritten, bundles land in bundles/, every other file is
+    copied as is and sources the bundles fully replaced are left out.
+    """
+
+    def __init__(self, app_dir, prune_css=True, safelist=(), critical=None):
+        self.app_dir = Path(app_dir)
+        self.files = scan_tree(self.app_dir)
+        self._texts = {}
+        self.compression = {}  # encoding -> (raw bytes, compressed bytes), once precompressed
+        pages = sorted(k for k in self.files if PurePosixPath(k).suffix.lower() in PAGE_SUFFIXES)
+        assets = {key: page_assets(key, self.read_text(key)) for key in pages}
+        scripts = [self.read_text(a["path"]) if a["path"] else a["body"]
+                   for tags in assets.values() for a in tags if a["kind"] != "css"]
+        parses = check_scripts(s for s in scripts if s is not None)
+        self.pages = {}
+        for key in pages:
+            with span(f"bundle {key}", phase="bundle", file=key):
+                vocabulary = self.vocabulary(key, assets[key], safelist) if prune_css else None
+                self.pages[key] = PageBundle(key, self.read_text(key), self.read_text, parses.get,
+                                             assets[key], vocabulary, critical)
+
+    def vocabulary(self, key, assets, safelist):
+        """Names the page's markup and every script it loads can produce"""
+        vocabulary = Vocabulary(safelist)
+        vocabulary.add_markup(self.read_text(key))
+        for asset in assets:
+            if asset["kind"] != "css" and asset["path"] and self.read_text(asset["path"]) is not None:
+                vocabulary.add_script(self.read_text(asset["path"]))
+        return vocabulary
+
+    def read_text(self, key):
+        if key not in self._texts:
+            self._texts[key] = ((self.app_dir / key).read_text(encoding="utf-8", errors="replace")
+                                if key in self.files else None)
+        return self._texts[key]
+
+    def outputs(self):
+        """dist-relative path -> bytes for the whole bundled app"""
+        out = {}
+        bundled = set()
+        still_linked = set()
+        for key, page in self.pages.items():
+            html = page.rewritten()
+            out[key] = html.encode("utf-8")
+            for bundle, text in page.bundles.items():
+                out[bundle] = text.encode("utf-8")
+            bundled.update(page.sources)
+            still_linked.update(a["path"] for a in page_assets(key, html) if a["path"])
+        for key in self.files:
+            if key not in out and (key not in bundled or key in still_linked):
+                out[key] = (self.app_dir / key).read_bytes()
+        return out
+
+    def stats(self):
+        """Requests, bytes and CSS declarations for page assets before and after bundling"""
+        before_requests = sum(len(page.sources) for page in self.pages.values())
+        before_bytes = sum(self.files[s].st_size for page in self.pages.values() for s in page.sources)
+        bundles = [text for page in self.pages.values() for text in page.bundles.values()]
+        cascades = [page.cascade for page in self.pages.values() if page.cascade]
+        return {"pages": len(self.pages), "requests_before": before_requests, "requests_after": len(bundles),
+                "bytes_before": before_bytes, "bytes_after": sum(len(t.encode("utf-8")) for t in bundles),
+                "declarations_before": sum(c["declarations_before"] for c in cascades),
+                "declarations_after": sum(c["declarations_after"] for c in cascades),
+                "rules_before": sum(c["rules_before"] for c in cascades),
+                "rules_after": sum(c["rules_after"] for c in cascades),
+                "css_before_prune": sum(page.pruned[0] for page in self.pages.values() if page.pruned),
+                "css_after_prune": sum(page.pruned[1] for page in self.pages.values() if page.pruned),
+                "critical_pages": sum(1 for page in self.pages.values() if page.inlined),
+                "critical_bytes": sum(page.inlined or 0 for page in self.pages.values())}
+
+class BundleError(Exception):
+    pass
+
+def _write_file(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists() or path.read_bytes() != data:
+        write_atomic(path, data)
+
+def asset_settings():
+    from config_cache import load_yaml
+    settings_file = STUDIO_DIR / "settings.yml"
+    settings = load_yaml(settings_file) if settings_file.exists() else {}
+    return {"prune_css": True, "css_safelist": [], "critical_css": True, "critical_fold_bytes": 8000,
+            "critical_max_bytes": 14000, "precompress": True, **settings.get("assets", {})}
+
+def previous_outputs(out_dir, owned=()):
+    """Files the last bundle wrote to out_dir - refuses a directory of someone else's files.
+
+    `owned` vouches for a directory bundled before the bundle manifest
+    existed (a run's build manifest knows what it wrote there).
+    """
+    record = out_dir / BUNDLE_MANIFEST
+    if record.exists():
+        return set(json.loads(record.read_text(encoding="utf-8"))["files"])
+    existing = set(scan_tree(out_dir)) if out_dir.is_dir() else set()
+    if existing - set(owned):
+        raise BundleError(f"{out_dir} holds files no bundle wrote - bundle into an empty directory")
+    return existing
+
+def bundle_app(app_dir, out_dir, write=None, prune_css=None, inline_critical=None, compress=None,
+               remove=None, owned=()):
+    """Write the bundled copy of app_dir to out_dir, removing files a rebuild no longer makes"""
+    out_dir = Path(out_dir)
+    if out_dir.resolve() == Path(app_dir).resolve():
+        raise BundleError(f"{out_dir} is the app itself - bundle it somewhere else")
+    previous = previous_outputs(out_dir, owned)
+    settings = asset_settings()
+    inline_critical = settings["critical_css"] if inline_critical is None else inline_critical
+    critical = (settings["critical_fold_bytes"], settings["critical_max_bytes"]) if inline_critical else None
+    bundle = AppBundle(app_dir, settings["prune_css"] if prune_css is None else prune_css,
+                       settings["css_safelist"], critical)
+    outputs = bundle.outputs()
+    if settings["precompress"] if compress is None else compress:
+        with span("precompress", phase="bundle"):
+            compressed = precompress(outputs)
+        bundle.compression = savings(outputs, compressed)
+        outputs.update(compressed)
+    for key, data in outputs.items():
+        (write or _write_file)(out_dir / key, data)
+    for key in sorted(previous - outputs.keys()):
+        # Bundles whose hash moved on, sources now bundled - only ever our own files
+        (remove or (lambda path: path.unlink(missing_ok=True)))(out_dir / key)
+    _write_file(out_dir / BUNDLE_MANIFEST, json.dumps({"files": sorted(outputs)}, indent=2).encode("utf-8"))
+    return bundle, sorted(outputs)
+
+# Build pipeline contract - paths are relative to the run directory
+READS = [
+    "claim_cipher_app/",
+]
+WRITES = [
+    "claim_cipher_dist/",
+]
+
+def build(run_dir):
+    """Bundle the run's app into claim_cipher_dist"""
+    manifest = manifest_for(run_dir)
+    owned = [key.split("/", 1)[1] for key in manifest.entries if key.startswith(DIST_NAME + "/")]
+    _, created = bundle_app(Path(run_dir) / APP_NAME, Path(run_dir) / DIST_NAME, manifest.write_bytes,
+                            remove=manifest.remove, owned=owned)
+    return created
+
+def print_stats(stats):
+    print(f"📦 {stats['pages']} pages: {stats['requests_before']} stylesheet and script requests → "
+          f"{stats['requests_after']} bundles")
+    print(f"🎨 Cascade: {stats['rules_before']:,} → {stats['rules_after']:,} rules, "
+          f"{stats['declarations_before']:,} → {stats['declarations_after']:,} declarations")
+    if stats["css_before_prune"]:
+        saved = stats["css_before_prune"] - stats["css_after_prune"]
+        print(f"✂️ Unused CSS: {stats['css_before_prune']:,} → {stats['css_after_prune']:,} bytes "
+              f"({saved:,} saved, {saved / stats['css_before_prune']:.0%})")
+    if stats["critical_pages"]:
+        print(f"⚡ Critical CSS inlined on {stats['critical_pages']} of {stats['pages']} pages "
+              f"({stats['critical_bytes']:,} bytes) - their bundles no longer block first paint")
+    print(f"🗜️ {stats['bytes_before']:,} → {stats['bytes_after']:,} bytes minified")
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if len(args) > 1 or any(a in ("-h", "--help") for a in sys.argv[1:]):
+        print("🎤 Usage: python asset_bundler.py [<run_id> | <app_dir>] [--out=<dir>] [--no-prune] [--no-critical] [--no-precompress]")
+        print(f"   A run's {APP_NAME} is bundled into its {DIST_NAME}; an app directory into a sibling {DIST_NAME}")
+        sys.exit(1)
+
+    target = args[0] if args else None
+    if target and Path(target).is_dir() and not (Path(target) / APP_NAME).is_dir():
+        app_dir = Path(target)
+    else:
+        run_dir = resolve_run(target)
+        if not run_dir or not (run_dir / APP_NAME).is_dir():
+            print("❌ No app to bundle - give a run id or an app directory")
+            sys.exit(1)
+        app_dir = run_dir / APP_NAME
+    out_dir = Path(options.get("out") or app_dir.parent / DIST_NAME)
+
+    try:
+        bundle, created = bundle_app(app_dir, out_dir, prune_css=False if "--no-prune" in sys.argv else None,
+                                     inline_critical=False if "--no-critical" in sys.argv else None,
+                                     compress=False if "--no-precompress" in sys.argv else None)
+    except BundleError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"🎤 Bundled {app_dir} → {out_dir} ({len(created)} files)")
+    print_stats(bundle.stats())
+    if bundle.compression:
+        print_savings(bundle.compression)
+    for key, page in bundle.pages.items():
+        for name in page.bundles:
+            print(f"  📄 {key} → {name} ({len(page.bundles[name].encode('utf-8')):,} bytes)")
+        if page.pruned:
+            before, after = page.pruned
+            print(f"     ✂️ unused CSS {before:,} → {after:,} bytes ({before - after:,} saved)")
+        if page.inlined:
+            print(f"     ⚡ {page.inlined:,} bytes of critical CSS inlined")
+
+if __name__ == "__main__":
+    main()
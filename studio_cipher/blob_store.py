@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Blob Store
+Content-addressable storage for runs/ - every identical file is kept once
+"""
+
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+
+from build_manifest import MANIFEST_NAME, BuildManifest, file_hash
+from cipher_runs import list_run_dirs
+from cipher_trace import TRACE_NAME
+from phase_journal import JOURNAL_NAME
+
+BLOBS_DIR_NAME = ".blobs"
+# Appended to or rewritten in place - a link would carry those writes into the shared blob
+MUTABLE_NAMES = {MANIFEST_NAME, JOURNAL_NAME, TRACE_NAME, "status.json"}
+FICLONE = 0x40049409  # linux/fs.h - share extents copy-on-write
+
+def blobs_dir(runs_dir):
+    return Path(runs_dir) / BLOBS_DIR_NAME
+
+def blob_path(runs_dir, digest):
+    return blobs_dir(runs_dir) / digest[:2] / digest[2:]
+
+def reflink(src, dst):
+    """Copy-on-write clone where the filesystem supports it, plain copy otherwise"""
+    try:
+        import fcntl
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(src, dst)
+
+def _replace_with(path, blob, mode):
+    """Swap a run file for a link to its blob without a window where it is missing"""
+    tmp = path.with_name(f".{path.name}.blob.tmp")
+    if mode == "hardlink":
+        os.link(blob, tmp)
+    else:
+        reflink(blob, tmp)
+    os.replace(tmp, path)
+
+def _freeze(path):
+    """Blobs are shared - read-only as a last guard; run writers replace files via write_atomic"""
+    current = path.stat().st_mode
+    path.chmod(current & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+def is_shareable(run_dir, path):
+    """Only files that are replaced whole, never edited in place, may become blobs"""
+    if path.name in MUTABLE_NAMES or path.name.endswith(".tmp"):
+        return False
+    return not any(part.startswith(".") for part in path.relative_to(run_dir).parts)
+
+def _unshare(path):
+    """Give a run file its own inode again - copy, then swap it in"""
+    tmp = path.with_name(f".{path.name}.unshare.tmp")
+    shutil.copy2(path, tmp)
+    tmp.chmod(tmp.stat().st_mode | stat.S_IWUSR)
+    os.replace(tmp, path)
+
+def store_run(run_dir, mode="hardlink"):
+    """Move a run's files into the blob store and link them back into the run tree"""
+    run_dir = Path(run_dir)
+    runs_dir = run_dir.parent
+    manifest = BuildManifest(run_dir) if (run_dir / MANIFEST_NAME).exists() else None
+    refs = set()
+    stats = {"files": 0, "linked": 0, "new_blobs": 0, "bytes_saved": 0}
+
+    for path in sorted(p for p in run_dir.rglob("*") if p.is_file() and not p.is_symlink()):
+        if not is_shareable(run_dir, path):
+            if path.stat().st_nlink > 1 and not path.name.endswith(".tmp"):
+                _unshare(path)  # linked by an older store_run - appends must stop landing in a blob
+            continue
+        stats["files"] += 1
+        info = path.stat()
+
+        entry = manifest.entries.get(path.relative_to(run_dir).as_posix()) if manifest else None
+        if entry and entry.get("bytes") == info.st_size and entry.get("mtime_ns") == info.st_mtime_ns:
+            digest = entry["sha256"]
+        else:
+            digest = file_hash(path)
+        refs.add(digest)
+
+        blob = blob_path(runs_dir, digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            # First copy of these bytes - the run file becomes the blob
+            if mode == "hardlink":
+                os.link(path, blob)
+            else:
+                reflink(path, blob)
+            _freeze(blob)
+            stats["new_blobs"] += 1
+            continue
+
+        if mode == "hardlink" and os.path.samefile(path, blob):
+            continue
+
+        _replace_with(path, blob, mode)
+        stats["linked"] += 1
+        stats["bytes_saved"] += info.st_size
+        if entry:
+            entry["mtime_ns"] = path.stat().st_mtime_ns
+
+    if manifest:
+        manifest.save()
+    write_refs(runs_dir, run_dir.name, refs)
+    return stats
+
+def refs_path(runs_dir, run_id):
+    return blobs_dir(runs_dir) / "refs" / run_id
+
+def write_refs(runs_dir, run_id, refs):
+    path = refs_path(runs_dir, run_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(sorted(refs)) + "\n", encoding="utf-8")
+
+def referenced_digests(runs_dir):
+    """Digests referenced by runs that still exist - refs of deleted runs are dropped"""
+    retained = {d.name for d in list_run_dirs(runs_dir)}
+    referenced = set()
+    refs_dir = blobs_dir(runs_dir) / "refs"
+    if not refs_dir.exists():
+        return referenced
+    for ref in refs_dir.iterdir():
+        if ref.name not in retained:
+            ref.unlink()
+            continue
+        referenced.update(line for line in ref.read_text(encoding="utf-8").split() if line)
+    return referenced
+
+def iter_blobs(runs_dir):
+    root = blobs_dir(runs_dir)
+    if not root.exists():
+        return
+    for prefix in root.iterdir():
+        if prefix.name == "refs" or not prefix.is_dir():
+            continue
+        for blob in prefix.iterdir():
+            yield prefix.name + blob.name, blob
+
+def gc(runs_dir):
+    """Drop blobs that no retained run references"""
+    referenced = referenced_digests(runs_dir)
+    removed, freed = 0, 0
+    for digest, blob in list(iter_blobs(runs_dir)):
+        info = blob.stat()
+        # A hardlink count above one means some run tree still points at it
+        if digest in referenced or info.st_nlink > 1:
+            continue
+        blob.unlink()
+        removed += 1
+        freed += info.st_size
+    for prefix in blobs_dir(runs_dir).iterdir() if blobs_dir(runs_dir).exists() else []:
+        if prefix.is_dir() and prefix.name != "refs" and not any(prefix.iterdir()):
+            prefix.rmdir()
+    return {"removed": removed, "bytes_freed": freed}
+
+def store_stats(runs_dir):
+    blobs = list(iter_blobs(runs_dir))
+    return {
+        "blobs": len(blobs),
+        "bytes": sum(b.stat().st_size for _, b in blobs),
+        "runs": len(list_run_dirs(runs_dir)),
+    }
+
+def main():
+    runs_dir = Path("runs")
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    mode = "reflink" if "--reflink" in sys.argv else "hardlink"
+
+    if not args or args[0] not in ("store", "gc", "stats"):
+        print("🎤 Usage: python blob_store.py store [run_id|--all] [--reflink]")
+        print("         python blob_store.py gc")
+        print("         python blob_store.py stats")
+        sys.exit(1)
+
+    command = args[0]
+    if command == "store":
+        if "--all" in sys.argv:
+            targets = list_run_dirs(runs_dir)
+        elif len(args) > 1:
+            targets = [runs_dir / args[1]]
+        else:
+            targets = list_run_dirs(runs_dir)[-1:]
+        for run_dir in targets:
+            stats = store_run(run_dir, mode)
+            print(f"📦 {run_dir.name}: {stats['files']} files, {stats['new_blobs']} new blobs, "
+                  f"{stats['linked']} deduped ({stats['bytes_saved']:,} bytes saved)")
+    elif command == "gc":
+        result = gc(runs_dir)
+        print(f"🧹 Removed {result['removed']} blobs, freed {result['bytes_freed']:,} bytes")
+    else:
+        stats = store_stats(runs_dir)
+        print(f"📦 {stats['blobs']} blobs, {stats['bytes']:,} bytes across {stats['runs']} runs")
+
+if __name__ == "__main__":
+    main()
@@ -7,538 +7,14 @@ Build all the remaining HTML pages for the full application
 import json
 from pathlib import Path
 from datetime import datetime
-
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
-
-def build_all_pages(run_dir):
-    """Build all the remaining HTML pages"""
-    created = []
-    app_dir = run_dir / "claim_cipher_app"
-    
-    # 1. Mileage Cypher Page
-    mileage_cypher = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Mileage Cypher - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-    <link rel="stylesheet" href="styles/mileage-cypher.css">
-</head>
-<body class="cipher-dark-theme">
-    <!-- Sidebar Cypher -->
-    <nav class="cipher-sidebar" id="cipher-sidebar">
-        <div class="sidebar-cipher-header">
-            <div class="sidebar-cipher-logo">
-                <a href="./command-center.html">🎤 Claim Cipher</a>
-            </div>
-        </div>
-        
-        <ul class="sidebar-cipher-nav">
-            <li class="sidebar-cipher-nav-item">
-                <a href="./command-center.html" class="sidebar-cipher-nav-link">
-                    <span>📊</span> Command Center
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./mileage-cypher.html" class="sidebar-cipher-nav-link sidebar-cipher-nav-link--active">
-                    <span>🚗</span> Mileage Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./route-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🗺️</span> Route Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./jobs-studio.html" class="sidebar-cipher-nav-link">
-                    <span>📱</span> Jobs Studio
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./firms-directory.html" class="sidebar-cipher-nav-link">
-                    <span>🏢</span> Firms Directory
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./settings-booth.html" class="sidebar-cipher-nav-link">
-                    <span>⚙️</span> Settings Booth
-                </a>
-            </li>
-        </ul>
-        
-        <!-- User info -->
-        <div class="sidebar-cipher-footer">
-            <div class="sidebar-cipher-user" id="sidebar-user">
-                <div class="user-cipher-avatar" id="user-avatar">DU</div>
-                <div class="user-cipher-info">
-                    <div class="user-cipher-name" id="user-name">Demo User</div>
-                    <div class="user-cipher-role" id="user-role">Demo Mode</div>
-                </div>
-            </div>
-            <button class="sidebar-cipher-logout cipher-btn cipher-btn--ghost cipher-btn--sm" id="logout-btn">
-                <span>🚪</span> Sign Out
-            </button>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <main class="main-cipher-content">
-        <div class="page-cipher-header">
-            <h1 class="page-cipher-title">🚗 Mileage Cypher</h1>
-            <p class="page-cipher-subtitle">Calculate reimbursement with multi-firm rates - No Matter What</p>
-        </div>
-
-        <!-- Mileage Calculator -->
-        <div class="cipher-card">
-            <div class="cipher-card-header">
-                <h3 class="cipher-card-title">📏 Trip Calculator</h3>
-                <button class="cipher-btn cipher-btn--primary cipher-btn--sm" id="add-trip-btn">
-                    ➕ Add Trip
-                </button>
-            </div>
-            <div class="cipher-card-content">
-                <div class="mileage-cipher-table">
-                    <div class="table-cipher-header">
-                        <span>From</span>
-                        <span>To</span>
-                        <span>Miles</span>
-                        <span>Firm</span>
-                        <span>Amount</span>
-                        <span>Actions</span>
-                    </div>
-                    
-                    <div id="trips-cipher-container">
-                        <!-- Trips will be added here dynamically -->
-                    </div>
-                </div>
-                
-                <div class="mileage-cipher-total">
-                    <h3>💰 Total Reimbursement: <span id="total-amount">$0.00</span></h3>
-                </div>
-            </div>
-        </div>
-
-        <!-- Firm Rates -->
-        <div class="cipher-card">
-            <div class="cipher-card-header">
-                <h3 class="cipher-card-title">🏢 Firm Rates</h3>
-            </div>
-            <div class="cipher-card-content">
-                <div class="firm-rates-cipher-grid">
-                    <div class="firm-cipher-rate-card">
-                        <h4>State Farm</h4>
-                        <div class="rate-cipher-amount">$0.58/mile</div>
-                    </div>
-                    <div class="firm-cipher-rate-card">
-                        <h4>Allstate</h4>
-                        <div class="rate-cipher-amount">$0.62/mile</div>
-                    </div>
-                    <div class="firm-cipher-rate-card">
-                        <h4>Progressive</h4>
-                        <div class="rate-cipher-amount">$0.55/mile</div>
-                    </div>
-                    <div class="firm-cipher-rate-card">
-                        <h4>Geico</h4>
-                        <div class="rate-cipher-amount">$0.56/mile</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <script src="scripts/cipher-core.js"></script>
-    <script src="scripts/mileage-cypher.js"></script>
-    <script>
-        // Authentication check
-        if (localStorage.getItem('cipher_authenticated') !== 'true') {
-            window.location.href = './login-cypher.html';
-        }
-
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeCipherUserContext();
-            setupCipherLogoutHandler();
-            initializeMileageCypher();
-        });
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "mileage-cypher.html").write_text(mileage_cypher, encoding="utf-8")
-    created.append("mileage-cypher.html")
-
-    # 2. Route Cypher Page
-    route_cypher = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Route Cypher - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-    <link rel="stylesheet" href="styles/route-cypher.css">
-</head>
-<body class="cipher-dark-theme">
-    <!-- Sidebar Cypher -->
-    <nav class="cipher-sidebar" id="cipher-sidebar">
-        <div class="sidebar-cipher-header">
-            <div class="sidebar-cipher-logo">
-                <a href="./command-center.html">🎤 Claim Cipher</a>
-            </div>
-        </div>
-        
-        <ul class="sidebar-cipher-nav">
-            <li class="sidebar-cipher-nav-item">
-                <a href="./command-center.html" class="sidebar-cipher-nav-link">
-                    <span>📊</span> Command Center
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./mileage-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🚗</span> Mileage Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./route-cypher.html" class="sidebar-cipher-nav-link sidebar-cipher-nav-link--active">
-                    <span>🗺️</span> Route Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./jobs-studio.html" class="sidebar-cipher-nav-link">
-                    <span>📱</span> Jobs Studio
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./firms-directory.html" class="sidebar-cipher-nav-link">
-                    <span>🏢</span> Firms Directory
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./settings-booth.html" class="sidebar-cipher-nav-link">
-                    <span>⚙️</span> Settings Booth
-                </a>
-            </li>
-        </ul>
-        
-        <div class="sidebar-cipher-footer">
-            <div class="sidebar-cipher-user" id="sidebar-user">
-                <div class="user-cipher-avatar" id="user-avatar">DU</div>
-                <div class="user-cipher-info">
-                    <div class="user-cipher-name" id="user-name">Demo User</div>
-                    <div class="user-cipher-role" id="user-role">Demo Mode</div>
-                </div>
-            </div>
-            <button class="sidebar-cipher-logout cipher-btn cipher-btn--ghost cipher-btn--sm" id="logout-btn">
-                <span>🚪</span> Sign Out
-            </button>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <main class="main-cipher-content">
-        <div class="page-cipher-header">
-            <h1 class="page-cipher-title">🗺️ Route Cypher</h1>
-            <p class="page-cipher-subtitle">Optimize your routes with Google Maps integration</p>
-        </div>
-
-        <!-- Route Optimizer -->
-        <div class="cipher-grid cipher-grid--2">
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">📍 Job Selection</h3>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="job-cipher-selection" id="job-selection">
-                        <div class="job-cipher-item">
-                            <label class="cipher-checkbox">
-                                <input type="checkbox" data-job-id="1" data-address="123 Main St, Atlanta, GA">
-                                <span class="checkmark"></span>
-                                <div class="job-cipher-info">
-                                    <h4>CLM-2024-001</h4>
-                                    <p>123 Main St, Atlanta, GA</p>
-                                </div>
-                            </label>
-                        </div>
-                        <div class="job-cipher-item">
-                            <label class="cipher-checkbox">
-                                <input type="checkbox" data-job-id="2" data-address="456 Oak Ave, Decatur, GA">
-                                <span class="checkmark"></span>
-                                <div class="job-cipher-info">
-                                    <h4>CLM-2024-002</h4>
-                                    <p>456 Oak Ave, Decatur, GA</p>
-                                </div>
-                            </label>
-                        </div>
-                        <div class="job-cipher-item">
-                            <label class="cipher-checkbox">
-                                <input type="checkbox" data-job-id="3" data-address="789 Pine Rd, Marietta, GA">
-                                <span class="checkmark"></span>
-                                <div class="job-cipher-info">
-                                    <h4>CLM-2024-003</h4>
-                                    <p>789 Pine Rd, Marietta, GA</p>
-                                </div>
-                            </label>
-                        </div>
-                    </div>
-                    
-                    <button class="cipher-btn cipher-btn--primary cipher-btn--full" id="optimize-route-btn" disabled>
-                        ⚡ Optimize Route
-                    </button>
-                </div>
-            </div>
-
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">📊 Route Results</h3>
-                </div>
-                <div class="cipher-card-content">
-                    <div id="route-cipher-results" style="display: none;">
-                        <div class="route-cipher-stats">
-                            <div class="route-cipher-stat">
-                                <div class="stat-cipher-value" id="total-distance">0 miles</div>
-                                <div class="stat-cipher-label">Total Distance</div>
-                            </div>
-                            <div class="route-cipher-stat">
-                                <div class="stat-cipher-value" id="total-time">0 hours</div>
-                                <div class="stat-cipher-label">Total Time</div>
-                            </div>
-                            <div class="route-cipher-stat">
-                                <div class="stat-cipher-value" id="total-stops">0 stops</div>
-                                <div class="stat-cipher-label">Total Stops</div>
-                            </div>
-                        </div>
-                        
-                        <div class="route-cipher-list" id="optimized-route-list">
-                            <!-- Optimized route will be shown here -->
-                        </div>
-                    </div>
-                    
-                    <div id="route-cipher-placeholder" class="route-cipher-placeholder">
-                        <div class="placeholder-cipher-icon">🗺️</div>
-                        <p>Select jobs and optimize your route to see results</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <script src="scripts/cipher-core.js"></script>
-    <script src="scripts/route-cypher.js"></script>
-    <script>
-        if (localStorage.getItem('cipher_authenticated') !== 'true') {
-            window.location.href = './login-cypher.html';
-        }
-
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeCipherUserContext();
-            setupCipherLogoutHandler();
-            initializeRouteCypher();
-        });
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "route-cypher.html").write_text(route_cypher, encoding="utf-8")
-    created.append("route-cypher.html")
-
-    # 3. Jobs Studio Page
-    jobs_studio = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Jobs Studio - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-    <link rel="stylesheet" href="styles/jobs-studio.css">
-</head>
-<body class="cipher-dark-theme">
-    <!-- Sidebar Cypher -->
-    <nav class="cipher-sidebar" id="cipher-sidebar">
-        <div class="sidebar-cipher-header">
-            <div class="sidebar-cipher-logo">
-                <a href="./command-center.html">🎤 Claim Cipher</a>
-            </div>
-        </div>
-        
-        <ul class="sidebar-cipher-nav">
-            <li class="sidebar-cipher-nav-item">
-                <a href="./command-center.html" class="sidebar-cipher-nav-link">
-                    <span>📊</span> Command Center
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./mileage-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🚗</span> Mileage Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./route-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🗺️</span> Route Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./jobs-studio.html" class="sidebar-cipher-nav-link sidebar-cipher-nav-link--active">
-                    <span>📱</span> Jobs Studio
-                    <span class="cipher-badge cipher-badge--pro">PRO</span>
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./firms-directory.html" class="sidebar-cipher-nav-link">
-                    <span>🏢</span> Firms Directory
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./settings-booth.html" class="sidebar-cipher-nav-link">
-                    <span>⚙️</span> Settings Booth
-                </a>
-            </li>
-        </ul>
-        
-        <div class="sidebar-cipher-footer">
-            <div class="sidebar-cipher-user" id="sidebar-user">
-                <div class="user-cipher-avatar" id="user-avatar">DU</div>
-                <div class="user-cipher-info">
-                    <div class="user-cipher-name" id="user-name">Demo User</div>
-                    <div class="user-cipher-role" id="user-role">Demo Mode</div>
-                </div>
-            </div>
-            <button class="sidebar-cipher-logout cipher-btn cipher-btn--ghost cipher-btn--sm" id="logout-btn">
-                <span>🚪</span> Sign Out
-            </button>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <main class="main-cipher-content">
-        <div class="page-cipher-header">
-            <h1 class="page-cipher-title">📱 Jobs Studio</h1>
-            <p class="page-cipher-subtitle">Manage field inspections and sync photos from mobile devices</p>
-            <span class="cipher-badge cipher-badge--pro">PRO FEATURE</span>
-        </div>
-
-        <!-- Statistics Cards -->
-        <div class="cipher-grid cipher-grid--4 mb-4">
-            <div class="cipher-card">
-                <div class="cipher-card-content">
-                    <div class="cipher-kpi">
-                        <div class="cipher-kpi-value">3</div>
-                        <div class="cipher-kpi-label">Active Jobs</div>
-                    </div>
-                </div>
-            </div>
-            <div class="cipher-card">
-                <div class="cipher-card-content">
-                    <div class="cipher-kpi">
-                        <div class="cipher-kpi-value">12</div>
-                        <div class="cipher-kpi-label">Photos Synced</div>
-                    </div>
-                </div>
-            </div>
-            <div class="cipher-card">
-                <div class="cipher-card-content">
-                    <div class="cipher-kpi">
-                        <div class="cipher-kpi-value">8</div>
-                        <div class="cipher-kpi-label">Completed Today</div>
-                    </div>
-                </div>
-            </div>
-            <div class="cipher-card">
-                <div class="cipher-card-content">
-                    <div class="cipher-kpi">
-                        <div class="cipher-kpi-value">97%</div>
-                        <div class="cipher-kpi-label">Sync Success</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Jobs Management -->
-        <div class="cipher-card">
-            <div class="cipher-card-header">
-                <h3 class="cipher-card-title">🎵 Job Management</h3>
-                <div class="jobs-cipher-actions">
-                    <button class="cipher-btn cipher-btn--outline cipher-btn--sm" id="filter-jobs-btn">
-                        🔍 Filter
-                    </button>
-                    <button class="cipher-btn cipher-btn--primary cipher-btn--sm" id="new-job-btn">
-                        ➕ New Job
-                    </button>
-                </div>
-            </div>
-            <div class="cipher-card-content">
-                <div class="jobs-cipher-filters mb-4">
-                    <button class="cipher-btn cipher-btn--outline filter-cipher-btn active" data-filter="all">All</button>
-                    <button class="cipher-btn cipher-btn--outline filter-cipher-btn" data-filter="scheduled">Scheduled</button>
-                    <button class="cipher-btn cipher-btn--outline filter-cipher-btn" data-filter="in-progress">In Progress</button>
-                    <button class="cipher-btn cipher-btn--outline filter-cipher-btn" data-filter="completed">Completed</button>
-                </div>
-
-                <div class="jobs-cipher-list" id="jobs-list">
-                    <div class="job-cipher-card" data-status="scheduled">
-                        <div class="job-cipher-header">
-                            <h4>CLM-2024-001</h4>
-                            <span class="cipher-badge cipher-badge--warning">Scheduled</span>
-                        </div>
-                        <div class="job-cipher-details">
-                            <p><strong>Insured:</strong> John Smith</p>
-                            <p><strong>Address:</strong> 123 Main St, Atlanta, GA</p>
-                            <p><strong>Priority:</strong> High</p>
-                        </div>
-                        <div class="job-cipher-actions">
-                            <button class="cipher-btn cipher-btn--outline cipher-btn--sm">📝 Edit</button>
-                            <button class="cipher-btn cipher-btn--primary cipher-btn--sm">🎤 Start</button>
-                        </div>
-                    </div>
-
-                    <div class="job-cipher-card" data-status="in-progress">
-                        <div class="job-cipher-header">
-                            <h4>CLM-2024-002</h4>
-                            <span class="cipher-badge cipher-badge--info">In Progress</span>
-                        </div>
-                        <div class="job-cipher-details">
-                            <p><strong>Insured:</strong> Jane Doe</p>
-                            <p><strong>Address:</strong> 456 Oak Ave, Decatur, GA</p>
-                            <p><strong>Priority:</strong> Medium</p>
-                        </div>
-                        <div class="job-cipher-actions">
-                            <button class="cipher-btn cipher-btn--outline cipher-btn--sm">📱 View Photos</button>
-                            <button class="cipher-btn cipher-btn--success cipher-btn--sm">✅ Complete</button>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <script src="scripts/cipher-core.js"></script>
-    <script src="scripts/jobs-studio.js"></script>
-    <script>
-        if (localStorage.getItem('cipher_authenticated') !== 'true') {
-            window.location.href = './login-cypher.html';
-        }
-
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeCipherUserContext();
-            setupCipherLogoutHandler();
-            initializeJobsStudio();
-        });
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "jobs-studio.html").write_text(jobs_studio, encoding="utf-8")
-    created.append("jobs-studio.html")
-
-    # 4. Add more CSS and JavaScript files
-    styles_dir = app_dir / "styles"
-    scripts_dir = app_dir / "scripts"
-
-    # Additional CSS for sidebar navigation
-    sidebar_css = """/* 🎤 Cipher Sidebar Styles */
+from cipher_runs import get_latest_run
+from build_manifest import finish_build
+from cipher_trace import traced
+from render_pool import RenderJob, render_all, write_all
+
+def sidebar_css():
+    """Styles for the sidebar navigation every app page shares"""
+    return """/* 🎤 Cipher Sidebar Styles */
 .cipher-sidebar {
   position: fixed;
   left: 0;
@@ -753,12 +229,10 @@ def build_all_pages(run_dir):
     font-size: 2rem;
   }
 }"""
-    
-    (styles_dir / "sidebar-cipher.css").write_text(sidebar_css, encoding="utf-8")
-    created.append("styles/sidebar-cipher.css")
 
-    # Core JavaScript functions
-    cipher_core_js = """// 🎤 Cipher Core JavaScript Functions
+def cipher_core_js():
+    """Core JavaScript functions every app page loads"""
+    return """// 🎤 Cipher Core JavaScript Functions
 // Shared utilities for the hip-hop professional cipher experience
 
 // Initialize cipher user context across all pages
@@ -957,10 +431,38 @@ window.formatCipherTime = formatCipherTime;
 window.generateCipherDemoData = generateCipherDemoData;
 
 console.log('🎤 Cipher Core JavaScript loaded - No Matter What!');"""
-    
-    (scripts_dir / "cipher-core.js").write_text(cipher_core_js, encoding="utf-8")
-    created.append("scripts/cipher-core.js")
 
+# Every file this builder makes, relative to the app - rendered side by side, written in this order
+JOBS = [
+    RenderJob("mileage-cypher.html", "page_fixes", "finished_page", "mileage-cypher.html"),
+    RenderJob("route-cypher.html", "page_fixes", "finished_page", "route-cypher.html"),
+    RenderJob("jobs-studio.html", "page_fixes", "finished_page", "jobs-studio.html"),
+    RenderJob("styles/sidebar-cipher.css", __file__, "sidebar_css"),
+    RenderJob("scripts/cipher-core.js", __file__, "cipher_core_js"),
+]
+
+@traced(phase="build")
+def build_all_pages(run_dir):
+    """Build all the remaining HTML pages"""
+    return write_all(run_dir, run_dir / "claim_cipher_app", render_all(JOBS))
+
+# Build pipeline contract - paths are relative to the run directory
+READS = [
+    "claim_cipher_app/styles/",
+    "claim_cipher_app/scripts/",
+]
+WRITES = [
+    "claim_cipher_app/mileage-cypher.html",
+    "claim_cipher_app/route-cypher.html",
+    "claim_cipher_app/jobs-studio.html",
+    "claim_cipher_app/styles/sidebar-cipher.css",
+    "claim_cipher_app/scripts/cipher-core.js",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created += build_all_pages(run_dir)
     return created
 
 def main():
@@ -972,6 +474,7 @@ def main():
     print("🎵 Building all remaining HTML pages...")
     
     created = build_all_pages(latest_run)
+    finish_build(latest_run)
     
     print(f"\n✅ Created {len(created)} additional files:")
     for item in created:
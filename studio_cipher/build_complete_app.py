@@ -7,21 +7,11 @@ Build the entire Claim Cipher application with all components
 import json
 from pathlib import Path
 from datetime import datetime
+from cipher_runs import get_latest_run
+from build_manifest import finish_build, write_artifact
+from cipher_trace import traced
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    if not runs_dir.exists():
-        return None
-    
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    if not run_dirs:
-        return None
-        
-    # Sort by name (timestamp format makes this work)
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
-
+@traced(phase="build")
 def build_frontend_components(run_dir):
     """Build all missing frontend components"""
     created = []
@@ -109,7 +99,7 @@ export default JobsStudio;"""
     
     jobs_dir = src_dir / "components" / "jobs"
     jobs_dir.mkdir(parents=True, exist_ok=True)
-    (jobs_dir / "JobsStudio.jsx").write_text(jobs_code, encoding="utf-8")
+    write_artifact(run_dir, jobs_dir / "JobsStudio.jsx", jobs_code)
     created.append("JobsStudio.jsx")
 
     # 2. Route Optimizer Component
@@ -174,7 +164,7 @@ export default RouteOptimizer;"""
     
     routes_dir = src_dir / "components" / "routes"
     routes_dir.mkdir(parents=True, exist_ok=True)
-    (routes_dir / "RouteOptimizer.jsx").write_text(route_code, encoding="utf-8")
+    write_artifact(run_dir, routes_dir / "RouteOptimizer.jsx", route_code)
     created.append("RouteOptimizer.jsx")
 
     # 3. Mileage Calculator Component
@@ -282,7 +272,7 @@ export default MileageCalculator;"""
     
     mileage_dir = src_dir / "components" / "mileage"
     mileage_dir.mkdir(parents=True, exist_ok=True)
-    (mileage_dir / "MileageCalculator.jsx").write_text(mileage_code, encoding="utf-8")
+    write_artifact(run_dir, mileage_dir / "MileageCalculator.jsx", mileage_code)
     created.append("MileageCalculator.jsx")
 
     # 4. Settings Panel Component
@@ -394,7 +384,7 @@ export default SettingsPanel;"""
     
     settings_dir = src_dir / "components" / "settings"
     settings_dir.mkdir(parents=True, exist_ok=True)
-    (settings_dir / "SettingsPanel.jsx").write_text(settings_code, encoding="utf-8")
+    write_artifact(run_dir, settings_dir / "SettingsPanel.jsx", settings_code)
     created.append("SettingsPanel.jsx")
 
     # 5. Global CSS Styles
@@ -510,11 +500,12 @@ html, body {
     
     styles_dir = src_dir / "styles"
     styles_dir.mkdir(parents=True, exist_ok=True)
-    (styles_dir / "globals.css").write_text(global_css, encoding="utf-8")
+    write_artifact(run_dir, styles_dir / "globals.css", global_css)
     created.append("globals.css")
 
     return created
 
+@traced(phase="build")
 def build_backend_apis(run_dir):
     """Build all missing backend API routes"""
     created = []
@@ -590,7 +581,7 @@ router.post('/directions', routeLimiter, async (req, res) => {
 
 module.exports = router;"""
     
-    (backend_dir / "route-optimizer.js").write_text(route_api, encoding="utf-8")
+    write_artifact(run_dir, backend_dir / "route-optimizer.js", route_api)
     created.append("route-optimizer.js")
 
     # 2. Mileage Calculator API
@@ -680,7 +671,7 @@ router.get('/report', async (req, res) => {
 
 module.exports = router;"""
     
-    (backend_dir / "mileage-calculator.js").write_text(mileage_api, encoding="utf-8")
+    write_artifact(run_dir, backend_dir / "mileage-calculator.js", mileage_api)
     created.append("mileage-calculator.js")
 
     # 3. Settings Handler API
@@ -775,7 +766,7 @@ router.put('/password', settingsLimiter, async (req, res) => {
 
 module.exports = router;"""
     
-    (backend_dir / "settings-handler.js").write_text(settings_api, encoding="utf-8")
+    write_artifact(run_dir, backend_dir / "settings-handler.js", settings_api)
     created.append("settings-handler.js")
 
     # 4. Database Models/Repositories
@@ -926,11 +917,12 @@ module.exports = {
     
     models_dir = run_dir / "backend" / "server" / "models"
     models_dir.mkdir(parents=True, exist_ok=True)
-    (models_dir / "repositories.js").write_text(models_code, encoding="utf-8")
+    write_artifact(run_dir, models_dir / "repositories.js", models_code)
     created.append("repositories.js")
 
     return created
 
+@traced(phase="build")
 def build_security_docs(run_dir):
     """Build security documentation"""
     created = []
@@ -992,7 +984,7 @@ def build_security_docs(run_dir):
 **Next Review**: Weekly security standup
 **Owner**: Security Guard Agent"""
     
-    (security_dir / "security-checklist.md").write_text(checklist, encoding="utf-8")
+    write_artifact(run_dir, security_dir / "security-checklist.md", checklist)
     created.append("security-checklist.md")
 
     # 2. Compliance Report
@@ -1088,11 +1080,12 @@ Note: If platform expands to include medical insurance claims with PHI, HIPAA co
 **Compliance Officer**: Security Guard Agent
 """
     
-    (security_dir / "compliance-report.md").write_text(compliance, encoding="utf-8")
+    write_artifact(run_dir, security_dir / "compliance-report.md", compliance)
     created.append("compliance-report.md")
 
     return created
 
+@traced(phase="build")
 def build_documentation(run_dir):
     """Build comprehensive documentation"""
     created = []
@@ -1257,7 +1250,7 @@ Track your performance with:
     
     docs_dir = run_dir / "docs" / "user-guide"
     docs_dir.mkdir(parents=True, exist_ok=True)
-    (docs_dir / "adjuster-workflows.md").write_text(user_guide, encoding="utf-8")
+    write_artifact(run_dir, docs_dir / "adjuster-workflows.md", user_guide)
     created.append("adjuster-workflows.md")
 
     # 2. Production Deployment Guide
@@ -1602,11 +1595,38 @@ Your Claim Cipher platform is now live and ready to serve insurance adjusters wo
     
     deployment_dir = run_dir / "docs" / "deployment"
     deployment_dir.mkdir(parents=True, exist_ok=True)
-    (deployment_dir / "production-guide.md").write_text(deployment_guide, encoding="utf-8")
+    write_artifact(run_dir, deployment_dir / "production-guide.md", deployment_guide)
     created.append("production-guide.md")
 
     return created
 
+# Build pipeline contract - paths are relative to the run directory
+READS = []
+WRITES = [
+    "frontend/src/components/jobs/JobsStudio.jsx",
+    "frontend/src/components/routes/RouteOptimizer.jsx",
+    "frontend/src/components/mileage/MileageCalculator.jsx",
+    "frontend/src/components/settings/SettingsPanel.jsx",
+    "frontend/src/styles/globals.css",
+    "backend/server/routes/route-optimizer.js",
+    "backend/server/routes/mileage-calculator.js",
+    "backend/server/routes/settings-handler.js",
+    "backend/server/models/repositories.js",
+    "security/docs/security/security-checklist.md",
+    "security/docs/security/compliance-report.md",
+    "docs/user-guide/adjuster-workflows.md",
+    "docs/deployment/production-guide.md",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created += build_frontend_components(run_dir)
+    created += build_backend_apis(run_dir)
+    created += build_security_docs(run_dir)
+    created += build_documentation(run_dir)
+    return created
+
 def main():
     print("🎤🔥 BUILDING THE COMPLETE CLAIM CIPHER APPLICATION 🔥🎤")
     print("=" * 60)
@@ -1649,6 +1669,8 @@ def main():
     for item in docs_created:
         print(f"  ✅ {item}")
     
+    finish_build(latest_run)
+    
     print(f"\n🎯 MISSION COMPLETE! Created {len(all_created)} deliverables:")
     print("=" * 60)
     
@@ -7,14 +7,12 @@ Build the full Claim Cipher app with hip-hop naming like the CS1 repo
 import json
 from pathlib import Path
 from datetime import datetime
+from cipher_runs import get_latest_run
+from build_manifest import finish_build, write_artifact
+from cipher_trace import traced
+from page_fixes import finished_page
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
-
+@traced(phase="build")
 def create_complete_html_app(run_dir):
     """Build the complete HTML application with hip-hop naming"""
     created = []
@@ -24,449 +22,15 @@ def create_complete_html_app(run_dir):
     app_dir.mkdir(exist_ok=True)
     
     # 1. Main index.html (loading page)
-    index_html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Claim Cipher - Loading...</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-</head>
-<body class="cipher-dark-theme">
-    <div class="loading-stage">
-        <div class="cipher-logo">🎤 Claim Cipher</div>
-        <div class="loading-text">Checking authentication...</div>
-        <div class="cipher-spinner"></div>
-    </div>
-    
-    <script>
-        // 🎤 Studio Cipher - Always redirect to login cypher
-        (function() {
-            console.log('🔐 Index.html: Redirecting to login cypher...');
-            window.location.href = './login-cypher.html';
-        })();
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "index.html").write_text(index_html, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "index.html", finished_page("index.html"))
     created.append("index.html")
     
     # 2. Login Cypher Page (main authentication)
-    login_cypher = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Login Cypher - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-    <link rel="stylesheet" href="styles/login-cypher.css">
-</head>
-<body class="cipher-dark-theme">
-    <div class="login-cypher-container">
-        <div class="login-cipher-card">
-            <div class="cipher-logo">🎤 Claim Cipher</div>
-            <div class="cipher-subtitle">No Matter What</div>
-            
-            <div id="error-cypher" class="error-cypher"></div>
-            
-            <!-- Login/Signup Toggle -->
-            <div class="auth-cipher-toggle">
-                <button class="toggle-cipher active" id="login-toggle">Drop In</button>
-                <button class="toggle-cipher" id="signup-toggle">Sign Up</button>
-            </div>
-            
-            <!-- Login Cypher Form -->
-            <form id="login-cypher-form">
-                <div class="form-cipher-group">
-                    <label class="form-cipher-label" for="login-email">Email</label>
-                    <input type="email" class="form-cipher-input" id="login-email" required autocomplete="username">
-                </div>
-                
-                <div class="form-cipher-group">
-                    <label class="form-cipher-label" for="login-password">Password</label>
-                    <div class="password-cipher-group">
-                        <input type="password" class="form-cipher-input" id="login-password" required autocomplete="current-password">
-                        <button type="button" class="password-cipher-toggle" id="password-toggle" aria-label="Toggle password visibility">
-                            👁️
-                        </button>
-                    </div>
-                </div>
-                
-                <div class="form-cipher-group">
-                    <label class="form-cipher-checkbox">
-                        <input type="checkbox" id="remember-cipher" name="remember">
-                        <span class="checkmark"></span>
-                        Remember me
-                    </label>
-                </div>
-                
-                <button type="submit" class="cipher-btn cipher-btn--primary cipher-btn--full" id="login-btn">
-                    <span class="btn-text">🎤 Drop In</span>
-                    <div class="loading-cipher-state" id="login-loading-state">
-                        <div class="cipher-spinner"></div>
-                        <span>Dropping in...</span>
-                    </div>
-                </button>
-                
-                <button type="button" class="cipher-link" id="forgot-password-link">
-                    Forgot your cipher?
-                </button>
-            </form>
-            
-            <!-- Signup Cypher Form (hidden by default) -->
-            <form id="signup-cypher-form" style="display: none;">
-                <div class="form-cipher-row">
-                    <div class="form-cipher-group">
-                        <label class="form-cipher-label" for="signup-name">Name</label>
-                        <input type="text" class="form-cipher-input" id="signup-name" required>
-                    </div>
-                    <div class="form-cipher-group">
-                        <label class="form-cipher-label" for="signup-company">Company</label>
-                        <input type="text" class="form-cipher-input" id="signup-company">
-                    </div>
-                </div>
-                
-                <div class="form-cipher-group">
-                    <label class="form-cipher-label" for="signup-email">Email</label>
-                    <input type="email" class="form-cipher-input" id="signup-email" required>
-                </div>
-                
-                <div class="form-cipher-group">
-                    <label class="form-cipher-label" for="signup-password">Password</label>
-                    <div class="password-cipher-group">
-                        <input type="password" class="form-cipher-input" id="signup-password" required>
-                        <button type="button" class="password-cipher-toggle" id="signup-password-toggle" aria-label="Toggle password visibility">
-                            👁️
-                        </button>
-                    </div>
-                </div>
-                
-                <div class="form-cipher-group">
-                    <label class="form-cipher-checkbox">
-                        <input type="checkbox" id="agree-terms" required>
-                        <span class="checkmark"></span>
-                        I agree to the <a href="#" class="cipher-link">Terms of Service</a> and <a href="#" class="cipher-link">Privacy Policy</a>
-                    </label>
-                </div>
-                
-                <button type="submit" class="cipher-btn cipher-btn--primary cipher-btn--full" id="signup-btn">
-                    <span class="btn-text">🎵 Join the Crew</span>
-                    <div class="loading-cipher-state" id="signup-loading-state">
-                        <div class="cipher-spinner"></div>
-                        <span>Creating account...</span>
-                    </div>
-                </button>
-            </form>
-            
-            <div class="cipher-divider">
-                <span>or</span>
-            </div>
-            
-            <!-- Demo Cypher Section -->
-            <div class="demo-cipher-section">
-                <div class="demo-cipher-title">🎯 Try Demo Mode</div>
-                <div class="demo-cipher-description">
-                    Experience Claim Cipher with sample data - No Matter What
-                </div>
-                <button id="demo-cipher-btn" class="cipher-btn cipher-btn--secondary cipher-btn--full">
-                    🎤 Start Demo (7 days free)
-                </button>
-            </div>
-        </div>
-    </div>
-
-    <script src="scripts/login-cypher.js"></script>
-</body>
-</html>"""
-    
-    (app_dir / "login-cypher.html").write_text(login_cypher, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "login-cypher.html", finished_page("login-cypher.html"))
     created.append("login-cypher.html")
     
     # 3. Command Center (Main Dashboard)
-    command_center = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Command Center - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-    <link rel="stylesheet" href="styles/command-center.css">
-</head>
-<body class="cipher-dark-theme">
-    <!-- Sidebar Cypher -->
-    <nav class="cipher-sidebar" id="cipher-sidebar">
-        <div class="sidebar-cipher-header">
-            <div class="sidebar-cipher-logo">
-                <a href="./command-center.html">🎤 Claim Cipher</a>
-            </div>
-        </div>
-        
-        <ul class="sidebar-cipher-nav">
-            <li class="sidebar-cipher-nav-item">
-                <a href="./command-center.html" class="sidebar-cipher-nav-link sidebar-cipher-nav-link--active">
-                    <span>📊</span> Command Center
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./mileage-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🚗</span> Mileage Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./route-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🗺️</span> Route Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./jobs-studio.html" class="sidebar-cipher-nav-link">
-                    <span>📱</span> Jobs Studio
-                    <span class="cipher-badge cipher-badge--pro">PRO</span>
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./firms-directory.html" class="sidebar-cipher-nav-link">
-                    <span>🏢</span> Firms Directory
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./settings-booth.html" class="sidebar-cipher-nav-link">
-                    <span>⚙️</span> Settings Booth
-                </a>
-            </li>
-        </ul>
-        
-        <!-- User Cipher Info -->
-        <div class="sidebar-cipher-footer">
-            <div class="sidebar-cipher-user" id="sidebar-user">
-                <div class="user-cipher-avatar" id="user-avatar">DU</div>
-                <div class="user-cipher-info">
-                    <div class="user-cipher-name" id="user-name">Demo User</div>
-                    <div class="user-cipher-role" id="user-role">Demo Mode</div>
-                </div>
-            </div>
-            <button class="sidebar-cipher-logout cipher-btn cipher-btn--ghost cipher-btn--sm" id="logout-btn">
-                <span>🚪</span> Sign Out
-            </button>
-        </div>
-    </nav>
-
-    <!-- Main Command Center -->
-    <main class="main-cipher-content">
-        <!-- Demo Notice (only for demo users) -->
-        <div class="demo-cipher-notice" id="demo-notice" data-demo-only="true" style="display: none;">
-            <div class="demo-cipher-notice-content">
-                <span class="demo-cipher-notice-icon">👀</span>
-                <div class="demo-cipher-notice-text">
-                    <strong>Preview Mode:</strong> This is sample data showing what you'll track - No Matter What
-                </div>
-            </div>
-        </div>
-
-        <div class="page-cipher-header">
-            <h1 class="page-cipher-title">🎤 Command Center</h1>
-            <p class="page-cipher-subtitle" id="dashboard-subtitle">Welcome back! Here's your cipher status.</p>
-        </div>
-
-        <!-- Stats Cipher Grid -->
-        <div class="stats-cipher-grid">
-            <div class="stat-cipher-card">
-                <div class="cipher-kpi">
-                    <div class="cipher-kpi-value" id="miles-stat">247</div>
-                    <div class="cipher-kpi-label">Miles This Month</div>
-                </div>
-            </div>
-            <div class="stat-cipher-card">
-                <div class="cipher-kpi">
-                    <div class="cipher-kpi-value" id="routes-stat">18</div>
-                    <div class="cipher-kpi-label">Routes Optimized</div>
-                </div>
-            </div>
-            <div class="stat-cipher-card">
-                <div class="cipher-kpi">
-                    <div class="cipher-kpi-value" id="jobs-stat">42</div>
-                    <div class="cipher-kpi-label">Jobs Completed</div>
-                </div>
-            </div>
-            <div class="stat-cipher-card">
-                <div class="cipher-kpi">
-                    <div class="cipher-kpi-value" id="earnings-stat">$1,847</div>
-                    <div class="cipher-kpi-label">Total Earnings</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Dashboard Cipher Content Grid -->
-        <div class="cipher-grid cipher-grid--2 mt-32">
-            <!-- Recent Routes Cipher Card -->
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">Recent Routes</h3>
-                    <button class="cipher-btn cipher-btn--outline cipher-btn--sm" onclick="window.location.href='route-cypher.html'">View All</button>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="recent-routes-cipher" id="recent-routes">
-                        <div class="route-cipher-item">
-                            <div class="route-cipher-item-info">
-                                <h4>Downtown Route - Aug 9</h4>
-                                <p>8 stops • 47 miles • 3.2 hours</p>
-                            </div>
-                            <span class="cipher-badge cipher-badge--success">Completed</span>
-                        </div>
-                        <div class="route-cipher-item">
-                            <div class="route-cipher-item-info">
-                                <h4>Northside Loop - Aug 8</h4>
-                                <p>12 stops • 63 miles • 4.1 hours</p>
-                            </div>
-                            <span class="cipher-badge cipher-badge--success">Completed</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Active Jobs Cipher Card -->
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">Active Jobs</h3>
-                    <button class="cipher-btn cipher-btn--outline cipher-btn--sm" onclick="window.location.href='jobs-studio.html'">View All</button>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="active-jobs-cipher">
-                        <div class="job-cipher-item">
-                            <div class="job-cipher-item-info">
-                                <h4>2022 Honda Accord - #CLM-9876</h4>
-                                <p>Ready for inspection</p>
-                            </div>
-                            <button class="cipher-btn cipher-btn--success cipher-btn--small">Start</button>
-                        </div>
-                        <div class="job-cipher-item">
-                            <div class="job-cipher-item-info">
-                                <h4>2020 Ford F-150 - #CLM-4876</h4>
-                                <p>Pending assignment</p>
-                            </div>
-                            <button class="cipher-btn cipher-btn--primary cipher-btn--small">Assign</button>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Quick Actions Cipher -->
-                <div class="cipher-card">
-                    <div class="cipher-card-header">
-                        <h3 class="cipher-card-title">Quick Actions</h3>
-                    </div>
-                    <div class="quick-actions-cipher">
-                        <button class="cipher-btn cipher-btn--primary cipher-btn--full mb-8" onclick="window.location.href='mileage-cypher.html'">
-                            <span>🚗</span> Calculate Mileage
-                        </button>
-                        <button class="cipher-btn cipher-btn--primary cipher-btn--full mb-8" onclick="window.location.href='route-cypher.html'">
-                            <span>🗺️</span> Optimize Route
-                        </button>
-                        <button class="cipher-btn cipher-btn--primary cipher-btn--full" onclick="window.location.href='jobs-studio.html'">
-                            <span>📱</span> Manage Jobs
-                        </button>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Recent Activity Cipher Card -->
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">Recent Activity</h3>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="activity-cipher-feed" id="activity-feed">
-                        <div class="activity-cipher-item">
-                            <div class="activity-cipher-icon activity-cipher-icon--success">✓</div>
-                            <div class="activity-cipher-content">
-                                <div class="activity-cipher-title">Route optimized</div>
-                                <div class="activity-cipher-time">2 hours ago</div>
-                            </div>
-                        </div>
-                        <div class="activity-cipher-item">
-                            <div class="activity-cipher-icon activity-cipher-icon--info">📱</div>
-                            <div class="activity-cipher-content">
-                                <div class="activity-cipher-title">Photos synced from mobile</div>
-                                <div class="activity-cipher-time">4 hours ago</div>
-                            </div>
-                        </div>
-                        <div class="activity-cipher-item">
-                            <div class="activity-cipher-icon activity-cipher-icon--warning">📄</div>
-                            <div class="activity-cipher-content">
-                                <div class="activity-cipher-title">Job completed</div>
-                                <div class="activity-cipher-time">Yesterday</div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <!-- Scripts -->
-    <script src="scripts/cipher-core.js"></script>
-    <script src="scripts/command-center.js"></script>
-    
-    <!-- Authentication and initialization script -->
-    <script>
-        // 🎤 Authentication check
-        if (localStorage.getItem('cipher_authenticated') !== 'true') {
-            window.location.href = './login-cypher.html';
-        }
-
-        // Initialize page with user context
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeCipherUserContext();
-            setupCipherLogoutHandler();
-            
-            // Initialize dashboard data
-            if (typeof initializeCommandCenter === 'function') {
-                initializeCommandCenter();
-            }
-        });
-
-        function initializeCipherUserContext() {
-            const userType = localStorage.getItem('cipher_user_type') || 'demo';
-            const userEmail = localStorage.getItem('cipher_user_email') || 'demo@claimcipher.com';
-            const userName = userType === 'demo' ? 'Demo User' : userEmail.split('@')[0];
-            
-            // Set user type attribute
-            document.body.setAttribute('data-cipher-user-type', userType);
-            
-            // Update user display
-            const userNameEl = document.getElementById('user-name');
-            const userRoleEl = document.getElementById('user-role');
-            const userAvatarEl = document.getElementById('user-avatar');
-            
-            if (userNameEl) userNameEl.textContent = userName;
-            if (userRoleEl) userRoleEl.textContent = userType === 'demo' ? 'Demo Mode' : 'Pro User';
-            if (userAvatarEl) userAvatarEl.textContent = userName.substring(0, 2).toUpperCase();
-            
-            // Show demo notice if needed
-            if (userType === 'demo') {
-                const demoNotice = document.getElementById('demo-notice');
-                if (demoNotice) {
-                    demoNotice.style.display = 'block';
-                }
-            }
-        }
-
-        function setupCipherLogoutHandler() {
-            const logoutBtn = document.getElementById('logout-btn');
-            if (logoutBtn) {
-                logoutBtn.addEventListener('click', function() {
-                    localStorage.removeItem('cipher_authenticated');
-                    localStorage.removeItem('cipher_user_type');
-                    localStorage.removeItem('cipher_user_email');
-                    localStorage.removeItem('cipher_demo_start_time');
-                    window.location.href = './login-cypher.html';
-                });
-            }
-        }
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "command-center.html").write_text(command_center, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "command-center.html", finished_page("command-center.html"))
     created.append("command-center.html")
     
     # 4. Create CSS Files Directory
@@ -784,7 +348,7 @@ html, body {
   }
 }"""
     
-    (styles_dir / "cipher-core.css").write_text(cipher_core_css, encoding="utf-8")
+    write_artifact(run_dir, styles_dir / "cipher-core.css", cipher_core_css)
     created.append("styles/cipher-core.css")
     
     # 5. Create JavaScript Files Directory
@@ -1034,11 +598,27 @@ window.showCipherForm = showCipherForm;
 window.handleCipherLogin = handleCipherLogin;
 window.handleDemoCipher = handleDemoCipher;"""
     
-    (scripts_dir / "login-cypher.js").write_text(login_cypher_js, encoding="utf-8")
+    write_artifact(run_dir, scripts_dir / "login-cypher.js", login_cypher_js)
     created.append("scripts/login-cypher.js")
     
     return created
 
+# Build pipeline contract - paths are relative to the run directory
+READS = []
+WRITES = [
+    "claim_cipher_app/index.html",
+    "claim_cipher_app/login-cypher.html",
+    "claim_cipher_app/command-center.html",
+    "claim_cipher_app/styles/cipher-core.css",
+    "claim_cipher_app/scripts/login-cypher.js",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created += create_complete_html_app(run_dir)
+    return created
+
 def main():
     print("🎤🔥 BUILDING COMPLETE HTML APPLICATION - HIP-HOP STYLE 🔥🎤")
     print("=" * 70)
@@ -1052,6 +632,7 @@ def main():
     print("🎵 Building complete HTML/CSS/JavaScript application...")
     
     created = create_complete_html_app(latest_run)
+    finish_build(latest_run)
     
     print(f"\n✅ Created {len(created)} HTML application files:")
     for item in created:
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Build Manifest
+Content hashes for every generated artifact - unchanged bytes never hit the disk
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import run_index
+from cipher_trace import span
+
+MANIFEST_NAME = "manifest.json"
+
+def content_hash(data):
+    """sha256 hex digest of some bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+def file_hash(path, chunk_size=1 << 20):
+    """sha256 hex digest of a file on disk"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_atomic(path, data):
+    """Write via a temp file and rename - never truncates an inode another run may share"""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def write_text_atomic(path, text, encoding="utf-8"):
+    """write_atomic for text - what every writer under runs/ uses instead of Path.write_text"""
+    write_atomic(Path(path), text.encode(encoding))
+
+class BuildManifest:
+    """Per-run record of what every builder wrote, keyed by run-relative path"""
+
+    def __init__(self, run_dir):
+        self.run_dir = Path(run_dir).resolve()
+        self.path = self.run_dir / MANIFEST_NAME
+        self.entries = {}
+        self.before = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path) as f:
+                self.entries = json.load(f).get("artifacts", {})
+
+    def relative(self, path):
+        return Path(path).resolve().relative_to(self.run_dir).as_posix()
+
+    def _on_disk_hash(self, path, entry):
+        """Hash of the file currently on disk, trusting the manifest when size and mtime match"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        if entry and entry.get("bytes") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+        return file_hash(path)
+
+    def write_bytes(self, path, data):
+        """Write data unless the file already holds exactly these bytes"""
+        path = Path(path)
+        key = self.relative(path)
+        digest = content_hash(data)
+
+        with self._lock:
+            entry = self.entries.get(key)
+            current = self._on_disk_hash(path, entry)
+            # Remember what was on disk before this build first touched the path
+            self.before.setdefault(key, current)
+            if current == digest:
+                status = "unchanged"
+            else:
+                status = "added" if current is None else "changed"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(path, data)
+
+            stat = path.stat()
+            self.entries[key] = {"sha256": digest, "bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        return status
+
+    def write_text(self, path, text, encoding="utf-8"):
+        return self.write_bytes(path, text.encode(encoding))
+
+    def remove(self, path):
+        """Delete an artifact a rebuild no longer makes - its entry goes when the manifest is saved"""
+        path = Path(path)
+        key = self.relative(path)
+        with self._lock:
+            self.before.setdefault(key, self._on_disk_hash(path, self.entries.get(key)))
+            path.unlink(missing_ok=True)
+            self.entries[key] = None
+
+    def changes(self):
+        """Entries touched in this process, for merging elsewhere"""
+        with self._lock:
+            return {key: (self.entries[key], before) for key, before in self.before.items()}
+
+    def merge(self, changes):
+        """Fold in another process's changes - merge stages in the order they ran"""
+        with self._lock:
+            for key, (entry, before) in changes.items():  # entry None: removed
+                self.entries[key] = entry
+                self.before.setdefault(key, before)
+
+    def summary(self):
+        """Compare each artifact's final bytes with what was there before the build"""
+        report = {"added": [], "changed": [], "unchanged": [], "removed": []}
+        for key, before in sorted(self.before.items()):
+            if self.entries.get(key) is None:
+                if before is not None:
+                    report["removed"].append(key)
+            elif before is None:
+                report["added"].append(key)
+            elif before != self.entries[key]["sha256"]:
+                report["changed"].append(key)
+            else:
+                report["unchanged"].append(key)
+        return report
+
+    def save(self):
+        with self._lock:
+            data = {"artifacts": {key: entry for key, entry in sorted(self.entries.items()) if entry is not None}}
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+            touched = [key for key in self.before if self.entries.get(key) is not None]
+            removed = [key for key in self.before if self.entries.get(key) is None]
+            self.entries = data["artifacts"]
+        # Deliverables a builder produced (or stopped producing) show up in the run index straight away
+        run_index.mark_written(self.run_dir, touched)
+        if removed:
+            run_index.mark_missing(self.run_dir, removed)
+
+# One manifest per run directory per process
+_manifests = {}
+_registry_lock = threading.Lock()
+
+def manifest_for(run_dir):
+    key = Path(run_dir).resolve()
+    with _registry_lock:
+        if key not in _manifests:
+            _manifests[key] = BuildManifest(key)
+        return _manifests[key]
+
+def reset():
+    """Forget cached manifests - pool workers call this between stages"""
+    with _registry_lock:
+        _manifests.clear()
+
+def write_artifact(run_dir, path, text, encoding="utf-8"):
+    """Drop-in for Path.write_text that skips writes whose bytes are unchanged"""
+    manifest = manifest_for(run_dir)
+    data = text.encode(encoding)
+    key = manifest.relative(path)
+    with span(f"write {key}", phase="write", file=key) as write_span:
+        status = manifest.write_bytes(path, data)
+        write_span.add_bytes(0 if status == "unchanged" else len(data))
+    return status
+
+def print_summary(summary):
+    print(f"\n📒 MANIFEST: {len(summary['added'])} added, "
+          f"{len(summary['changed'])} changed, {len(summary['removed'])} removed, "
+          f"{len(summary['unchanged'])} unchanged")
+    for status, icon in (("added", "➕"), ("changed", "✏️"), ("removed", "➖")):
+        for key in summary[status]:
+            print(f"  {icon} {key}")
+
+def finish_build(run_dir):
+    """Save the run manifest and print what this build actually touched"""
+    manifest = manifest_for(run_dir)
+    manifest.save()
+    summary = manifest.summary()
+    print_summary(summary)
+    return summary
+
+def main():
+    import sys
+
+    if len(sys.argv) != 2:
+        print("🎤 Usage: python build_manifest.py <run_dir>")
+        sys.exit(1)
+
+    manifest = BuildManifest(sys.argv[1])
+    total = sum(e["bytes"] for e in manifest.entries.values())
+    print(f"📒 {len(manifest.entries)} artifacts, {total:,} bytes")
+    for key, entry in sorted(manifest.entries.items()):
+        print(f"  {entry['sha256'][:12]}  {entry['bytes']:>8,}  {key}")
+
+if __name__ == "__main__":
+    main()
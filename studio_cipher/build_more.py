@@ -7,21 +7,11 @@ Quick command to generate more components and get higher completion
 import json
 from pathlib import Path
 from datetime import datetime
+from cipher_runs import get_latest_run
+from build_manifest import finish_build, write_artifact
+from cipher_trace import traced
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    if not runs_dir.exists():
-        return None
-    
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    if not run_dirs:
-        return None
-        
-    # Sort by name (timestamp format makes this work)
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
-
+@traced(phase="build")
 def build_dashboard_component(run_dir):
     """Build the main dashboard component"""
     dashboard_code = """import React, { useState, useEffect } from 'react';
@@ -104,10 +94,11 @@ export default DashboardStage;
     dashboard_dir = run_dir / "frontend" / "src" / "components" / "dashboard"
     dashboard_dir.mkdir(parents=True, exist_ok=True)
     dashboard_file = dashboard_dir / "DashboardStage.jsx"
-    dashboard_file.write_text(dashboard_code, encoding="utf-8")
+    write_artifact(run_dir, dashboard_file, dashboard_code)
     
     return "DashboardStage.jsx"
 
+@traced(phase="build")
 def build_jobs_backend(run_dir):
     """Build the jobs management backend"""
     jobs_code = """const express = require('express');
@@ -190,10 +181,11 @@ module.exports = router;
     backend_dir = run_dir / "backend" / "server" / "routes"
     backend_dir.mkdir(parents=True, exist_ok=True)
     jobs_file = backend_dir / "jobs-manager.js"
-    jobs_file.write_text(jobs_code, encoding="utf-8")
+    write_artifact(run_dir, jobs_file, jobs_code)
     
     return "jobs-manager.js"
 
+@traced(phase="build")
 def build_readme(run_dir):
     """Build the main README"""
     readme_content = """# 🎤 Claim Cipher - Hip-Hop Professional Insurance Platform
@@ -261,10 +253,26 @@ See `docs/deployment/production-guide.md` for full deployment instructions.
 """
     
     readme_file = run_dir / "README-CLAIM-CIPHER.md"
-    readme_file.write_text(readme_content, encoding="utf-8")
+    write_artifact(run_dir, readme_file, readme_content)
     
     return "README-CLAIM-CIPHER.md"
 
+# Build pipeline contract - paths are relative to the run directory
+READS = []
+WRITES = [
+    "frontend/src/components/dashboard/DashboardStage.jsx",
+    "backend/server/routes/jobs-manager.js",
+    "README-CLAIM-CIPHER.md",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created.append(build_dashboard_component(run_dir))
+    created.append(build_jobs_backend(run_dir))
+    created.append(build_readme(run_dir))
+    return created
+
 def main():
     print("🎤 BUILDING MORE DELIVERABLES...")
     
@@ -286,6 +294,7 @@ def main():
     
     print("🎵 Creating README...")
     created.append(build_readme(latest_run))
+    finish_build(latest_run)
     
     print(f"\n✅ Created {len(created)} new deliverables:")
     for item in created:
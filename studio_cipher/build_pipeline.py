@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Build Pipeline
+One command to rebuild Claim Cipher - independent builders run side by side
+"""
+
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import build_manifest
+import cipher_trace
+from cipher_runs import get_latest_run
+from phase_journal import PhaseJournal
+from render_pool import limit_render_workers
+import run_index
+
+STUDIO_DIR = Path(__file__).resolve().parent
+REPO_DIR = STUDIO_DIR.parent
+
+# The old hand-run order - it only breaks ties between stages that touch the same paths
+BUILDERS = [
+    STUDIO_DIR / "build_html_app.py",
+    STUDIO_DIR / "build_all_pages.py",
+    STUDIO_DIR / "complete_cipher_build.py",
+    STUDIO_DIR / "build_complete_app.py",
+    STUDIO_DIR / "build_more.py",
+    STUDIO_DIR / "finalize_app.py",
+    REPO_DIR / "designer_fixes.py",
+    REPO_DIR / "team_collaboration_fixes.py",
+    STUDIO_DIR / "asset_bundler.py",
+]
+
+def load_builder(path):
+    """Import a builder script by file path"""
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(f"cipher_builder_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def paths_overlap(a, b):
+    """True when two run-relative paths hit the same file or one is a directory holding the other"""
+    if a == b:
+        return True
+    if a.endswith("/") and b.startswith(a):
+        return True
+    if b.endswith("/") and a.startswith(b):
+        return True
+    return False
+
+def touches(paths_a, paths_b):
+    return any(paths_overlap(a, b) for a in paths_a for b in paths_b)
+
+class Stage:
+    """A builder script plus the paths it declares it reads and writes"""
+
+    def __init__(self, name, path, reads, writes):
+        self.name = name
+        self.path = Path(path)
+        self.reads = list(reads)
+        self.writes = list(writes)
+        self.depends_on = set()
+
+    @classmethod
+    def from_builder(cls, path):
+        module = load_builder(path)
+        return cls(Path(path).stem, path, getattr(module, "READS", []), getattr(module, "WRITES", []))
+
+def build_graph(stages):
+    """Link each stage to every earlier stage it has a read/write hazard with"""
+    for i, later in enumerate(stages):
+        for earlier in stages[:i]:
+            read_after_write = touches(later.reads, earlier.writes)
+            write_after_read = touches(later.writes, earlier.reads)
+            write_after_write = touches(later.writes, earlier.writes)
+            if read_after_write or write_after_read or write_after_write:
+                later.depends_on.add(earlier.name)
+    return stages
+
+def plan_waves(stages):
+    """Group stages into waves that can run at the same time"""
+    done = set()
+    remaining = list(stages)
+    waves = []
+    while remaining:
+        ready = [s for s in remaining if s.depends_on <= done]
+        if not ready:
+            raise RuntimeError("Build graph has a cycle: " + ", ".join(s.name for s in remaining))
+        waves.append(ready)
+        done.update(s.name for s in ready)
+        remaining = [s for s in remaining if s.name not in done]
+    return waves
+
+def run_stage(path, run_dir):
+    """Worker entry point - import the builder in the worker and run it"""
+    started = time.perf_counter()
+    build_manifest.reset()
+    with cipher_trace.span(f"stage {Path(path).stem}", phase="pipeline", builder=Path(path).stem):
+        module = load_builder(path)
+        created = module.build(Path(run_dir))
+    changes = build_manifest.manifest_for(run_dir).changes()
+    return created, time.perf_counter() - started, changes
+
+def run_pipeline(run_dir, builders=None, jobs=None, serial=False, resume=False):
+    """Run every builder against a run directory, as parallel as the graph allows"""
+    stages = build_graph([Stage.from_builder(p) for p in (builders or BUILDERS)])
+    by_name = {s.name: s for s in stages}
+    results = {}
+    run_dir = str(Path(run_dir).resolve())
+    cipher_trace.configure(run_dir)
+
+    journal = PhaseJournal(run_dir)
+    if resume and journal.last_start("pipeline"):
+        committed = journal.completed("pipeline")
+    else:
+        committed = {}
+        journal.start("pipeline", builders=[s.name for s in stages])
+
+    # Saved as each stage commits, so stages a crash leaves committed keep their entries
+    manifest = build_manifest.BuildManifest(run_dir)
+    done = set()
+    for stage in stages:
+        if stage.name in committed:
+            results[stage.name] = ([], 0.0, {})
+            done.add(stage.name)
+            print(f"  ⏭️ {stage.name} (committed in journal)")
+
+    def finish(name, result):
+        results[name] = result
+        manifest.merge(result[2])
+        manifest.save()  # before the commit - a committed stage is always in the manifest
+        journal.commit("pipeline", name, artifacts=result[2].keys())
+        done.add(name)
+        print(f"  ✅ {name} ({result[1]:.2f}s)")
+
+    if serial:
+        for stage in stages:
+            if stage.name not in done:
+                journal.begin("pipeline", stage.name)
+                finish(stage.name, run_stage(stage.path, run_dir))
+        return record_manifest(run_dir, manifest, {name: results[name] for name in by_name})
+
+    running = {}
+    workers = jobs or os.cpu_count() or 1
+    # Each stage worker gets its share of the cores for its own render pool, not all of them
+    render_share = max(1, (os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=limit_render_workers,
+                             initargs=(render_share,)) as pool:
+        while len(done) < len(stages):
+            for stage in stages:
+                if stage.name in done or stage.name in running.values():
+                    continue
+                if stage.depends_on <= done:
+                    journal.begin("pipeline", stage.name)
+                    future = pool.submit(run_stage, stage.path, run_dir)
+                    running[future] = stage.name
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                finish(running.pop(future), future.result())
+
+    return record_manifest(run_dir, manifest, {name: results[name] for name in by_name})
+
+def record_manifest(run_dir, manifest, results):
+    """Stage timings and what this session changed - the manifest itself is already saved"""
+    run_index.record_timings(run_dir, "stage", {name: seconds for name, (_, seconds, _) in results.items()})
+    return results, manifest.summary()
+
+def print_plan(stages):
+    waves = plan_waves(build_graph(stages))
+    print("🗺️ BUILD GRAPH:")
+    for number, wave in enumerate(waves, 1):
+        print(f"  Wave {number}:")
+        for stage in wave:
+            after = ", ".join(sorted(stage.depends_on)) or "nothing"
+            print(f"    🎤 {stage.name} (after {after})")
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    serial = "--serial" in sys.argv
+    resume = "--resume" in sys.argv
+    jobs = None
+    for flag in sys.argv[1:]:
+        if flag.startswith("--jobs="):
+            jobs = int(flag.split("=", 1)[1])
+
+    print("🎤🔥 STUDIO CIPHER BUILD PIPELINE 🔥🎤")
+    print("=" * 60)
+
+    if "--plan" in sys.argv:
+        print_plan([Stage.from_builder(p) for p in BUILDERS])
+        return
+
+    run_dir = Path("runs") / args[0] if args else get_latest_run()
+    if not run_dir or not run_dir.exists():
+        print("❌ No runs found. Run a mission first!")
+        sys.exit(1)
+
+    print(f"📁 Working in: {run_dir}")
+    print(f"🎛️ Mode: {'serial' if serial else f'parallel ({jobs or os.cpu_count()} workers)'}")
+
+    started = time.perf_counter()
+    results, summary = run_pipeline(run_dir, jobs=jobs, serial=serial, resume=resume)
+    elapsed = time.perf_counter() - started
+
+    total = sum(len(created) for created, _, _ in results.values())
+    stage_time = sum(seconds for _, seconds, _ in results.values())
+    print(f"\n✅ {len(results)} builders produced {total} files")
+    print(f"⏱️ {elapsed:.2f}s wall / {stage_time:.2f}s builder time")
+    build_manifest.print_summary(summary)
+
+    if "--dedupe" in sys.argv:
+        import blob_store
+        stats = blob_store.store_run(run_dir)
+        print(f"\n📦 BLOB STORE: {stats['linked']} files deduped, {stats['bytes_saved']:,} bytes saved")
+
+if __name__ == "__main__":
+    main()
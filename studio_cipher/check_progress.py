@@ -5,8 +5,9 @@ Check completion status of your hip-hop development crew
 """
 
 from pathlib import Path
-import json
 from datetime import datetime
+from cipher_runs import get_latest_run
+import run_index
 
 def check_progress(run_id=None):
     """Check progress of a specific run or the latest run"""
@@ -15,12 +16,11 @@ def check_progress(run_id=None):
     
     if not run_id:
         # Get the latest run
-        run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-        if not run_dirs:
+        run_dir = get_latest_run(runs_dir)
+        if not run_dir:
             print("❌ No runs found. Start a mission first!")
             return
         
-        run_dir = max(run_dirs, key=lambda x: x.name)
         run_id = run_dir.name
     else:
         run_dir = runs_dir / run_id
@@ -32,37 +32,50 @@ def check_progress(run_id=None):
     print(f"📂 Location: {run_dir}")
     
     if not run_dir.exists():
-        print(f"❌ Run {run_id} not found!")
+        from run_archive import load_index
+        if run_id in load_index(runs_dir):
+            print(f"🗄️ Run {run_id} is archived - bring it back with: python cipher.py archive restore {run_id}")
+        else:
+            print(f"❌ Run {run_id} not found!")
         return
     
-    # Load mission details
-    mission_file = run_dir / "mission.json"
-    if mission_file.exists():
-        with open(mission_file) as f:
-            mission = json.load(f)
-        
-        print(f"\n🎯 MISSION: {mission['goal']}")
+    run = run_index.progress(run_dir)
+    if run is None and (run_dir / "mission.json").exists():
+        run_index.index_run(run_dir)  # run from before the index - read it from disk once
+        run = run_index.progress(run_dir)
+    elif run is not None:
+        # Files may have been written or deleted since the index last heard - check every
+        # deliverable, done or pending, against a single walk of the run directory
+        present = set(run_index.present_paths(run_dir, [(d['category'], d['item']) for d in run['deliverables']]))
+        gone = [path for d in run['deliverables'] if d['done']
+                for path in run_index.deliverable_paths(d['category'], d['item']) if path not in present]
+        written = run_index.mark_written(run_dir, sorted(present))
+        if written + run_index.mark_missing(run_dir, gone, present):
+            run = run_index.progress(run_dir)
+    
+    if run is not None and run['goal']:
+        print(f"\n🎯 MISSION: {run['goal']}")
         print("\n" + "="*60)
         print("DELIVERABLES PROGRESS")
         print("="*60)
         
         total_deliverables = 0
         completed_deliverables = 0
+        completion_pct = 0
         
         # Check each category of deliverables
-        for category, items in mission['deliverables'].items():
-            print(f"\n📦 {category.upper()}:")
-            category_dir = run_dir / category
+        category = None
+        for deliverable in run['deliverables']:
+            if deliverable['category'] != category:
+                category = deliverable['category']
+                print(f"\n📦 {category.upper()}:")
             
-            for item in items:
-                total_deliverables += 1
-                item_file = category_dir / item if not item.startswith("src/") else run_dir / item
-                
-                if item_file.exists() or (category_dir / Path(item).name).exists():
-                    print(f"  ✅ {item}")
-                    completed_deliverables += 1
-                else:
-                    print(f"  ⏳ {item}")
+            total_deliverables += 1
+            if deliverable['done']:
+                print(f"  ✅ {deliverable['item']}")
+                completed_deliverables += 1
+            else:
+                print(f"  ⏳ {deliverable['item']}")
         
         # Calculate completion percentage
         if total_deliverables > 0:
@@ -89,9 +102,14 @@ def check_progress(run_id=None):
         
         # Check acceptance criteria
         print(f"\n📋 ACCEPTANCE CRITERIA:")
-        for i, criteria in enumerate(mission['acceptance'], 1):
+        for i, criteria in enumerate(run['acceptance'], 1):
             print(f"  {i}. {criteria}")
         
+        if run['qa_scores']:
+            latest = run['qa_scores'][-1]
+            score = f"{latest['score']:.1f}%" if latest['score'] is not None else f"{latest['issues']} issues"
+            print(f"\n🎬 LATEST QA: {latest['source']} round {latest['round']} - {score}")
+        
         # Show next steps
         print(f"\n🎵 WHAT'S HAPPENING:")
         if completion_pct < 100:
@@ -111,30 +129,55 @@ def check_progress(run_id=None):
 def list_runs():
     """List all available runs"""
     runs_dir = Path("runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
+    run_index.ensure_indexed(runs_dir)  # only runs the index has never seen are read from disk
+    runs = run_index.list_runs(runs_dir)
     
-    if not run_dirs:
+    from run_archive import load_index
+    archived = load_index(runs_dir)
+    
+    if not runs and not archived:
         print("❌ No runs found.")
         return
     
     print("🎤 AVAILABLE RUNS:")
-    for run_dir in sorted(run_dirs, reverse=True):
-        mission_file = run_dir / "mission.json"
-        if mission_file.exists():
-            with open(mission_file) as f:
-                mission = json.load(f)
-            print(f"  📁 {run_dir.name} - {mission['goal'][:50]}...")
+    for run in runs:
+        if run['goal']:
+            print(f"  📁 {run['run_id']} - {run['goal'][:50]}...")
         else:
-            print(f"  📁 {run_dir.name}")
+            print(f"  📁 {run['run_id']}")
+    
+    if archived:
+        print(f"🗄️ Plus {len(archived)} archived runs - python cipher.py archive list")
 
-if __name__ == "__main__":
+def watch(run_id=None, polling=False):
+    """Live view of a run - updated as deliverables land, until the mission completes"""
+    runs_dir = Path("runs")
+    run_dir = runs_dir / run_id if run_id else get_latest_run(runs_dir)
+    if not run_dir or not run_dir.exists():
+        print("❌ No runs found. Start a mission first!" if not run_id else f"❌ Run {run_id} not found!")
+        return
+    if not (run_dir / "mission.json").exists():
+        print("❌ Mission file not found!")
+        return
+
+    from progress_watch import watch_progress
+    watch_progress(run_dir, polling=polling)
+
+def main():
     import sys
-    
-    if len(sys.argv) == 1:
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if "--watch" in sys.argv:
+        # Follow a run live: inotify on Linux, directory polling elsewhere
+        watch(args[0] if args else None, polling="--poll" in sys.argv)
+    elif not args:
         # No arguments - check latest run
         check_progress()
-    elif sys.argv[1] == "list":
+    elif args[0] == "list":
         list_runs()
     else:
         # Specific run ID provided
-        check_progress(sys.argv[1])
+        check_progress(args[0])
+
+if __name__ == "__main__":
+    main()
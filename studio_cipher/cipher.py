@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Command Line
+One entry point for the whole crew - each subcommand imports only what it needs
+"""
+
+import importlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+STUDIO_DIR = Path(__file__).resolve().parent
+REPO_DIR = STUDIO_DIR.parent
+
+# name -> (module with a main(), lives in repo root, help)
+COMMANDS = {
+    "run":      ("run_mission", False, "Run a mission with the full crew"),
+    "build":    ("build_pipeline", False, "Rebuild a run through the builder graph"),
+    "progress": ("check_progress", False, "Deliverable progress for a run (or 'list', --watch to follow it)"),
+    "check":    ("producer_final_quality_check", True, "Producer final quality approval"),
+    "qa":       ("comprehensive_qa_loop", True, "Producer 5-round QA loop"),
+    "manifest": ("build_manifest", False, "Show a run's artifact manifest"),
+    "blobs":    ("blob_store", False, "Deduplicate runs into the blob store, gc, stats"),
+    "config":   ("config_cache", False, "Config cache benchmark or clear"),
+    "journal":  ("phase_journal", False, "Committed and interrupted steps of a run"),
+    "archive":  ("run_archive", False, "Archive old runs to tarballs, list, extract, restore, prune"),
+    "index":    ("run_index", False, "Query the SQLite run index - list, show, rebuild"),
+    "compare":  ("run_compare", False, "Compare two runs - byte deltas, diffs, page weight"),
+    "serve":    ("progress_server", False, "Progress dashboard with JSON and Server-Sent Events"),
+    "trace":    ("cipher_trace", False, "Span summary or Chrome/speedscope export for a run"),
+    "model":    ("model_backend", False, "Load-test the model backend against the local stand-in"),
+    "gencache": ("generation_cache", False, "Cached agent generations - stats or clear"),
+    "merge":    ("merge_engine", False, "Merge agents' edited copies of a file against their base"),
+    "crew":     ("command_center_crew", False, "Designer, then lyricist, security and producer in parallel on command-center.html"),
+    "pages":    ("template_engine", False, "Render the page templates to a directory, or benchmark them"),
+    "bundle":   ("asset_bundler", False, "Per-page minified, hashed CSS and JS bundles into claim_cipher_dist"),
+    "cascade":  ("css_cascade", False, "Consolidate stylesheets in link order - overridden declarations dropped"),
+    "prune":    ("css_prune", False, "Strip CSS selectors the given pages and scripts can never match"),
+    "critical": ("critical_css", False, "The CSS a page's first screen needs - what the bundler inlines"),
+    "compress": ("precompress", False, "Write .gz and .br siblings for every text asset in a directory"),
+    "static":   ("static_server", False, "Serve a bundled app - precompressed, ETags, immutable bundles, keep-alive"),
+    "loadtest": ("static_load_test", False, "Load-test the static server against python -m http.server"),
+}
+
+def load_command(name):
+    """Import the module behind a subcommand - nothing else gets imported"""
+    module_name, in_repo_root, _ = COMMANDS[name]
+    for path in (STUDIO_DIR, REPO_DIR if in_repo_root else None):
+        if path and str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    return importlib.import_module(module_name)
+
+def run_command(name, argv):
+    """Run a subcommand as if its script had been called directly"""
+    module = load_command(name)
+    sys.argv = [f"{COMMANDS[name][0]}.py", *argv]
+    module.main()
+
+def measure_startup(name, repeat=3):
+    """Best-of-N cold start for a subcommand: fresh interpreter, import its subsystem, exit"""
+    code = (
+        "import sys, time; t = time.perf_counter(); "
+        f"sys.path.insert(0, {str(STUDIO_DIR)!r}); import cipher; "
+        f"cipher.load_command({name!r}) if {name!r} else None; "
+        "print(time.perf_counter() - t)"
+    )
+    best_wall, best_import = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        wall = time.perf_counter() - started
+        imported = float(out.stdout.strip().splitlines()[-1])
+        best_wall = wall if best_wall is None else min(best_wall, wall)
+        best_import = imported if best_import is None else min(best_import, imported)
+    return best_wall, best_import
+
+def startup_report():
+    print("⏱️ COLD START PER SUBCOMMAND (best of 3)")
+    print("=" * 60)
+    base_wall, _ = measure_startup("")
+    print(f"  {'python + cipher':<10} {base_wall * 1000:8.1f} ms wall")
+    for name in COMMANDS:
+        wall, imported = measure_startup(name)
+        print(f"  {name:<10} {wall * 1000:8.1f} ms wall   {imported * 1000:7.1f} ms import   "
+              f"(+{(wall - base_wall) * 1000:.1f} ms)")
+
+def usage():
+    print("🎤 Usage: python cipher.py <command> [args...]")
+    print("\n🎯 Commands:")
+    for name, (_, _, help_text) in COMMANDS.items():
+        print(f"  {name:<10} {help_text}")
+    print(f"  {'startup':<10} Measure cold-start time of every command")
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help", "help"):
+        usage()
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    name, argv = sys.argv[1], sys.argv[2:]
+    if name == "startup":
+        startup_report()
+    elif name in COMMANDS:
+        run_command(name, argv)
+    else:
+        print(f"❌ Unknown command: {name}")
+        usage()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
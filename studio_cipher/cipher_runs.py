@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Runs
+The one place that knows where runs live and which one is latest
+"""
+
+import os
+from pathlib import Path
+
+STUDIO_DIR = Path(__file__).resolve().parent
+RUNS_DIR = Path("runs")
+
+def _run_names(runs_dir):
+    """Names of run directories - one scandir pass, dot-dirs like .blobs and .archive are not runs"""
+    try:
+        with os.scandir(runs_dir) as entries:
+            return [e.name for e in entries if not e.name.startswith(".") and e.is_dir()]
+    except FileNotFoundError:
+        return []
+
+def list_run_dirs(runs_dir=None):
+    """Every run directory, oldest first"""
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    # Sort by name (timestamp format makes this work)
+    return [runs_dir / name for name in sorted(_run_names(runs_dir))]
+
+def get_latest_run(runs_dir=None):
+    """Get the most recent run directory, or None when there are no runs"""
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    names = _run_names(runs_dir)
+    return runs_dir / max(names) if names else None
+
+def resolve_run(run_id=None, runs_dir=None):
+    """A run by id, or the latest run when no id is given"""
+    if run_id:
+        return Path(runs_dir or RUNS_DIR) / run_id
+    return get_latest_run(runs_dir)
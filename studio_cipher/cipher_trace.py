@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Trace
+JSONL spans for missions, builders and QA rounds - exportable to Chrome trace and speedscope
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+TRACE_NAME = "trace.jsonl"
+TRACE_ENV = "CIPHER_TRACE_DIR"
+
+class Span:
+    """One timed piece of work; bytes written inside it roll up into its parent"""
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.bytes = attrs.pop("bytes", 0)
+        self.parent = None
+
+    def add_bytes(self, count):
+        self.bytes += count
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self.start_us = time.time_ns() // 1000
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_us = int((time.perf_counter() - self._t0) * 1_000_000)
+        stack = self.tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if self.parent is not None:
+            self.parent.add_bytes(self.bytes)
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.record(self.name, self.start_us, duration_us, bytes=self.bytes, **self.attrs)
+        return False
+
+class NullSpan:
+    """What span() hands out when tracing is off - costs one attribute lookup"""
+
+    bytes = 0
+
+    def add_bytes(self, count):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NULL_SPAN = NullSpan()
+
+class Tracer:
+    """Appends spans to <run_dir>/trace.jsonl - safe across threads and worker processes"""
+
+    def __init__(self, run_dir):
+        self.run_dir = Path(run_dir)
+        self.path = self.run_dir / TRACE_NAME
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def span(self, name, **attrs):
+        return Span(self, name, attrs)
+
+    def current(self):
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def record(self, name, start_us, duration_us, **attrs):
+        """Write a finished span - also used for work timed somewhere else (pool workers)"""
+        event = {
+            "name": name,
+            "start_us": start_us,
+            "dur_us": duration_us,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        event.update({k: v for k, v in attrs.items() if v is not None})
+        line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            # One O_APPEND write per span keeps lines whole with several writers
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+_tracer = None
+
+def configure(run_dir):
+    """Send spans from this process to a run directory (None switches tracing off)"""
+    global _tracer
+    _tracer = Tracer(run_dir) if run_dir else None
+    if run_dir:
+        # Worker processes and child scripts pick the run up from the environment
+        os.environ[TRACE_ENV] = str(Path(run_dir).resolve())
+    else:
+        os.environ.pop(TRACE_ENV, None)
+    return _tracer
+
+def get_tracer():
+    global _tracer
+    if _tracer is None and os.environ.get(TRACE_ENV):
+        _tracer = Tracer(os.environ[TRACE_ENV])
+    return _tracer
+
+def span(name, **attrs):
+    tracer = get_tracer()
+    return tracer.span(name, **attrs) if tracer else NULL_SPAN
+
+def add_bytes(count):
+    """Credit bytes written to the innermost open span"""
+    tracer = get_tracer()
+    current = tracer.current() if tracer else None
+    if current is not None:
+        current.add_bytes(count)
+
+def traced(name=None, **span_attrs):
+    """Decorator: wrap every call in a span named after the function"""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **span_attrs):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def load_spans(run_dir):
+    path = Path(run_dir) / TRACE_NAME
+    spans = []
+    if not path.exists():
+        return spans
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+def _args(span_record):
+    skip = {"name", "start_us", "dur_us", "pid", "tid"}
+    return {k: v for k, v in span_record.items() if k not in skip}
+
+def to_chrome(spans):
+    """Chrome trace event format - open in chrome://tracing or Perfetto"""
+    return {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {
+                "name": s["name"],
+                "cat": s.get("phase") or s.get("agent") or "cipher",
+                "ph": "X",
+                "ts": s["start_us"],
+                "dur": s["dur_us"],
+                "pid": s["pid"],
+                "tid": s["tid"],
+                "args": _args(s),
+            }
+            for s in sorted(spans, key=lambda s: s["start_us"])
+        ],
+    }
+
+def to_speedscope(spans, name="Studio Cipher"):
+    """speedscope evented profiles, one per thread"""
+    frames, frame_index = [], {}
+    by_thread = defaultdict(list)
+    for s in spans:
+        by_thread[(s["pid"], s["tid"])].append(s)
+
+    profiles = []
+    for (pid, tid), thread_spans in sorted(by_thread.items()):
+        events, stack = [], []
+        # Parents first: earliest start, then longest duration
+        for s in sorted(thread_spans, key=lambda s: (s["start_us"], -s["dur_us"])):
+            start, end = s["start_us"], s["start_us"] + s["dur_us"]
+            while stack and stack[-1][1] <= start:
+                frame, closed_at = stack.pop()
+                events.append({"type": "C", "frame": frame, "at": closed_at})
+            if stack:
+                end = min(end, stack[-1][1])  # clock jitter must not break nesting
+            if s["name"] not in frame_index:
+                frame_index[s["name"]] = len(frames)
+                frames.append({"name": s["name"]})
+            frame = frame_index[s["name"]]
+            events.append({"type": "O", "frame": frame, "at": start})
+            stack.append((frame, end))
+        while stack:
+            frame, closed_at = stack.pop()
+            events.append({"type": "C", "frame": frame, "at": closed_at})
+        profiles.append({
+            "type": "evented",
+            "name": f"pid {pid} / thread {tid}",
+            "unit": "microseconds",
+            "startValue": events[0]["at"],
+            "endValue": max(e["at"] for e in events),
+            "events": events,
+        })
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    }
+
+def summarize(spans):
+    """Total time, calls and bytes written (children included) per span name, slowest first"""
+    totals = defaultdict(lambda: {"calls": 0, "dur_us": 0, "bytes": 0})
+    for s in spans:
+        entry = totals[s["name"]]
+        entry["calls"] += 1
+        entry["dur_us"] += s["dur_us"]
+        entry["bytes"] += s.get("bytes", 0)
+    return sorted(totals.items(), key=lambda item: item[1]["dur_us"], reverse=True)
+
+def main():
+    from build_manifest import write_text_atomic  # build_manifest traces through this module
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 2 or args[0] not in ("summary", "export"):
+        print("🎤 Usage: python cipher_trace.py summary <run_dir>")
+        print("         python cipher_trace.py export <run_dir> [--speedscope]")
+        sys.exit(1)
+
+    command, run_dir = args
+    spans = load_spans(run_dir)
+    if not spans:
+        print(f"❌ No spans in {Path(run_dir) / TRACE_NAME}")
+        sys.exit(1)
+
+    if command == "summary":
+        print(f"⏱️ {len(spans)} spans in {run_dir}")
+        print(f"  {'span':<48} {'calls':>6} {'total ms':>10} {'bytes':>12}")
+        for name, entry in summarize(spans)[:30]:
+            print(f"  {name[:48]:<48} {entry['calls']:>6} {entry['dur_us'] / 1000:>10.2f} {entry['bytes']:>12,}")
+    elif "--speedscope" in sys.argv:
+        out = Path(run_dir) / "trace.speedscope.json"
+        write_text_atomic(out, json.dumps(to_speedscope(spans, Path(run_dir).name)))
+        print(f"📈 Wrote {out} - open it at https://www.speedscope.app")
+    else:
+        out = Path(run_dir) / "trace.chrome.json"
+        write_text_atomic(out, json.dumps(to_chrome(spans)))
+        print(f"📈 Wrote {out} - open it in chrome://tracing or ui.perfetto.dev")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Command Center Crew
+Designer lays out command-center.html first, then lyricist, security and producer edit it side by side
+"""
+
+import importlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from cipher_runs import STUDIO_DIR, get_latest_run
+from merge_engine import MergeConflictError, close_sessions
+
+# The checked-in app - the crew only ever edits a run's copy of it
+SOURCE_APP_DIR = STUDIO_DIR.parent / "claim_cipher_app"
+APP_NAME = "claim_cipher_app"
+# The designer writes a whole new page rather than an edit - everyone else's edits are against it
+DESIGNER = "designer_command_center"
+EDITORS = ["lyricist_command_center", "security_command_center", "producer_command_center_final"]
+
+def run_agent(module_name, app_dir):
+    """One agent script against app_dir - the script's function shares its module's name"""
+    module = importlib.import_module(module_name)
+    return getattr(module, module_name)(str(app_dir))
+
+def run_crew(app_dir, serial=False):
+    """Designer, then the editors in parallel (or one after another) - agent -> its result"""
+    page = Path(app_dir) / "command-center.html"
+    close_sessions(page)  # nothing left over from an earlier crew joins this one
+    try:
+        results = {DESIGNER: run_agent(DESIGNER, app_dir)}
+        if serial:
+            for name in EDITORS:
+                results[name] = run_agent(name, app_dir)
+            return results
+        with ProcessPoolExecutor(max_workers=len(EDITORS)) as pool:
+            futures = {name: pool.submit(run_agent, name, app_dir) for name in EDITORS}
+            results.update({name: future.result() for name, future in futures.items()})
+        return results
+    finally:
+        close_sessions(page)
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) > 1 or any(a in ("-h", "--help") for a in sys.argv[1:]):
+        print("🎤 Usage: python command_center_crew.py [<app_dir>] [--serial]")
+        print(f"   {DESIGNER}, then {', '.join(EDITORS)} merging into command-center.html at once")
+        print(f"   The app dir defaults to the latest run's {APP_NAME}/")
+        sys.exit(1)
+
+    if args:
+        app_dir = Path(args[0])
+    else:
+        latest = get_latest_run()
+        if latest is None:
+            print("❌ No runs yet - build one with build_pipeline.py, or name an app dir")
+            sys.exit(1)
+        app_dir = latest / APP_NAME
+    if app_dir.resolve() == SOURCE_APP_DIR.resolve():
+        print(f"❌ {app_dir} is the checked-in app - point the crew at a copy")
+        sys.exit(1)
+    if not (app_dir / "command-center.html").exists():
+        print(f"❌ No command-center.html in {app_dir}")
+        sys.exit(1)
+    try:
+        run_crew(app_dir, serial="--serial" in sys.argv)
+    except MergeConflictError as e:
+        print(f"❌ Command center edits could not be merged: {e}")
+        sys.exit(1)
+    print(f"\n🎤 Command center crew finished - {app_dir / 'command-center.html'}")
+
+if __name__ == "__main__":
+    main()
@@ -7,22 +7,14 @@ Complete the remaining interactive components
 import json
 from pathlib import Path
 from datetime import datetime
+from cipher_runs import get_latest_run
+from build_manifest import finish_build
+from cipher_trace import traced
+from render_pool import RenderJob, render_all, write_all
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
-
-def build_javascript_files(run_dir):
-    """Build all the JavaScript files for interactivity"""
-    created = []
-    app_dir = run_dir / "claim_cipher_app"
-    scripts_dir = app_dir / "scripts"
-    
-    # 1. Mileage Cypher JavaScript
-    mileage_js = """// 🚗 Mileage Cypher JavaScript - Calculate that money, no matter what!
+def mileage_js():
+    """Mileage Cypher JavaScript"""
+    return """// 🚗 Mileage Cypher JavaScript - Calculate that money, no matter what!
 
 let trips = [];
 let nextTripId = 1;
@@ -213,12 +205,10 @@ window.initializeMileageCypher = initializeMileageCypher;
 window.deleteTrip = deleteTrip;
 
 console.log('🚗 Mileage Cypher JavaScript loaded - Calculate that money!');"""
-    
-    (scripts_dir / "mileage-cypher.js").write_text(mileage_js, encoding="utf-8")
-    created.append("scripts/mileage-cypher.js")
 
-    # 2. Route Cypher JavaScript  
-    route_js = """// 🗺️ Route Cypher JavaScript - Optimize those routes like a pro!
+def route_js():
+    """Route Cypher JavaScript"""
+    return """// 🗺️ Route Cypher JavaScript - Optimize those routes like a pro!
 
 let selectedJobs = [];
 let optimizedRoute = null;
@@ -363,12 +353,10 @@ window.initializeRouteCypher = initializeRouteCypher;
 window.exportRoute = exportRoute;
 
 console.log('🗺️ Route Cypher JavaScript loaded - Optimize those routes!');"""
-    
-    (scripts_dir / "route-cypher.js").write_text(route_js, encoding="utf-8")
-    created.append("scripts/route-cypher.js")
 
-    # 3. Jobs Studio JavaScript
-    jobs_js = """// 📱 Jobs Studio JavaScript - Manage those jobs like a boss!
+def jobs_js():
+    """Jobs Studio JavaScript"""
+    return """// 📱 Jobs Studio JavaScript - Manage those jobs like a boss!
 
 let jobs = [];
 let activeFilter = 'all';
@@ -596,326 +584,10 @@ function saveJobs() {
 window.initializeJobsStudio = initializeJobsStudio;
 
 console.log('📱 Jobs Studio JavaScript loaded - Manage those jobs!');"""
-    
-    (scripts_dir / "jobs-studio.js").write_text(jobs_js, encoding="utf-8")
-    created.append("scripts/jobs-studio.js")
-
-    return created
-
-def build_additional_pages(run_dir):
-    """Build the remaining HTML pages"""
-    created = []
-    app_dir = run_dir / "claim_cipher_app"
-    
-    # 1. Firms Directory Page
-    firms_directory = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Firms Directory - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-</head>
-<body class="cipher-dark-theme">
-    <!-- Sidebar Cypher -->
-    <nav class="cipher-sidebar" id="cipher-sidebar">
-        <div class="sidebar-cipher-header">
-            <div class="sidebar-cipher-logo">
-                <a href="./command-center.html">🎤 Claim Cipher</a>
-            </div>
-        </div>
-        
-        <ul class="sidebar-cipher-nav">
-            <li class="sidebar-cipher-nav-item">
-                <a href="./command-center.html" class="sidebar-cipher-nav-link">
-                    <span>📊</span> Command Center
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./mileage-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🚗</span> Mileage Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./route-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🗺️</span> Route Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./jobs-studio.html" class="sidebar-cipher-nav-link">
-                    <span>📱</span> Jobs Studio
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./firms-directory.html" class="sidebar-cipher-nav-link sidebar-cipher-nav-link--active">
-                    <span>🏢</span> Firms Directory
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./settings-booth.html" class="sidebar-cipher-nav-link">
-                    <span>⚙️</span> Settings Booth
-                </a>
-            </li>
-        </ul>
-        
-        <div class="sidebar-cipher-footer">
-            <div class="sidebar-cipher-user" id="sidebar-user">
-                <div class="user-cipher-avatar" id="user-avatar">DU</div>
-                <div class="user-cipher-info">
-                    <div class="user-cipher-name" id="user-name">Demo User</div>
-                    <div class="user-cipher-role" id="user-role">Demo Mode</div>
-                </div>
-            </div>
-            <button class="sidebar-cipher-logout cipher-btn cipher-btn--ghost cipher-btn--sm" id="logout-btn">
-                <span>🚪</span> Sign Out
-            </button>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <main class="main-cipher-content">
-        <div class="page-cipher-header">
-            <h1 class="page-cipher-title">🏢 Firms Directory</h1>
-            <p class="page-cipher-subtitle">Manage insurance firm contacts and rates</p>
-        </div>
-
-        <!-- Firms Grid -->
-        <div class="cipher-grid cipher-grid--3">
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">State Farm</h3>
-                    <span class="cipher-badge cipher-badge--success">Active</span>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="firm-cipher-details">
-                        <p><strong>Mileage Rate:</strong> $0.58/mile</p>
-                        <p><strong>Contact:</strong> claims@statefarm.com</p>
-                        <p><strong>Phone:</strong> 1-800-STATE-FARM</p>
-                        <p><strong>Portal:</strong> <a href="#" class="cipher-link">Login</a></p>
-                    </div>
-                </div>
-            </div>
-
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">Allstate</h3>
-                    <span class="cipher-badge cipher-badge--success">Active</span>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="firm-cipher-details">
-                        <p><strong>Mileage Rate:</strong> $0.62/mile</p>
-                        <p><strong>Contact:</strong> adjusters@allstate.com</p>
-                        <p><strong>Phone:</strong> 1-800-ALLSTATE</p>
-                        <p><strong>Portal:</strong> <a href="#" class="cipher-link">Login</a></p>
-                    </div>
-                </div>
-            </div>
-
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">Progressive</h3>
-                    <span class="cipher-badge cipher-badge--success">Active</span>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="firm-cipher-details">
-                        <p><strong>Mileage Rate:</strong> $0.55/mile</p>
-                        <p><strong>Contact:</strong> claims@progressive.com</p>
-                        <p><strong>Phone:</strong> 1-800-PROGRESSIVE</p>
-                        <p><strong>Portal:</strong> <a href="#" class="cipher-link">Login</a></p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <script src="scripts/cipher-core.js"></script>
-    <script>
-        if (localStorage.getItem('cipher_authenticated') !== 'true') {
-            window.location.href = './login-cypher.html';
-        }
-
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeCipherUserContext();
-            setupCipherLogoutHandler();
-            showCipherNotification('Firms Directory loaded', 'success');
-        });
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "firms-directory.html").write_text(firms_directory, encoding="utf-8")
-    created.append("firms-directory.html")
-
-    # 2. Settings Booth Page  
-    settings_booth = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Settings Booth - Claim Cipher</title>
-    <link rel="stylesheet" href="styles/cipher-core.css">
-</head>
-<body class="cipher-dark-theme">
-    <!-- Sidebar Cypher -->
-    <nav class="cipher-sidebar" id="cipher-sidebar">
-        <div class="sidebar-cipher-header">
-            <div class="sidebar-cipher-logo">
-                <a href="./command-center.html">🎤 Claim Cipher</a>
-            </div>
-        </div>
-        
-        <ul class="sidebar-cipher-nav">
-            <li class="sidebar-cipher-nav-item">
-                <a href="./command-center.html" class="sidebar-cipher-nav-link">
-                    <span>📊</span> Command Center
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./mileage-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🚗</span> Mileage Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./route-cypher.html" class="sidebar-cipher-nav-link">
-                    <span>🗺️</span> Route Cypher
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./jobs-studio.html" class="sidebar-cipher-nav-link">
-                    <span>📱</span> Jobs Studio
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./firms-directory.html" class="sidebar-cipher-nav-link">
-                    <span>🏢</span> Firms Directory
-                </a>
-            </li>
-            <li class="sidebar-cipher-nav-item">
-                <a href="./settings-booth.html" class="sidebar-cipher-nav-link sidebar-cipher-nav-link--active">
-                    <span>⚙️</span> Settings Booth
-                </a>
-            </li>
-        </ul>
-        
-        <div class="sidebar-cipher-footer">
-            <div class="sidebar-cipher-user" id="sidebar-user">
-                <div class="user-cipher-avatar" id="user-avatar">DU</div>
-                <div class="user-cipher-info">
-                    <div class="user-cipher-name" id="user-name">Demo User</div>
-                    <div class="user-cipher-role" id="user-role">Demo Mode</div>
-                </div>
-            </div>
-            <button class="sidebar-cipher-logout cipher-btn cipher-btn--ghost cipher-btn--sm" id="logout-btn">
-                <span>🚪</span> Sign Out
-            </button>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <main class="main-cipher-content">
-        <div class="page-cipher-header">
-            <h1 class="page-cipher-title">⚙️ Settings Booth</h1>
-            <p class="page-cipher-subtitle">Customize your cipher experience</p>
-        </div>
 
-        <div class="cipher-grid cipher-grid--2">
-            <!-- Profile Settings -->
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">👤 Profile Settings</h3>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="cipher-form-group">
-                        <label class="cipher-label">Display Name</label>
-                        <input type="text" class="cipher-input" value="Demo User" readonly>
-                    </div>
-                    <div class="cipher-form-group">
-                        <label class="cipher-label">Email</label>
-                        <input type="email" class="cipher-input" value="demo@claimcipher.com" readonly>
-                    </div>
-                    <div class="cipher-form-group">
-                        <label class="cipher-label">License Number</label>
-                        <input type="text" class="cipher-input" value="DEMO-2024" readonly>
-                    </div>
-                </div>
-            </div>
-
-            <!-- App Preferences -->
-            <div class="cipher-card">
-                <div class="cipher-card-header">
-                    <h3 class="cipher-card-title">🎨 App Preferences</h3>
-                </div>
-                <div class="cipher-card-content">
-                    <div class="cipher-form-group">
-                        <label class="cipher-label">Theme</label>
-                        <select class="cipher-select">
-                            <option value="dark" selected>Dark Mode (Default)</option>
-                            <option value="light">Light Mode</option>
-                            <option value="auto">Auto (System)</option>
-                        </select>
-                    </div>
-                    <div class="cipher-form-group">
-                        <label class="cipher-label">Default View</label>
-                        <select class="cipher-select">
-                            <option value="dashboard" selected>Command Center</option>
-                            <option value="jobs">Jobs Studio</option>
-                            <option value="mileage">Mileage Cypher</option>
-                        </select>
-                    </div>
-                    <div class="cipher-form-group">
-                        <label class="cipher-checkbox-label">
-                            <input type="checkbox" class="cipher-checkbox" checked>
-                            <span>Enable notifications</span>
-                        </label>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Data Management -->
-        <div class="cipher-card">
-            <div class="cipher-card-header">
-                <h3 class="cipher-card-title">💾 Data Management</h3>
-            </div>
-            <div class="cipher-card-content">
-                <div class="cipher-grid cipher-grid--4">
-                    <button class="cipher-btn cipher-btn--outline">📤 Export Data</button>
-                    <button class="cipher-btn cipher-btn--outline">📥 Import Data</button>
-                    <button class="cipher-btn cipher-btn--warning">🗑️ Clear Cache</button>
-                    <button class="cipher-btn cipher-btn--danger">💣 Reset All</button>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <script src="scripts/cipher-core.js"></script>
-    <script>
-        if (localStorage.getItem('cipher_authenticated') !== 'true') {
-            window.location.href = './login-cypher.html';
-        }
-
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeCipherUserContext();
-            setupCipherLogoutHandler();
-            showCipherNotification('Settings Booth loaded', 'success');
-        });
-    </script>
-</body>
-</html>"""
-    
-    (app_dir / "settings-booth.html").write_text(settings_booth, encoding="utf-8")
-    created.append("settings-booth.html")
-
-    return created
-
-def build_css_files(run_dir):
-    """Build additional CSS files for styling"""
-    created = []
-    app_dir = run_dir / "claim_cipher_app"
-    styles_dir = app_dir / "styles"
-    
-    # Modal styles
-    modal_css = """/* 🎤 Cipher Modal Styles */
+def modal_css():
+    """Modal styles"""
+    return """/* 🎤 Cipher Modal Styles */
 .cipher-modal {
     position: fixed;
     top: 0;
@@ -1005,11 +677,54 @@ def build_css_files(run_dir):
         opacity: 1;
     }
 }"""
-    
-    (styles_dir / "cipher-modal.css").write_text(modal_css, encoding="utf-8")
-    created.append("styles/cipher-modal.css")
 
-    return created
+# Every file this builder makes, relative to the app - rendered side by side, written in this order
+JAVASCRIPT_JOBS = [
+    RenderJob("scripts/mileage-cypher.js", __file__, "mileage_js"),
+    RenderJob("scripts/route-cypher.js", __file__, "route_js"),
+    RenderJob("scripts/jobs-studio.js", __file__, "jobs_js"),
+]
+PAGE_JOBS = [
+    RenderJob("firms-directory.html", "page_fixes", "finished_page", "firms-directory.html"),
+    RenderJob("settings-booth.html", "page_fixes", "finished_page", "settings-booth.html"),
+]
+CSS_JOBS = [
+    RenderJob("styles/cipher-modal.css", __file__, "modal_css"),
+]
+
+@traced(phase="build")
+def build_javascript_files(run_dir):
+    """Build all the JavaScript files for interactivity"""
+    return write_all(run_dir, run_dir / "claim_cipher_app", render_all(JAVASCRIPT_JOBS))
+
+@traced(phase="build")
+def build_additional_pages(run_dir):
+    """Build the remaining HTML pages"""
+    return write_all(run_dir, run_dir / "claim_cipher_app", render_all(PAGE_JOBS))
+
+@traced(phase="build")
+def build_css_files(run_dir):
+    """Build additional CSS files for styling"""
+    return write_all(run_dir, run_dir / "claim_cipher_app", render_all(CSS_JOBS))
+
+# Build pipeline contract - paths are relative to the run directory
+READS = [
+    "claim_cipher_app/styles/",
+    "claim_cipher_app/scripts/",
+]
+WRITES = [
+    "claim_cipher_app/scripts/mileage-cypher.js",
+    "claim_cipher_app/scripts/route-cypher.js",
+    "claim_cipher_app/scripts/jobs-studio.js",
+    "claim_cipher_app/firms-directory.html",
+    "claim_cipher_app/settings-booth.html",
+    "claim_cipher_app/styles/cipher-modal.css",
+]
+
+@traced(phase="build")
+def build(run_dir):
+    """Run every step of this builder against a run directory - one fan-out, one write phase"""
+    return write_all(run_dir, run_dir / "claim_cipher_app", render_all(JAVASCRIPT_JOBS + PAGE_JOBS + CSS_JOBS))
 
 def main():
     print("🎤🔥 BUILDING FINAL COMPONENTS - COMPLETE THE CIPHER! 🔥🎤")
@@ -1026,6 +741,7 @@ def main():
     
     print("🎵 Building CSS components...")
     css_created = build_css_files(latest_run)
+    finish_build(latest_run)
     
     all_created = js_created + pages_created + css_created
     
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Config Cache
+Parse missions, settings and prompts once - every later startup reads a pickle
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+STUDIO_DIR = Path(__file__).resolve().parent
+CACHE_DIR = STUDIO_DIR / ".cipher_cache" / "config"
+CACHE_VERSION = 1
+
+def yaml_loader():
+    """PyYAML and its fastest safe loader - imported lazily so callers that never parse YAML skip it"""
+    import yaml
+    # libyaml's C loader is an order of magnitude faster when PyYAML was built with it
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _cache_file(path):
+    key = hashlib.sha1(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"{Path(path).name}.{key}.pickle"
+
+def _read_snapshot(cache_file):
+    try:
+        with open(cache_file, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != CACHE_VERSION:
+        return None
+    return snapshot
+
+def _write_snapshot(cache_file, snapshot):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # a read-only checkout still works, just without the speedup
+
+def cached_load(path, parse):
+    """Load a config file through the snapshot cache.
+
+    A snapshot is trusted outright when the file's mtime and size match.
+    When only the mtime moved, the bytes are hashed and the snapshot is
+    reused if the content is the same.
+    """
+    path = Path(path)
+    stat = path.stat()
+    cache_file = _cache_file(path)
+    snapshot = _read_snapshot(cache_file)
+
+    if snapshot and snapshot["mtime_ns"] == stat.st_mtime_ns and snapshot["size"] == stat.st_size:
+        return snapshot["data"]
+
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if snapshot and snapshot["sha256"] == digest:
+        data = snapshot["data"]
+    else:
+        data = parse(raw)
+
+    _write_snapshot(cache_file, {
+        "version": CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "data": data,
+    })
+    return data
+
+def parse_yaml(raw):
+    yaml, loader = yaml_loader()
+    # utf-8-sig drops the BOM some of our YAML files were saved with
+    return yaml.load(raw.decode("utf-8-sig"), Loader=loader)
+
+def load_yaml(path):
+    return cached_load(path, parse_yaml)
+
+def clear():
+    """Drop every snapshot"""
+    removed = 0
+    if CACHE_DIR.exists():
+        for cache_file in CACHE_DIR.glob("*.pickle"):
+            cache_file.unlink()
+            removed += 1
+    return removed
+
+def config_files():
+    """Everything run_mission parses on startup"""
+    files = [Path("settings.yml")]
+    files += sorted(Path("missions").glob("*.yml"))
+    files += sorted(Path("prompts").glob("*.yml"))
+    return [f for f in files if f.exists()]
+
+def benchmark(rounds=20):
+    """Time pure-Python parsing, the C loader and warm snapshots over the real config set"""
+    yaml, loader = yaml_loader()
+    files = []
+    for f in config_files():
+        try:
+            parse_yaml(f.read_bytes())
+            files.append(f)
+        except yaml.YAMLError:
+            print(f"  ⚠ Skipping {f} - not valid YAML")
+
+    def timed(load):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for f in files:
+                load(f)
+        return (time.perf_counter() - started) / rounds * 1000
+
+    def pure_python(f):
+        with open(f, 'r', encoding='utf-8-sig') as fh:
+            return yaml.safe_load(fh)
+
+    def c_loader(f):
+        return parse_yaml(f.read_bytes())
+
+    clear()
+    for f in files:
+        load_yaml(f)
+
+    return {
+        "files": len(files),
+        "yaml.safe_load": timed(pure_python),
+        "C loader": timed(c_loader),
+        "snapshot cache": timed(load_yaml),
+        "c_loader_available": loader is not yaml.SafeLoader,
+    }
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "bench"
+
+    if command == "clear":
+        print(f"🧹 Cleared {clear()} config snapshots")
+    elif command == "bench":
+        results = benchmark()
+        print("🎤 CONFIG STARTUP BENCHMARK")
+        print("=" * 50)
+        print(f"📄 {results['files']} config files (settings, missions, prompts)")
+        print(f"⚙️ libyaml C loader available: {results['c_loader_available']}")
+        baseline = results["yaml.safe_load"]
+        for label in ("yaml.safe_load", "C loader", "snapshot cache"):
+            ms = results[label]
+            print(f"  {label:<16} {ms:8.2f} ms   ({baseline / ms:5.1f}x)")
+    else:
+        print("🎤 Usage: python config_cache.py [bench|clear]")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Critical CSS
+The CSS a page's first screen needs, inlined - the rest of its stylesheet loads without blocking paint
+"""
+
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from css_cascade import parse, serialize
+from css_prune import WORD, Vocabulary, prune
+
+FOLD_BYTES = 8000       # markup after <body> that counts as the first screen
+MAX_INLINE_BYTES = 14000  # about what the first round trip of a fresh connection can carry
+# States nobody is in at first paint
+INTERACTIVE = re.compile(r":(hover|focus|focus-within|focus-visible|active|visited|checked|target)\b")
+
+class FoldVocabulary(Vocabulary):
+    """Names on the first screen only - tags and attributes of elements that open before the fold.
+
+    Scripts are left out on purpose: whatever they build shows up after
+    they run, by which time the full stylesheet is on its way.
+    """
+
+    def __init__(self, html, fold_bytes=FOLD_BYTES):
+        super().__init__()
+        body = re.search(r"<body\b", html, re.IGNORECASE)
+        self.fold = (body.start() if body else 0) + fold_bytes
+        parser = _FoldMarkup(self, html)
+        parser.feed(html)
+        parser.close()
+
+    def matches(self, selector):
+        return not INTERACTIVE.search(selector) and super().matches(selector)
+
+class _FoldMarkup(HTMLParser):
+    def __init__(self, vocabulary, html):
+        super().__init__(convert_charrefs=True)
+        self.vocabulary = vocabulary
+        self.line_starts = [0] + [m.end() for m in re.finditer("\n", html)]
+
+    def handle_starttag(self, tag, attrs):
+        line, column = self.getpos()
+        if self.line_starts[line - 1] + column > self.vocabulary.fold:
+            return
+        self.vocabulary.elements.add(tag)
+        for name, value in attrs:
+            if value and name in ("class", "id"):
+                self.vocabulary.words.update(WORD.findall(value))
+
+def critical_css(css, html, fold_bytes=FOLD_BYTES):
+    """The rules of css that can style anything above the fold of html, in their original order"""
+    return serialize(prune(parse(css), FoldVocabulary(html, fold_bytes)))
+
+def inline_tags(href, critical):
+    """Critical rules inline, the full sheet preloaded and applied once it lands"""
+    critical = re.sub(r"</(style)", r"<\\/\1", critical, flags=re.IGNORECASE)
+    return (f"<style>{critical}</style>\n"
+            f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+def main():
+    from asset_bundler import minify_css
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if len(args) < 2:
+        print("🎤 Usage: python critical_css.py <page.html> <sheet.css>... [--fold=8000]")
+        print("   Prints the minified rules the page's first screen needs")
+        sys.exit(1)
+
+    html = Path(args[0]).read_text(encoding="utf-8", errors="replace")
+    css = "\n".join(Path(sheet).read_text(encoding="utf-8", errors="replace") for sheet in args[1:])
+    critical = minify_css(critical_css(css, html, int(options.get("fold", FOLD_BYTES))))
+    print(critical)
+    print(f"⚡ {len(critical.encode('utf-8')):,} of {len(minify_css(css).encode('utf-8')):,} "
+          f"minified bytes are above the fold", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
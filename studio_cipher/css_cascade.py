@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher CSS Cascade
+Parse stylesheets, work out which declarations the cascade lets through, drop the rest
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# At-rules whose body is more rules - anything else (@font-face, @keyframes, @page) is kept whole
+NESTING_AT_RULES = {"media", "supports", "document", "-moz-document", "layer", "container"}
+COMMENT_OR_STRING = re.compile(r"""/\*.*?\*/|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'""", re.DOTALL)
+IMPORTANT = re.compile(r"\s*!\s*important\s*$", re.IGNORECASE)
+VENDOR = re.compile(r"(^|[\s:(,])-(webkit|moz|ms|o)-", re.IGNORECASE)
+PROPERTY = re.compile(r"^-?-?[a-zA-Z][\w-]*$")
+# Units and functions a browser from a few years back drops the whole declaration over
+NEWER_VALUE = re.compile(
+    r"\d(?:[dsl]v(?:h|w|i|b|min|max)|cq(?:w|h|i|b|min|max)|r?lh|rcap|rch|rex|ric)\b"
+    r"|\b(?:clamp|min|max|round|mod|rem|color-mix|light-dark|oklch|oklab|lab|lch|hwb|color|env)\(",
+    re.IGNORECASE)
+# Pseudo-classes an engine that predates them drops the whole selector list over, like a vendor one
+UNSAFE_PSEUDO = re.compile(r"::?-(?:webkit|moz|ms|o)-|:(?:has|is|where)\(|:focus-visible\b", re.IGNORECASE)
+
+class Declaration:
+    def __init__(self, prop, value, important=False):
+        self.prop = prop
+        self.value = value
+        self.important = important
+
+    def css(self):
+        return f"{self.prop}: {self.value}{' !important' if self.important else ''}"
+
+class Rule:
+    """A style rule: a selector list and its declarations"""
+
+    def __init__(self, selector, declarations):
+        self.selector = selector
+        self.declarations = declarations
+
+    def selectors(self):
+        return [normalize_selector(s) for s in split_top_level(self.selector, ",") if s.strip()]
+
+    def css(self, indent=""):
+        body = "; ".join(d.css() for d in self.declarations)
+        return f"{indent}{self.selector.strip()} {{ {body} }}"
+
+class AtRule:
+    """An at-rule: a statement (`@import ...;`), a block kept verbatim, or a block of rules"""
+
+    def __init__(self, prelude, body=None, children=None):
+        self.prelude = prelude
+        self.body = body
+        self.children = children
+
+    @property
+    def name(self):
+        return self.prelude[1:].split(None, 1)[0].split("(", 1)[0].lower() if len(self.prelude) > 1 else ""
+
+    def css(self, indent=""):
+        if self.children is not None:
+            inner = "\n".join(node.css(indent + "  ") for node in self.children)
+            return f"{indent}{self.prelude} {{\n{inner}\n{indent}}}"
+        if self.body is None:
+            return f"{indent}{self.prelude};"
+        return f"{indent}{self.prelude} {{{self.body}}}"
+
+def normalize_selector(selector):
+    selector = re.sub(r"\s+", " ", selector).strip()
+    return re.sub(r" ?([>~]) ?(?!=)", r"\1", selector)
+
+def strip_comments(css):
+    return COMMENT_OR_STRING.sub(lambda m: " " if m.group(0).startswith("/*") else m.group(0), css)
+
+def split_top_level(text, separator):
+    """Split on separator outside strings, parentheses and brackets"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(text):
+        if quote:
+            if char == "\\":
+                continue
+            if char == quote and text[i - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth = max(depth - 1, 0)
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+def _scan_until(css, i, stops):
+    """Index of the first stop character at depth 0 outside strings, or len(css)"""
+    depth, quote = 0, None
+    while i < len(css):
+        char = css[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth = max(depth - 1, 0)
+        elif char in stops and depth == 0:
+            return i
+        i += 1
+    return i
+
+def _matching_brace(css, i):
+    """Index just past the `}` closing the `{` at i"""
+    depth = 0
+    while i < len(css):
+        stop = _scan_until(css, i, "{}")
+        if stop >= len(css):
+            return len(css)
+        depth += 1 if css[stop] == "{" else -1
+        i = stop + 1
+        if depth == 0:
+            return i
+    return i
+
+def parse_declarations(body):
+    declarations = []
+    for chunk in split_top_level(body, ";"):
+        if ":" not in chunk:
+            continue  # browsers drop it too
+        prop, value = chunk.split(":", 1)
+        prop = prop.strip()
+        important = bool(IMPORTANT.search(value))
+        value = IMPORTANT.sub("", value).strip()
+        if prop and value and not re.search(r"\s", prop):
+            declarations.append(Declaration(prop, value, important))
+    return declarations
+
+def parse(css):
+    """Stylesheet text -> list of Rule and AtRule nodes, tolerant the way browsers are"""
+    return _parse_block(strip_comments(css), 0)[0]
+
+def _parse_block(css, i, nested=False):
+    nodes = []
+    while i < len(css):
+        while i < len(css) and css[i].isspace():
+            i += 1
+        if i >= len(css):
+            break
+        if nested and css[i] == "}":
+            return nodes, i + 1
+        # Like a browser: a style rule's prelude runs to its `{` - a stray `}` or `;` at the
+        # top level becomes part of the next selector, which then matches nothing
+        at_rule = css[i] == "@"
+        stop = _scan_until(css, i, ("{;" if at_rule else "{") + ("}" if nested else ""))
+        prelude = css[i:stop].strip()
+        if stop >= len(css) or css[stop] == "}":
+            i = stop  # trailing junk without a body
+            continue
+        if css[stop] == ";":
+            nodes.append(AtRule(prelude))
+            i = stop + 1
+            continue
+        end = _matching_brace(css, stop)
+        if at_rule and AtRule(prelude).name in NESTING_AT_RULES:
+            children, _ = _parse_block(css[:end - 1], stop + 1, nested=True)
+            nodes.append(AtRule(prelude, children=children))
+        elif at_rule:
+            nodes.append(AtRule(prelude, body=css[stop + 1:end - 1]))
+        else:
+            nodes.append(Rule(prelude, parse_declarations(css[stop + 1:end - 1])))
+        i = end
+    return nodes, i
+
+def serialize(nodes):
+    return "\n".join(node.css() for node in nodes) + "\n" if nodes else ""
+
+def _walk(nodes, context=()):
+    """(context, node) for every rule and verbatim at-rule, in source order"""
+    for node in nodes:
+        if isinstance(node, AtRule) and node.children is not None:
+            yield from _walk(node.children, context + (re.sub(r"\s+", " ", node.prelude),))
+        else:
+            yield context, node
+
+def property_key(prop):
+    """Properties are case-insensitive, custom properties (`--Gap` vs `--gap`) are not"""
+    return prop if prop.startswith("--") else prop.lower()
+
+def _can_override(rule, declaration):
+    """A browser throws away rules and values it does not know - those must not hide anything.
+
+    A selector list with a vendor pseudo-class is dropped whole by every
+    other engine, one with `:has()`, `:is()`, `:where()` or
+    `:focus-visible` by older ones. A vendor-prefixed value or property
+    may be too, and `*zoom` or `\\9` hacks only ever meant something to
+    old IE. A value using a newer unit or function (`100dvh`, `clamp()`)
+    is dropped by older browsers, so an earlier `height: 100vh` is their
+    fallback.
+    """
+    if len(rule.selectors()) > 1 and UNSAFE_PSEUDO.search(rule.selector):
+        return False
+    if not PROPERTY.match(declaration.prop) or "\\" in declaration.value:
+        return False
+    if NEWER_VALUE.search(declaration.value):
+        return False
+    return not VENDOR.search(declaration.prop) and not VENDOR.search(declaration.value)
+
+class Cascade:
+    """The effective cascade of one ordered stylesheet.
+
+    Walking the rules from last to first, a declaration is dead when, for
+    every selector it applies to, a later declaration in the same media
+    context sets the same property and wins: later order at the same
+    importance, or `!important` over normal. Same selector means same
+    specificity, so the winner applies wherever the loser would have.
+    Repeats inside one rule are left alone (`display: -webkit-box;
+    display: flex` is a fallback, not an override) unless identical. A
+    later @keyframes with the same name replaces an earlier one whole.
+    """
+
+    def __init__(self, css):
+        self.nodes = parse(css)
+        self.rules_before = sum(1 for _, node in _walk(self.nodes))
+        self.declarations_before = self._count()
+        self.dropped = []  # (context, selector, declaration)
+        self._consolidate()
+
+    def _count(self):
+        return sum(len(node.declarations) for _, node in _walk(self.nodes) if isinstance(node, Rule))
+
+    def _consolidate(self):
+        later = {}       # (context, selector, property) -> a later declaration is !important
+        keyframes = set()
+        dead_keyframes = set()
+        for context, node in reversed(list(_walk(self.nodes))):
+            if isinstance(node, AtRule):
+                if node.name.endswith("keyframes") and node.body is not None:
+                    key = (context, node.prelude.split()[0].lower(), node.prelude.split(None, 1)[-1].strip())
+                    if key in keyframes:
+                        dead_keyframes.add(id(node))
+                    keyframes.add(key)
+                continue
+
+            selectors = node.selectors()
+            kept, seen_here = [], {}
+            for declaration in reversed(node.declarations):
+                prop = property_key(declaration.prop)
+                value = re.sub(r"\s+", " ", declaration.value)
+                if prop in seen_here and seen_here[prop] == (value, declaration.important):
+                    self.dropped.append((context, node.selector, declaration))
+                    continue
+                keys = [(context, selector, prop) for selector in selectors]
+                if keys and all(key in later and (later[key] or not declaration.important) for key in keys):
+                    self.dropped.append((context, node.selector, declaration))
+                    continue
+                seen_here.setdefault(prop, (value, declaration.important))
+                kept.append(declaration)
+            node.declarations = list(reversed(kept))
+            for declaration in node.declarations:
+                if _can_override(node, declaration):
+                    for selector in selectors:
+                        key = (context, selector, property_key(declaration.prop))
+                        later[key] = later.get(key, False) or declaration.important
+        self.nodes = self._prune(self.nodes, dead_keyframes)
+        self.rules_after = sum(1 for _, node in _walk(self.nodes))
+        self.declarations_after = self._count()
+
+    def _prune(self, nodes, dead_keyframes):
+        """Drop rules left without declarations and at-rule blocks left without rules"""
+        kept = []
+        for node in nodes:
+            if isinstance(node, Rule) and not node.declarations:
+                continue
+            if isinstance(node, AtRule):
+                if id(node) in dead_keyframes:
+                    continue
+                if node.children is not None:
+                    node.children = self._prune(node.children, dead_keyframes)
+                    if not node.children:
+                        continue
+            kept.append(node)
+        return kept
+
+    def css(self):
+        return serialize(self.nodes)
+
+    def stats(self):
+        return {"rules_before": self.rules_before, "rules_after": self.rules_after,
+                "declarations_before": self.declarations_before, "declarations_after": self.declarations_after}
+
+def consolidate(css):
+    """One stylesheet with every overridden declaration removed"""
+    return Cascade(css).css()
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if not args:
+        print("🎤 Usage: python css_cascade.py <sheet.css>... [--out=consolidated.css] [--show-dropped]")
+        print("   Sheets are read in the order given - the order a page links them")
+        sys.exit(1)
+
+    css = "\n".join(Path(arg).read_text(encoding="utf-8", errors="replace") for arg in args)
+    cascade = Cascade(css)
+    consolidated = cascade.css()
+    if "out" in options:
+        Path(options["out"]).write_text(consolidated, encoding="utf-8")
+    else:
+        sys.stdout.write(consolidated)
+
+    stats = cascade.stats()
+    print(f"🎨 {len(args)} sheets: {stats['rules_before']} → {stats['rules_after']} rules, "
+          f"{stats['declarations_before']} → {stats['declarations_after']} declarations "
+          f"({len(css.encode('utf-8')):,} → {len(consolidated.encode('utf-8')):,} bytes)", file=sys.stderr)
+    if "--show-dropped" in sys.argv:
+        for context, selector, declaration in reversed(cascade.dropped):
+            where = " ".join(context + (re.sub(r"\s+", " ", selector).strip(),))
+            print(f"  ➖ {where} {{ {declaration.css()} }}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher CSS Prune
+Strip selectors that nothing on a page - markup or script - can ever match
+"""
+
+import fnmatch
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from css_cascade import AtRule, Rule, parse, serialize, split_top_level
+
+WORD = re.compile(r"[A-Za-z_][\w-]*")
+# `toast-${type}` and 'status-' + status build class names at runtime - keep every class with that prefix
+DYNAMIC_PREFIX = re.compile(r"""([A-Za-z_][\w-]*[-_])(?:\$\{|['"]\s*\+)""")
+SELECTOR_PART = re.compile(r"""\\.|\[[^\]]*\]|\((?:[^()]|\([^()]*\))*\)|::?[\w-]+|[.#][\w-]+|[A-Za-z][\w-]*|.""", re.DOTALL)
+VENDOR_PSEUDO = re.compile(r"::?-(webkit|moz|ms|o)-")
+ALWAYS_PRESENT = {"html", "head", "body", "*"}
+
+class _Markup(HTMLParser):
+    def __init__(self, vocabulary):
+        super().__init__(convert_charrefs=True)
+        self.vocabulary = vocabulary
+        self.in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        self.vocabulary.elements.add(tag)
+        self.in_script = tag == "script"
+        for name, value in attrs:
+            if value and name != "style":
+                # class and id, but also onclick handlers and data-* that hand names to scripts
+                self.vocabulary.add_script(value)
+
+    def handle_endtag(self, tag):
+        self.in_script = False
+
+    def handle_data(self, data):
+        if self.in_script:
+            self.vocabulary.add_script(data)
+
+class Vocabulary:
+    """Every class, id and element a page can end up with.
+
+    Markup contributes its tags and attribute values; scripts contribute
+    every word they contain, so a class that only appears in a template
+    literal or a classList call still counts. `prefix-${x}` and
+    `'prefix-' + x` keep the whole prefix family, and the safelist covers
+    names no page or script spells out.
+    """
+
+    def __init__(self, safelist=()):
+        self.words = set()
+        self.elements = set(ALWAYS_PRESENT)
+        self.prefixes = set()
+        self.safelist = list(safelist)
+
+    def add_markup(self, html):
+        parser = _Markup(self)
+        parser.feed(html)
+        parser.close()
+
+    def add_script(self, source):
+        self.words.update(WORD.findall(source))
+        self.prefixes.update(DYNAMIC_PREFIX.findall(source))
+
+    def has_name(self, name):
+        return (name in self.words
+                or any(name.startswith(prefix) for prefix in self.prefixes)
+                or any(fnmatch.fnmatchcase(name, pattern) for pattern in self.safelist))
+
+    def has_element(self, tag):
+        tag = tag.lower()
+        return tag in self.elements or tag in self.words
+
+    def matches(self, selector):
+        """False only when some class, id or element the selector needs can never exist"""
+        for part in SELECTOR_PART.findall(selector):
+            if part.startswith("\\"):
+                return True  # escaped names - not worth guessing
+            if part.startswith((".", "#")) and len(part) > 1:
+                if not self.has_name(part[1:]):
+                    return False
+            elif part[0].isalpha() and not self.has_element(part):
+                return False
+        return True
+
+def prune(nodes, vocabulary):
+    """Drop unmatched selectors, rules left with none, and @keyframes nothing animates with"""
+    nodes = _prune_rules(nodes, vocabulary)
+    used = set()
+    _animation_names(nodes, used)
+    return _prune_keyframes(nodes, used | vocabulary.words)
+
+def _prune_rules(nodes, vocabulary):
+    kept = []
+    for node in nodes:
+        if isinstance(node, Rule):
+            selectors = [s for s in split_top_level(node.selector, ",") if s.strip()]
+            matching = [s for s in selectors if vocabulary.matches(s)]
+            if not matching:
+                continue
+            if len(matching) < len(selectors) and not VENDOR_PSEUDO.search(node.selector):
+                # A list with a vendor pseudo stays whole - dropping that one selector
+                # would revive a rule other engines throw away
+                node.selector = ",".join(s.strip() for s in matching)
+        elif isinstance(node, AtRule) and node.children is not None:
+            node.children = _prune_rules(node.children, vocabulary)
+            if not node.children:
+                continue
+        kept.append(node)
+    return kept
+
+def _animation_names(nodes, used):
+    for node in nodes:
+        if isinstance(node, Rule):
+            for declaration in node.declarations:
+                if declaration.prop.lower() in ("animation", "animation-name") or \
+                        declaration.prop.lower().endswith(("-animation", "-animation-name")):
+                    used.update(WORD.findall(declaration.value))
+        elif isinstance(node, AtRule) and node.children is not None:
+            _animation_names(node.children, used)
+
+def _prune_keyframes(nodes, used):
+    kept = []
+    for node in nodes:
+        if isinstance(node, AtRule):
+            if node.name.endswith("keyframes") and node.body is not None:
+                name = node.prelude.split(None, 1)[-1].strip().strip("'\"")
+                if name not in used:
+                    continue
+            elif node.children is not None:
+                node.children = _prune_keyframes(node.children, used)
+        kept.append(node)
+    return kept
+
+def prune_css(css, vocabulary):
+    return serialize(prune(parse(css), vocabulary))
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    pages = [a for a in args if a.lower().endswith((".html", ".htm"))]
+    scripts = [a for a in args if a.lower().endswith(".js")]
+    sheets = [a for a in args if a.lower().endswith(".css")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if not pages or not sheets:
+        print("🎤 Usage: python css_prune.py <page.html>... [<script.js>...] <sheet.css>... "
+              "[--safelist=a,b-*] [--out=pruned.css]")
+        print("   Keeps the rules the given pages and scripts can match; sheets in link order")
+        sys.exit(1)
+
+    vocabulary = Vocabulary([p for p in options.get("safelist", "").split(",") if p])
+    for page in pages:
+        vocabulary.add_markup(Path(page).read_text(encoding="utf-8", errors="replace"))
+    for script in scripts:
+        vocabulary.add_script(Path(script).read_text(encoding="utf-8", errors="replace"))
+    css = "\n".join(Path(sheet).read_text(encoding="utf-8", errors="replace") for sheet in sheets)
+    pruned = prune_css(css, vocabulary)
+    if "out" in options:
+        Path(options["out"]).write_text(pruned, encoding="utf-8")
+    else:
+        sys.stdout.write(pruned)
+    before, after = len(css.encode("utf-8")), len(pruned.encode("utf-8"))
+    print(f"✂️ {before:,} → {after:,} bytes ({before - after:,} saved)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,9 @@ Creating modern dashboard layout and professional styling
 
 import os
 from datetime import datetime
+from merge_engine import commit_edit, report
 
-def designer_command_center():
+def designer_command_center(app_dir="C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"):
     """Designer Agent enhances Command Center with modern dashboard design"""
     
     print("🎨" * 50)
@@ -18,12 +19,14 @@ def designer_command_center():
     print("🎯 MISSION: Modern layout with professional Claim Cipher branding")
     print("📐 APPROACH: Cards/tiles, responsive grid, mobile-first design")
     
-    app_dir = "C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"
-    
     # Read existing command center to understand current structure
     command_center_path = f"{app_dir}/command-center.html"
     
     print("🔍 Designer Agent: Analyzing existing Command Center...")
+    base_html = ""
+    if os.path.exists(command_center_path):
+        with open(command_center_path, 'r', encoding='utf-8') as f:
+            base_html = f.read()
     
     # Create enhanced Command Center with modern dashboard design
     enhanced_command_center = '''<!DOCTYPE html>
@@ -804,9 +807,8 @@ def designer_command_center():
 </body>
 </html>'''
     
-    # Write the enhanced command center
-    with open(command_center_path, 'w', encoding='utf-8') as f:
-        f.write(enhanced_command_center)
+    # Merge against the page we read - other agents may be editing it right now
+    report(commit_edit(command_center_path, "designer", base_html, enhanced_command_center), "Designer Agent: ")
     
     print("✅ Designer Agent: Enhanced Command Center layout created")
     print("🎨 DESIGN FEATURES IMPLEMENTED:")
@@ -7,14 +7,11 @@ Fix the remaining deliverables and get to 100%
 import json
 from pathlib import Path
 from datetime import datetime
+from cipher_runs import get_latest_run
+from build_manifest import finish_build, write_artifact
+from cipher_trace import traced
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
-
+@traced(phase="build")
 def create_missing_deliverables(run_dir):
     """Create the final missing deliverables"""
     created = []
@@ -317,7 +314,7 @@ def create_missing_deliverables(run_dir):
     
     for filename, content in css_modules.items():
         css_file = styles_dir / filename
-        css_file.write_text(content, encoding="utf-8")
+        write_artifact(run_dir, css_file, content)
         created.append(f"styles/components/{filename}")
     
     # 2. Create API documentation
@@ -584,7 +581,7 @@ components:
     
     api_dir = run_dir / "backend" / "server" / "docs" / "api"
     api_dir.mkdir(parents=True, exist_ok=True)
-    (api_dir / "openapi.yaml").write_text(api_docs, encoding="utf-8")
+    write_artifact(run_dir, api_dir / "openapi.yaml", api_docs)
     created.append("docs/api/openapi.yaml")
     
     # 3. Create security middleware
@@ -765,11 +762,27 @@ module.exports = SecurityMiddleware;"""
     
     middleware_dir = run_dir / "backend" / "server" / "middleware"
     middleware_dir.mkdir(parents=True, exist_ok=True)
-    (middleware_dir / "security-middleware.js").write_text(security_middleware, encoding="utf-8")
+    write_artifact(run_dir, middleware_dir / "security-middleware.js", security_middleware)
     created.append("server/middleware/security-middleware.js")
     
     return created
 
+# Build pipeline contract - paths are relative to the run directory
+READS = []
+WRITES = [
+    "frontend/src/styles/components/LoginCypher.module.css",
+    "frontend/src/styles/components/DashboardStage.module.css",
+    "frontend/src/styles/components/JobsStudio.module.css",
+    "backend/server/docs/api/openapi.yaml",
+    "backend/server/middleware/security-middleware.js",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created += create_missing_deliverables(run_dir)
+    return created
+
 def main():
     print("🎤🔥 FINAL COMPLETION - Getting to 100%! 🔥🎤")
     
@@ -778,6 +791,7 @@ def main():
     
     print("\n🎵 Creating final missing deliverables...")
     created = create_missing_deliverables(latest_run)
+    finish_build(latest_run)
     
     print(f"\n✅ Created {len(created)} final deliverables:")
     for item in created:
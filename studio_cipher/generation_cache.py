@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Generation Cache
+Agent generations keyed by prompt, mission, backend, model and role - shared by every run
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+STUDIO_DIR = Path(__file__).resolve().parent
+CACHE_DIR = STUDIO_DIR / ".cipher_cache" / "generations"
+CACHE_VERSION = 2
+
+def _digest(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def generation_key(model, agent, prompt, mission, request=None, backend=None):
+    """Everything that can change an agent's output - a different value is a different generation.
+
+    The whole prompt and mission documents are hashed, not just the parts
+    the request quotes, so any edit to them regenerates. `backend` names who
+    answers: the same model name behind the stand-in and behind a real API
+    are different generations.
+    """
+    return _digest({
+        "version": CACHE_VERSION,
+        "backend": backend,
+        "model": model,
+        "agent": agent,
+        "role": (prompt or {}).get("role", agent),
+        "prompt": _digest(prompt),
+        "mission": _digest(mission),
+        "request": request,
+    })
+
+class GenerationCache:
+    """One JSON file per generation, evicted least-recently-used.
+
+    A hit bumps the entry's mtime, so mtime order is recency order. Once the
+    cache holds more than `max_bytes` or `max_entries`, the oldest entries go
+    until it is back under 90% of both. Puts keep a running size and count,
+    so the directory is only swept when a limit looks crossed.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=64 * 1024 * 1024, max_entries=5000):
+        self.cache_dir = STUDIO_DIR / (cache_dir or CACHE_DIR)  # a relative dir is under studio_cipher
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._bytes = self._count = None  # running totals - counted on the first put
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # most recently used
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("version") == CACHE_VERSION else None
+
+    def put(self, key, text, model, usage=None, **info):
+        entry = {"version": CACHE_VERSION, "key": key, "text": text, "model": model,
+                 "usage": usage or {}, "stored_at": time.time(), **info}
+        path = self._path(key)
+        data = json.dumps(entry).encode("utf-8")
+        if self._count is None:
+            self._tally()
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            return entry  # a read-only checkout still runs, just uncached
+        self._bytes += len(data) - (replaced or 0)
+        self._count += replaced is None
+        # Other runs share the directory, so the totals can lag - the sweep recounts
+        if self._bytes > self.max_bytes or self._count > self.max_entries:
+            self.evict()
+        return entry
+
+    def _tally(self):
+        entries = self.entries()
+        self._bytes = sum(size for _, size, _ in entries)
+        self._count = len(entries)
+        return entries
+
+    def entries(self):
+        """(mtime, size, path) for every entry, least recently used first"""
+        found = []
+        if not self.cache_dir.exists():
+            return found
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue  # evicted by another run meanwhile
+                    found.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        found.sort()
+        return found
+
+    def evict(self):
+        entries = self._tally()
+        total = self._bytes
+        if total <= self.max_bytes and len(entries) <= self.max_entries:
+            return 0
+        removed = 0
+        target_bytes, target_entries = self.max_bytes * 0.9, self.max_entries * 0.9
+        for _, size, path in entries:
+            if total <= target_bytes and len(entries) - removed <= target_entries:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._bytes, self._count = total, len(entries) - removed
+        return removed
+
+    def stats(self):
+        entries = self.entries()
+        return {"entries": len(entries), "bytes": sum(size for _, size, _ in entries),
+                "max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+    def clear(self):
+        removed = 0
+        for _, _, path in self.entries():
+            os.unlink(path)
+            removed += 1
+        self._bytes = self._count = None
+        return removed
+
+def cache_from_settings(settings):
+    """GenerationCache for settings.yml `models.cache` - None when it is switched off"""
+    config = (settings or {}).get("models", {}).get("cache", {})
+    if not config.get("enabled", True):
+        return None
+    return GenerationCache(config.get("dir"), int(config.get("max_mb", 64) * 1024 * 1024),
+                           config.get("max_entries", 5000))
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command not in ("stats", "clear"):
+        print("🎤 Usage: python generation_cache.py stats|clear")
+        sys.exit(1)
+
+    from config_cache import load_yaml
+    cache = cache_from_settings(load_yaml("settings.yml")) or GenerationCache()
+    if command == "clear":
+        print(f"🧹 Removed {cache.clear()} cached generations from {cache.cache_dir}")
+        return
+    stats = cache.stats()
+    print(f"🗄️ {stats['entries']:,} generations, {stats['bytes'] / 1024:.1f} KB in {cache.cache_dir}")
+    print(f"   limits: {stats['max_entries']:,} entries / {stats['max_bytes'] / 1024 / 1024:.0f} MB (LRU)")
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,9 @@ Adding JavaScript functionality and module integration
 
 import os
 from datetime import datetime
+from merge_engine import commit_edit, report
 
-def lyricist_command_center():
+def lyricist_command_center(app_dir="C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"):
     """Lyricist Agent adds JavaScript functionality to Command Center"""
     
     print("📝" * 50)
@@ -18,8 +19,6 @@ def lyricist_command_center():
     print("🎯 MISSION: JavaScript integration, navigation, statistics, activity feed")
     print("⚡ APPROACH: Event handling, localStorage integration, module communication")
     
-    app_dir = "C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"
-    
     print("🔍 Lyricist Agent: Enhancing Command Center with JavaScript...")
     
     # Create enhanced JavaScript functionality file
@@ -726,15 +725,15 @@ function handleLogout() {
     command_center_path = f"{app_dir}/command-center.html"
     
     with open(command_center_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+        base_html = f.read()
+    html_content = base_html
     
     # Add script tag before closing body tag
     script_tag = '\n    <script src="scripts/command-center.js"></script>\n</body>'
     html_content = html_content.replace('</body>', script_tag)
     
-    # Write updated HTML
-    with open(command_center_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Merge against the page we read - other agents may be editing it right now
+    report(commit_edit(command_center_path, "lyricist", base_html, html_content), "Lyricist Agent: ")
     
     print("✅ Lyricist Agent: JavaScript integrated into Command Center")
     
@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def fix_javascript_issues():
     """Lyricist Agent fixes JavaScript functionality problems"""
     
@@ -233,5 +235,4 @@ if __name__ == "__main__":
     result = fix_javascript_issues()
     
     # Save results
-    with open('runs/20250813_203814/lyricist/javascript_fixes.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/lyricist/javascript_fixes.json', json.dumps(result, indent=2))
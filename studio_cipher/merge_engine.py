@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Merge Engine
+Line-level merge of agent edits to a shared file - the hierarchy settles overlapping hunks
+"""
+
+import hashlib
+import shutil
+import sys
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from build_manifest import write_atomic
+
+DISK = "(on disk)"  # edits already on disk from another session - loses every conflict
+MERGE_DIR = ".cipher_merge"
+
+class Hunk:
+    """Replace base lines [start, end) with `lines` - start == end is a pure insertion"""
+
+    def __init__(self, agent, start, end, lines):
+        self.agent = agent
+        self.start = start
+        self.end = end
+        self.lines = lines
+
+    @property
+    def is_insert(self):
+        return self.start == self.end
+
+    def same_edit(self, other):
+        return (self.start, self.end, self.lines) == (other.start, other.end, other.lines)
+
+    def __repr__(self):
+        return f"Hunk({self.agent}, {self.start}:{self.end}, +{len(self.lines)})"
+
+class Conflict:
+    """Overlapping hunks from several agents and who got the final word"""
+
+    def __init__(self, start, end, winner, overruled):
+        self.start = start
+        self.end = end
+        self.winner = winner
+        self.overruled = overruled
+
+    def __repr__(self):
+        return f"Conflict(base lines {self.start + 1}-{self.end}: {self.winner} over {', '.join(self.overruled)})"
+
+class MergeConflictError(Exception):
+    """A conflict the hierarchy cannot settle: the winner only inserts lines, so taking
+    its side would quietly bring back base lines another agent deleted"""
+
+    def __init__(self, conflict):
+        super().__init__(f"{conflict} - {conflict.winner} only inserts where "
+                         f"{', '.join(conflict.overruled)} removed lines")
+        self.conflict = conflict
+
+class MergeResult:
+    def __init__(self, text, applied, combined, conflicts):
+        self.text = text
+        self.applied = applied
+        self.combined = combined
+        self.conflicts = conflicts
+
+    @property
+    def clean(self):
+        return not self.conflicts
+
+def hierarchy_ranks(settings):
+    """agent -> rank from settings.yml conflict_resolution.hierarchy (1 has the final word)"""
+    hierarchy = (settings or {}).get("conflict_resolution", {}).get("hierarchy", {})
+    return {agent: int(rank) for rank, agent in hierarchy.items()}
+
+def line_hunks(agent, base_lines, lines):
+    matcher = SequenceMatcher(None, base_lines, lines, autojunk=False)
+    return [Hunk(agent, i1, i2, lines[j1:j2])
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+def _clusters(hunks):
+    """Group hunks whose base ranges overlap; insertions at one spot group together"""
+    clusters = []
+    for hunk in sorted(hunks, key=lambda h: (h.start, h.end)):
+        if clusters:
+            current = clusters[-1]
+            start = min(h.start for h in current)
+            end = max(h.end for h in current)
+            overlaps = hunk.start < end
+            same_insert_point = hunk.is_insert and start == end == hunk.start
+            if overlaps or same_insert_point:
+                current.append(hunk)
+                continue
+        clusters.append([hunk])
+    return clusters
+
+def merge_edits(base, edits, ranks=None):
+    """Merge every agent's version of `base` into one text.
+
+    Hunks that touch different base lines are all applied. Where agents'
+    hunks overlap, identical edits are applied once, and insertions at the
+    same spot are all kept (highest-ranked agent's lines first). Anything
+    else is a conflict: the best-ranked agent's hunks win that region and
+    the conflict is reported - unless the winner only inserts there while
+    someone else removes lines, which raises MergeConflictError.
+    """
+    ranks = ranks or {}
+    def rank(agent):
+        return (1, 0, agent) if agent == DISK else (0, ranks.get(agent, len(ranks) + 1), agent)
+
+    base_lines = base.splitlines(keepends=True)
+    hunks = []
+    for agent, text in edits.items():
+        hunks.extend(line_hunks(agent, base_lines, text.splitlines(keepends=True)))
+
+    chosen, combined, conflicts = [], 0, []
+    for cluster in _clusters(hunks):
+        agents = sorted({h.agent for h in cluster}, key=rank)
+        if len(agents) == 1:
+            chosen.extend(cluster)
+            continue
+
+        by_agent = {agent: [h for h in cluster if h.agent == agent] for agent in agents}
+        first = by_agent[agents[0]]
+        if all(len(hs) == len(first) and all(a.same_edit(b) for a, b in zip(hs, first))
+               for hs in by_agent.values()):
+            chosen.extend(first)  # everyone made the same change
+        elif all(h.is_insert for h in cluster):
+            lines, seen = [], set()
+            for agent in agents:
+                for hunk in by_agent[agent]:
+                    block = tuple(hunk.lines)
+                    if block not in seen:
+                        seen.add(block)
+                        lines.extend(hunk.lines)
+            chosen.append(Hunk("+".join(agents), cluster[0].start, cluster[0].start, lines))
+            combined += 1
+        else:
+            conflict = Conflict(min(h.start for h in cluster), max(h.end for h in cluster),
+                                agents[0], agents[1:])
+            if all(h.is_insert for h in first) and any(not h.is_insert for h in cluster):
+                raise MergeConflictError(conflict)
+            chosen.extend(first)
+            conflicts.append(conflict)
+
+    out, position = [], 0
+    for hunk in sorted(chosen, key=lambda h: (h.start, h.end)):
+        out.extend(base_lines[position:hunk.start])
+        out.extend(hunk.lines)
+        position = hunk.end
+    out.extend(base_lines[position:])
+    return MergeResult("".join(out), len(chosen), combined, conflicts)
+
+def merge3(base, ours, theirs, ours_agent, theirs_agent, ranks=None):
+    """Classic three-way merge of two agents' versions of base"""
+    return merge_edits(base, {ours_agent: ours, theirs_agent: theirs}, ranks)
+
+def rebase_edit(base, merged, agent, new_text):
+    """An agent's edit of `merged` redone against `base`, the text `merged` was merged from.
+
+    Lines the merge left alone map straight back; a spot inside or beside
+    lines another agent inserted maps to where that insertion sits in base,
+    so the hierarchy orders the two there. Returns None when the edit
+    changes lines another agent wrote or replaced - it has no place in base.
+    """
+    base_lines = base.splitlines(keepends=True)
+    merged_lines = merged.splitlines(keepends=True)
+    spot, kept, unplaced = {}, {}, set()
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, base_lines, merged_lines, autojunk=False).get_opcodes():
+        if tag == "equal":
+            for k in range(j2 - j1 + 1):
+                spot[j1 + k] = i1 + k
+            kept.update((j1 + k, i1 + k) for k in range(j2 - j1))
+        elif tag == "insert":
+            spot.update((j, i1) for j in range(j1, j2 + 1))
+        else:
+            unplaced.update(range(j1 + 1, j2))
+            if j1 == j2:  # base lines deleted here - before or after them is anyone's guess
+                unplaced.add(j1)
+    hunks = []
+    for hunk in line_hunks(agent, merged_lines, new_text.splitlines(keepends=True)):
+        if hunk.is_insert:
+            if hunk.start in unplaced or hunk.start not in spot:
+                return None
+            start = end = spot[hunk.start]
+        else:
+            start = kept.get(hunk.start)
+            if start is None or any(kept.get(j) != start + j - hunk.start for j in range(hunk.start, hunk.end)):
+                return None
+            end = start + hunk.end - hunk.start
+        hunks.append(Hunk(agent, start, end, hunk.lines))
+
+    out, position = [], 0
+    for hunk in hunks:
+        out.extend(base_lines[position:hunk.start])
+        out.extend(hunk.lines)
+        position = hunk.end
+    out.extend(base_lines[position:])
+    return "".join(out)
+
+def _text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+@contextmanager
+def _file_lock(lock_path):
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        try:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        except ImportError:  # Windows
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            try:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            except ImportError:
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _continued_session(sessions, agent, base, new_text):
+    """The session whose last merge is `base`, and the edit redone against that session's base"""
+    if not sessions.is_dir():
+        return None
+    for session in sorted(sessions.iterdir()):
+        merged_file = session / "merged.txt"
+        if (session / f"{agent}.edit").exists() or not merged_file.exists():
+            continue
+        if merged_file.read_text(encoding="utf-8") != base:
+            continue
+        session_base = (session / "base.txt").read_text(encoding="utf-8")
+        rebased = rebase_edit(session_base, base, agent, new_text)
+        if rebased is not None:
+            return session, session_base, rebased
+    return None
+
+def commit_edit(path, agent, base, new_text, settings=None):
+    """Write an agent's edit of `base` to `path` without clobbering concurrent agents.
+
+    Every agent that edits the same base leaves its version in
+    .cipher_merge/<file>/<base hash>/. Each commit re-merges all of them,
+    so the file ends up the same whichever agent finishes last. An agent
+    whose base is a session's merged text joins that session, its edit
+    redone against the session's base - running agents one after another
+    then gives the same file as running them at once. Changes made on
+    disk since this base's last merge are kept too, ranked below every
+    agent. An edit that cannot be merged is dropped from the session and
+    its MergeConflictError raised - the file is left as it was.
+    """
+    path = Path(path)
+    if settings is None:
+        from config_cache import load_yaml
+        settings_file = Path(__file__).resolve().parent / "settings.yml"
+        settings = load_yaml(settings_file) if settings_file.exists() else {}
+    ranks = hierarchy_ranks(settings)
+
+    sessions = path.parent / MERGE_DIR / path.name
+    with _file_lock(path.parent / MERGE_DIR / f"{path.name}.lock"):
+        continued = _continued_session(sessions, agent, base, new_text)
+        if continued:
+            session, base, new_text = continued
+        else:
+            session = sessions / _text_hash(base)
+            session.mkdir(parents=True, exist_ok=True)
+            (session / "base.txt").write_text(base, encoding="utf-8")
+        edit_file = session / f"{agent}.edit"
+        edit_file.write_text(new_text, encoding="utf-8")
+        edits = {p.stem: p.read_text(encoding="utf-8") for p in sorted(session.glob("*.edit"))}
+        merged_file = session / "merged.txt"
+        previous = merged_file.read_text(encoding="utf-8") if merged_file.exists() else base
+        current = path.read_text(encoding="utf-8") if path.exists() else previous
+        try:
+            result = merge_edits(base, edits, ranks)
+            if current != previous:
+                # Someone outside this session wrote the file since - keep their changes as well
+                outside = merge_edits(previous, {agent: result.text, DISK: current}, ranks)
+                result.conflicts.extend(outside.conflicts)
+                merged_text, result.text = result.text, outside.text
+            else:
+                merged_text = result.text
+        except MergeConflictError:
+            edit_file.unlink()
+            raise
+        merged_file.write_text(merged_text, encoding="utf-8")
+        write_atomic(path, result.text.encode("utf-8"))
+    return result
+
+def close_sessions(path):
+    """The merge of `path` is done - drop its sessions so no later edit joins them"""
+    path = Path(path)
+    merge_dir = path.parent / MERGE_DIR
+    shutil.rmtree(merge_dir / path.name, ignore_errors=True)
+    (merge_dir / f"{path.name}.lock").unlink(missing_ok=True)
+    try:
+        merge_dir.rmdir()
+    except OSError:  # missing, or other files' sessions are still open
+        pass
+
+def report(result, label=""):
+    print(f"🔀 {label}{result.applied} hunks merged, {result.combined} shared insertions, "
+          f"{len(result.conflicts)} conflicts")
+    for conflict in result.conflicts:
+        print(f"   ⚖️ {conflict}")
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2 or any("=" not in a for a in args[1:]):
+        print("🎤 Usage: python merge_engine.py <base_file> <agent>=<edited_file> [...]")
+        print("   Merged text goes to stdout; the hierarchy comes from settings.yml")
+        sys.exit(1)
+
+    from config_cache import load_yaml
+    base = Path(args[0]).read_text(encoding="utf-8")
+    edits = {}
+    for arg in args[1:]:
+        agent, edited = arg.split("=", 1)
+        edits[agent] = Path(edited).read_text(encoding="utf-8")
+
+    try:
+        result = merge_edits(base, edits, hierarchy_ranks(load_yaml("settings.yml")))
+    except MergeConflictError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    sys.stdout.write(result.text)
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    try:
+        report(result)
+    finally:
+        sys.stdout = stdout
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Model Backend
+Bounded worker pool, token-bucket rate limit, batching and retries in front of any chat model
+"""
+
+import http.client
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import cipher_trace
+
+STANDIN_ENV = "CIPHER_MODEL_URL"
+
+class ModelError(Exception):
+    """A failed generation - retryable ones go back through the pool"""
+
+    def __init__(self, message, status=None, retryable=False, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_status(cls, status, message, retry_after=None):
+        # Throttling and server hiccups clear up on their own - client errors do not
+        return cls(f"HTTP {status}: {message}", status, status == 429 or status >= 500, retry_after)
+
+class ModelRequest:
+    """One prompt for one agent"""
+
+    def __init__(self, agent, prompt, system="", max_tokens=512, temperature=0.2):
+        self.agent = agent
+        self.prompt = prompt
+        self.system = system
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+
+    def payload(self, model):
+        messages = [{"role": "system", "content": self.system}] if self.system else []
+        messages.append({"role": "user", "content": self.prompt})
+        return {"model": model, "messages": messages,
+                "max_tokens": self.max_tokens, "temperature": self.temperature}
+
+    def __repr__(self):
+        return f"ModelRequest({self.agent}, {len(self.prompt)} chars)"
+
+class ModelResponse:
+    def __init__(self, text, model, usage=None, attempts=1, seconds=0.0):
+        self.text = text
+        self.model = model
+        self.usage = usage or {}
+        self.attempts = attempts
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"ModelResponse({self.model}, {len(self.text)} chars, attempts={self.attempts})"
+
+class TokenBucket:
+    """Refills `rate` tokens a second up to `capacity`; acquire() blocks until enough are in"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        if self.rate <= 0:
+            return 0.0  # unlimited
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+class HTTPBackend:
+    """OpenAI-compatible chat completions over keep-alive connections (one per worker thread).
+
+    With a `batch_path` the whole batch goes out as one request; without one
+    the batch is sent back to back on the worker's open connection.
+    """
+
+    def __init__(self, base_url, model, api_key=None, timeout=60, batch_path=None):
+        url = urlsplit(base_url)
+        self.scheme = url.scheme or "http"
+        self.host = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.model = model
+        self.api_key = api_key
+        self.timeout = timeout
+        self.batch_path = batch_path
+        self._local = threading.local()
+
+    @property
+    def supports_batch(self):
+        return bool(self.batch_path)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            conn = self._local.conn = conn_class(self.host, timeout=self.timeout)
+        return conn
+
+    def _post(self, path, payload):
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        body = json.dumps(payload).encode("utf-8")
+        conn = self._connection()
+        try:
+            conn.request("POST", self.prefix + path, body, headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            self._local.conn = None
+            raise ModelError(f"{type(exc).__name__}: {exc}", retryable=True) from exc
+
+        if response.status != 200:
+            raise ModelError.from_status(response.status, _error_message(data),
+                                         retry_after_seconds(response.getheader("Retry-After")))
+        return json.loads(data)
+
+    def _parse(self, body):
+        if "error" in body:
+            return ModelError.from_status(body.get("status", 500), body["error"].get("message", "unknown"))
+        return ModelResponse(body["choices"][0]["message"]["content"], body.get("model", self.model),
+                             body.get("usage"))
+
+    def complete(self, requests):
+        """One outcome per request: a ModelResponse or a ModelError"""
+        if self.batch_path and len(requests) > 1:
+            body = self._post(self.batch_path, {"requests": [r.payload(self.model) for r in requests]})
+            return [self._parse(item) for item in body["responses"]]
+
+        outcomes = []
+        for request in requests:
+            try:
+                outcomes.append(self._parse(self._post("/chat/completions", request.payload(self.model))))
+            except ModelError as exc:
+                outcomes.append(exc)
+        return outcomes
+
+def retry_after_seconds(value, now=None):
+    """Retry-After as seconds to wait - it is either seconds or an HTTP date; None when neither"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+def _error_message(data):
+    try:
+        return json.loads(data)["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        return data[:200].decode("utf-8", "replace")
+
+class ModelPool:
+    """Bounded pool of workers draining one request queue.
+
+    Each worker pulls up to `batch_size` queued requests (waiting at most
+    `batch_wait` seconds to fill a batch), takes one bucket token per request
+    and calls the backend. Retryable failures back off - honouring Retry-After
+    when the server sends one - and only the failed requests go again.
+    """
+
+    def __init__(self, backend, max_workers=8, requests_per_second=0, burst=None,
+                 batch_size=1, batch_wait=0.01, max_retries=3, backoff=0.25, max_backoff=8.0):
+        self.backend = backend
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.batch_size = batch_size if getattr(backend, "supports_batch", False) else 1
+        self.batch_wait = batch_wait
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = {"requests": 0, "batches": 0, "retries": 0, "failures": 0, "throttle_seconds": 0.0}
+        self._stats_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._workers = []
+        self._closed = False
+        self._start_lock = threading.Lock()
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def _start(self):
+        with self._start_lock:
+            if self._workers:
+                return
+            for index in range(self.max_workers):
+                worker = threading.Thread(target=self._worker, name=f"cipher-model-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(self, request):
+        if self._closed:
+            raise RuntimeError("ModelPool is closed")
+        self._start()
+        future = Future()
+        future.submitted = time.perf_counter()  # latency includes time spent queued
+        self._queue.put((request, future))
+        return future
+
+    def generate(self, request):
+        return self.submit(request).result()
+
+    def map(self, requests):
+        """Submit everything first so the pool can batch, then collect in order"""
+        futures = [self.submit(r) for r in requests]
+        return [f.result() for f in futures]
+
+    def _next_batch(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # leave the shutdown signal for this worker's next pass
+                break
+            batch.append(item)
+        return batch
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [(r, f) for r, f in self._next_batch(item) if f.set_running_or_notify_cancel()]
+            if batch:
+                self._dispatch(batch)
+
+    def _sleep_for(self, attempt, errors):
+        hinted = max((e.retry_after for e in errors if e.retry_after), default=0.0)
+        # Jitter on top of any Retry-After keeps a throttled crew from retrying in lockstep
+        return hinted + random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _dispatch(self, batch):
+        pending, attempt = batch, 0
+        while pending:
+            self._count("throttle_seconds", self.bucket.acquire(len(pending)))
+            self._count("batches")
+            self._count("requests", len(pending))
+            with cipher_trace.span("model batch", phase="model", size=len(pending), attempt=attempt + 1):
+                try:
+                    outcomes = self.backend.complete([r for r, _ in pending])
+                except ModelError as exc:
+                    outcomes = [exc] * len(pending)
+                except Exception as exc:  # a broken backend fails the batch, not the worker
+                    outcomes = [ModelError(f"{type(exc).__name__}: {exc}")] * len(pending)
+            if len(outcomes) < len(pending):
+                # A short batch answer - the requests it left out go round again
+                missing = ModelError(f"backend answered {len(outcomes)} of {len(pending)} requests", retryable=True)
+                outcomes = list(outcomes) + [missing] * (len(pending) - len(outcomes))
+
+            retry, errors = [], []
+            for (request, future), outcome in zip(pending, outcomes):
+                if isinstance(outcome, ModelResponse):
+                    outcome.attempts = attempt + 1
+                    outcome.seconds = time.perf_counter() - future.submitted
+                    future.set_result(outcome)
+                elif outcome.retryable and attempt < self.max_retries:
+                    retry.append((request, future))
+                    errors.append(outcome)
+                else:
+                    self._count("failures")
+                    future.set_exception(outcome)
+
+            if retry:
+                self._count("retries", len(retry))
+                time.sleep(self._sleep_for(attempt, errors))
+            pending, attempt = retry, attempt + 1
+
+    def close(self):
+        self._closed = True
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+def backend_from_settings(settings):
+    """HTTPBackend for settings.yml `models` - the stand-in is started on demand"""
+    models = (settings or {}).get("models", {})
+    model = models.get("default", "gpt-4o-mini")
+    if models.get("backend", "standin") == "standin":
+        base_url = os.environ.get(STANDIN_ENV)
+        if not base_url:
+            from model_standin import start_standin
+            base_url = start_standin(**models.get("standin", {})).base_url
+            # Worker processes started after this reuse the same stand-in
+            os.environ[STANDIN_ENV] = base_url
+        return HTTPBackend(base_url, model, batch_path="/chat/completions/batch")
+
+    api_key = os.getenv(models.get("api_key_env", "OPENAI_API_KEY"))
+    return HTTPBackend(models.get("base_url", "https://api.openai.com/v1"), model,
+                       api_key=api_key, timeout=models.get("timeout", 60), batch_path=models.get("batch_path"))
+
+def backend_identity(settings):
+    """Which backend answers - the stand-in's port changes every run, so it is named by kind alone"""
+    models = (settings or {}).get("models", {})
+    kind = models.get("backend", "standin")
+    if kind == "standin":
+        return {"backend": kind}
+    return {"backend": kind, "base_url": models.get("base_url", "https://api.openai.com/v1").rstrip("/")}
+
+def pool_from_settings(settings, backend=None):
+    models = (settings or {}).get("models", {})
+    return ModelPool(
+        backend or backend_from_settings(settings),
+        max_workers=models.get("max_workers", 8),
+        requests_per_second=models.get("requests_per_second", 0),
+        burst=models.get("burst"),
+        batch_size=models.get("batch_size", 1),
+        batch_wait=models.get("batch_wait_ms", 10) / 1000,
+        max_retries=models.get("max_retries", 3),
+    )
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+def shared_pool(settings):
+    """One pool per process - every agent's generations share its limits"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = pool_from_settings(settings)
+        return _shared_pool
+
+def agent_request(agent_name, prompt, mission):
+    """The generation request an agent sends for a mission"""
+    system = f"You are the {prompt.get('role', agent_name)} of Studio Cipher. {prompt.get('mission', '')}".strip()
+    lines = [f"GOAL: {mission.get('goal', '')}", "", str(mission.get('context', '')).strip()]
+    if mission.get("acceptance"):
+        lines += ["", "ACCEPTANCE:"] + [f"- {item}" for item in mission["acceptance"]]
+    if prompt.get("responsibilities"):
+        lines += ["", f"Cover your responsibilities: {', '.join(prompt['responsibilities'])}."]
+    return ModelRequest(agent_name, "\n".join(lines), system)
+
+def load_test(settings, total=400, concurrency=None, standin_options=None):
+    """Push `total` agent generations through the pool against a fresh local stand-in"""
+    from config_cache import load_yaml
+    from model_standin import start_standin
+    from pathlib import Path
+
+    models = dict(settings.get("models", {}))
+    if concurrency:
+        models["max_workers"] = concurrency
+    server = start_standin(**{**models.get("standin", {}), **(standin_options or {})})
+    backend = HTTPBackend(server.base_url, models.get("default", "gpt-4o-mini"),
+                          batch_path="/chat/completions/batch")
+
+    agents = {}
+    for prompt_file in sorted(Path("prompts").glob("*-simple.yml")):
+        agents[prompt_file.stem.replace("-simple", "")] = load_yaml(prompt_file)
+    missions = [load_yaml(m) for m in sorted(Path("missions").glob("*.yml"))]
+    base = [agent_request(a, p, m) for m in missions for a, p in agents.items()]
+    # Vary each pass so the stand-in cannot hand back the same verse
+    requests = [ModelRequest(r.agent, f"{r.prompt}\n(take {i})", r.system)
+                for i, r in ((i, base[i % len(base)]) for i in range(total))]
+
+    pool = pool_from_settings({"models": models}, backend)
+    started = time.perf_counter()
+    futures = [pool.submit(r) for r in requests]
+    latencies, failed = [], 0
+    for future in futures:
+        try:
+            latencies.append(future.result().seconds)
+        except ModelError:
+            failed += 1
+    wall = time.perf_counter() - started
+    pool.close()
+    server.shutdown()
+
+    latencies.sort()
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+    return {
+        "requests": total, "failed": failed, "wall_seconds": wall,
+        "throughput": total / wall if wall else 0.0,
+        "p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99),
+        "workers": pool.max_workers, "batch_size": pool.batch_size,
+        "pool": pool.stats, "server": server.stats,
+    }
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if args != ["bench"]:
+        print("🎤 Usage: python model_backend.py bench [--requests=400] [--concurrency=N]")
+        print("         [--batch=N] [--rps=N] [--capacity=N] [--failure-rate=0.05]")
+        sys.exit(1)
+
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    from config_cache import load_yaml
+    settings = load_yaml("settings.yml")
+    models = settings.setdefault("models", {})
+    if "batch" in options:
+        models["batch_size"] = int(options["batch"])
+    if "rps" in options:
+        models["requests_per_second"] = float(options["rps"])
+    standin = {}
+    if "capacity" in options:
+        standin["capacity"] = int(options["capacity"])
+    if "failure-rate" in options:
+        standin["failure_rate"] = float(options["failure-rate"])
+
+    concurrency = int(options["concurrency"]) if "concurrency" in options else None
+    report = load_test(settings, int(options.get("requests", 400)), concurrency, standin)
+
+    print("🎛️ MODEL BACKEND LOAD TEST (local stand-in)")
+    print("=" * 60)
+    print(f"  {report['requests']} generations, {report['workers']} workers, batch {report['batch_size']}")
+    print(f"  ⏱️ {report['wall_seconds']:.2f}s wall - {report['throughput']:.1f} generations/s")
+    print(f"  📈 latency p50 {report['p50'] * 1000:.0f} ms / p95 {report['p95'] * 1000:.0f} ms / "
+          f"p99 {report['p99'] * 1000:.0f} ms")
+    pool, server = report["pool"], report["server"]
+    print(f"  📦 {pool['batches']} batches, {pool['retries']} retries, {pool['failures']} failed, "
+          f"{pool['throttle_seconds']:.2f}s waiting on the rate limit")
+    print(f"  🖥️ stand-in: {server['requests']} HTTP requests, {server['throttled']} throttled (429)")
+    if report["failed"]:
+        print(f"  ❌ {report['failed']} generations failed after retries")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
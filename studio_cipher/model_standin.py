@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Model Stand-In
+Local OpenAI-compatible endpoint so missions can be load-tested offline
+"""
+
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VERSES = [
+    "lock", "the", "session", "down", "ship", "the", "route", "clean", "no", "matter", "what",
+    "validate", "every", "input", "keep", "the", "stage", "accessible", "drop", "the", "verse",
+    "gold", "accent", "on", "dark", "grit", "argon2id", "cookies", "stay", "http-only",
+]
+
+def standin_text(model, messages, max_tokens):
+    """Deterministic reply - the same prompt always gets the same verse"""
+    prompt = "\n".join(m.get("content", "") for m in messages)
+    seed = int(hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()[:12], 16)
+    rng = random.Random(seed)
+    words = [rng.choice(VERSES) for _ in range(min(max_tokens, 40 + seed % 80))]
+    return "🎤 " + " ".join(words)
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _complete(self, payload):
+        """One chat completion (status, body, seconds it takes) - errors come back with their status"""
+        server = self.server
+        if server.failure_rate and server.rng.random() < server.failure_rate:
+            return 503, {"error": {"type": "server_error", "message": "Stand-in dropped the beat"}}, 0.0
+
+        messages = payload.get("messages", [])
+        model = payload.get("model", "standin")
+        text = standin_text(model, messages, payload.get("max_tokens", 512))
+        completion_tokens = len(text.split())
+        prompt_tokens = sum(len(m.get("content", "").split()) for m in messages)
+        with server.stats_lock:
+            server.stats["completions"] += 1
+        return 200, {
+            "id": f"standin-{hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]}",
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }, (server.latency_ms + server.per_token_ms * completion_tokens) / 1000
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send(400, {"error": {"type": "invalid_request_error", "message": "Body is not JSON"}})
+            return
+
+        if self.path not in ("/v1/chat/completions", "/v1/chat/completions/batch"):
+            self._send(404, {"error": {"type": "not_found", "message": self.path}})
+            return
+
+        # Past capacity the stand-in pushes back the way a real provider does
+        if not server.slots.acquire(blocking=False):
+            with server.stats_lock:
+                server.stats["throttled"] += 1
+            self._send(429, {"error": {"type": "rate_limit_exceeded", "message": "Slow your roll"}},
+                       {"Retry-After": f"{server.retry_after:.3f}"})
+            return
+        try:
+            with server.stats_lock:
+                server.stats["requests"] += 1
+            if self.path.endswith("/batch"):
+                responses, slowest = [], 0.0
+                for item in payload.get("requests", []):
+                    status, body, seconds = self._complete(item)
+                    responses.append(body if status == 200 else {**body, "status": status})
+                    slowest = max(slowest, seconds)
+                time.sleep(slowest)  # a batch decodes together - it takes as long as its longest reply
+                self._send(200, {"object": "list", "responses": responses})
+            else:
+                status, body, seconds = self._complete(payload)
+                time.sleep(seconds)
+                self._send(status, body)
+        finally:
+            server.slots.release()
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # a full crew connects at once
+
+    def __init__(self, address, latency_ms=120, per_token_ms=1.0, capacity=32,
+                 failure_rate=0.0, retry_after=0.25, seed=0):
+        super().__init__(address, StandinHandler)
+        self.latency_ms = latency_ms
+        self.per_token_ms = per_token_ms
+        self.slots = threading.BoundedSemaphore(capacity)
+        self.failure_rate = failure_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "completions": 0, "throttled": 0}
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+def start_standin(host="127.0.0.1", port=0, **options):
+    """Serve the stand-in from a daemon thread - returns the running server"""
+    server = StandinServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, name="cipher-model-standin", daemon=True).start()
+    return server
+
+def main():
+    options = {"port": 8765}
+    for arg in sys.argv[1:]:
+        if not arg.startswith("--") or "=" not in arg:
+            print("🎤 Usage: python model_standin.py [--port=8765] [--latency-ms=120] [--per-token-ms=1.0]")
+            print("         [--capacity=32] [--failure-rate=0.0]")
+            sys.exit(1)
+        name, value = arg[2:].split("=", 1)
+        options[name.replace("-", "_")] = float(value) if "." in value else int(value)
+
+    port = options.pop("port")
+    server = StandinServer(("127.0.0.1", port), **options)
+    print(f"🎛️ Model stand-in listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Page Fixes
+App pages rendered with every fixer's patches already applied - each page is written once, final
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from template_engine import page_names, render_page
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+# Builders with PAGE_PATCHES for pages other builders render, in the order the patches stack
+FIXERS = [REPO_DIR / "designer_fixes.py", REPO_DIR / "team_collaboration_fixes.py"]
+
+_patches = None
+
+def page_patches():
+    """page -> [patch, ...] from every fixer's PAGE_PATCHES, loaded once per process"""
+    global _patches
+    if _patches is None:
+        patches = {}
+        for path in FIXERS:
+            spec = importlib.util.spec_from_file_location(f"cipher_fixer_{path.stem}", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            for page, patch in module.PAGE_PATCHES.items():
+                patches.setdefault(page, []).append(patch)
+        _patches = patches
+    return _patches
+
+def finished_page(page, **context):
+    """render_page, then every fixer's patch for it - what used to take one write per fixer"""
+    html = render_page(page, **context)
+    for patch in page_patches().get(page, []):
+        html = patch(html)
+    return html
+
+def main():
+    if len(sys.argv) != 1:
+        print("🎤 Usage: python page_fixes.py")
+        print("   Lists the patches each app page is rendered with")
+        sys.exit(1)
+    patches = page_patches()
+    for page in page_names():
+        names = [f"{patch.__module__.removeprefix('cipher_fixer_')}.{patch.__name__}" for patch in patches.get(page, [])]
+        print(f"  📄 {page}: {', '.join(names) or '-'}")
+
+if __name__ == "__main__":
+    main()
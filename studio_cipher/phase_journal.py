@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Phase Journal
+Write-ahead log of finished work so a crashed mission picks up where it dropped
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+JOURNAL_NAME = "journal.jsonl"
+
+class PhaseJournal:
+    """Append-only JSONL journal kept in a run directory.
+
+    Work is recorded as `begin` before it starts and `commit` once its
+    artifacts are on disk. Each `start` record opens a fresh session for a
+    kind of work (mission, pipeline); only commits since the latest start
+    of that kind count when resuming.
+    """
+
+    def __init__(self, run_dir):
+        self.run_dir = Path(run_dir)
+        self.path = self.run_dir / JOURNAL_NAME
+        self._lock = threading.Lock()
+
+    def records(self):
+        if not self.path.exists():
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # a line torn by a crash mid-append never committed anything
+        return records
+
+    def append(self, event, kind, step=None, **info):
+        record = {"event": event, "kind": kind, "step": step, "at": datetime.now().isoformat(), **info}
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self._lock:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a+b") as f:
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line  # seal off a line torn by an earlier crash
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        return record
+
+    def start(self, kind, **info):
+        return self.append("start", kind, **info)
+
+    def begin(self, kind, step):
+        return self.append("begin", kind, step)
+
+    def commit(self, kind, step, artifacts=()):
+        return self.append("commit", kind, step, artifacts=sorted(artifacts))
+
+    def session(self, kind):
+        """Records for the latest session of a kind, starting with its start record"""
+        session = []
+        for record in self.records():
+            if record["kind"] != kind:
+                continue
+            if record["event"] == "start":
+                session = [record]
+            elif session:
+                session.append(record)
+        return session
+
+    def last_start(self, kind):
+        session = self.session(kind)
+        return session[0] if session else None
+
+    def completed(self, kind, verify=True):
+        """Steps committed in the latest session whose artifacts are all still on disk"""
+        done = {}
+        for record in self.session(kind):
+            if record["event"] == "commit":
+                done[record["step"]] = record.get("artifacts", [])
+        if verify:
+            done = {step: artifacts for step, artifacts in done.items()
+                    if all((self.run_dir / a).exists() for a in artifacts)}
+        return done
+
+    def pending(self, kind):
+        """Steps that began but never committed - the work a crash interrupted"""
+        begun, committed = [], set()
+        for record in self.session(kind):
+            if record["event"] == "begin":
+                begun.append(record["step"])
+            elif record["event"] == "commit":
+                committed.add(record["step"])
+        return [step for step in begun if step not in committed]
+
+def main():
+    if len(sys.argv) != 2:
+        print("🎤 Usage: python phase_journal.py <run_dir>")
+        sys.exit(1)
+
+    journal = PhaseJournal(sys.argv[1])
+    kinds = sorted({r["kind"] for r in journal.records()})
+    if not kinds:
+        print("📓 No journal in this run")
+        return
+
+    for kind in kinds:
+        start = journal.last_start(kind)
+        print(f"📓 {kind.upper()} (started {start['at'] if start else 'unknown'})")
+        for step, artifacts in journal.completed(kind).items():
+            print(f"  ✅ {step} ({len(artifacts)} artifacts)")
+        for step in journal.pending(kind):
+            print(f"  ⏸️ {step} - interrupted")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Precompress
+gzip and brotli siblings for every text asset, made once at build time so serving them costs nothing
+"""
+
+import gzip
+import sys
+from pathlib import Path, PurePosixPath
+
+try:
+    import brotli
+except ImportError:  # optional - gzip alone covers every browser
+    brotli = None
+
+# Content-Encoding -> file suffix, best first
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+TEXT_SUFFIXES = {".html", ".htm", ".css", ".js", ".mjs", ".json", ".svg", ".txt", ".xml", ".map", ".md"}
+MIN_BYTES = 256  # below this the saving is lost in the headers
+
+def available_encodings():
+    return [encoding for encoding in ENCODINGS if encoding != "br" or brotli is not None]
+
+def compress(data, encoding):
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)  # no timestamp - rebuilds stay byte-identical
+
+def is_compressible(key, data):
+    return PurePosixPath(key).suffix.lower() in TEXT_SUFFIXES and len(data) >= MIN_BYTES
+
+def variants(key, data, encodings=None):
+    """key + suffix -> compressed bytes, for each encoding that actually saves something"""
+    if not is_compressible(key, data):
+        return {}
+    out = {}
+    for encoding in encodings or available_encodings():
+        packed = compress(data, encoding)
+        if len(packed) < len(data):
+            out[key + ENCODINGS[encoding]] = packed
+    return out
+
+def precompress(outputs, encodings=None):
+    """The compressed siblings of every text file in a relpath -> bytes map"""
+    compressed = {}
+    for key, data in outputs.items():
+        compressed.update(variants(key, data, encodings))
+    return compressed
+
+def savings(outputs, compressed):
+    """encoding -> (raw bytes, compressed bytes) over the files that got that encoding"""
+    totals = {}
+    for encoding, suffix in ENCODINGS.items():
+        keys = [key[:-len(suffix)] for key in compressed if key.endswith(suffix) and key[:-len(suffix)] in outputs]
+        if keys:
+            totals[encoding] = (sum(len(outputs[key]) for key in keys),
+                                sum(len(compressed[key + suffix]) for key in keys))
+    return totals
+
+def print_savings(totals):
+    for encoding, (raw, packed) in totals.items():
+        print(f"🗜️ {encoding}: {raw:,} → {packed:,} bytes on the wire ({1 - packed / raw:.0%} smaller)")
+    if brotli is None:
+        print("💡 pip install brotli for .br variants as well")
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 1 or not Path(args[0]).is_dir():
+        print("🎤 Usage: python precompress.py <dir>")
+        print(f"   Writes {' and '.join(available_encodings())} siblings next to every text asset under <dir>")
+        sys.exit(1)
+
+    root = Path(args[0])
+    suffixes = tuple(ENCODINGS.values())
+    outputs = {path.relative_to(root).as_posix(): path.read_bytes()
+               for path in sorted(root.rglob("*"))
+               if path.is_file() and not path.name.endswith(suffixes) and not path.name.startswith(".")}
+    compressed = precompress(outputs)
+    for key, data in compressed.items():
+        (root / key).write_bytes(data)
+    print(f"🎤 {len(compressed)} precompressed files under {root}")
+    print_savings(savings(outputs, compressed))
+
+if __name__ == "__main__":
+    main()
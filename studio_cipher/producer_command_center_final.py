@@ -6,8 +6,9 @@ Final testing, quality assurance, and deployment
 
 import os
 from datetime import datetime
+from merge_engine import commit_edit, report
 
-def producer_command_center_final():
+def producer_command_center_final(app_dir="C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"):
     """Producer Agent performs final integration and testing"""
     
     print("🎤" * 50)
@@ -18,8 +19,6 @@ def producer_command_center_final():
     print("🎯 MISSION: Quality assurance, testing, final polish")
     print("🏆 APPROACH: Integration testing, performance optimization, deployment")
     
-    app_dir = "C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"
-    
     print("🔍 Producer Agent: Analyzing completed Command Center...")
     
     # Check all implemented components
@@ -472,15 +471,15 @@ if (document.readyState === 'loading') {
     # Add test script to HTML for automatic testing
     command_center_path = f"{app_dir}/command-center.html"
     with open(command_center_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+        base_html = f.read()
+    html_content = base_html
     
     # Add test script
     test_script_tag = '    <script src="scripts/command-center-tests.js"></script>\n</body>'
     html_content = html_content.replace('</body>', test_script_tag)
     
-    # Write updated HTML
-    with open(command_center_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Merge against the page we read - other agents may be editing it right now
+    report(commit_edit(command_center_path, "producer", base_html, html_content), "Producer Agent: ")
     
     print("✅ Producer Agent: Test suite integrated into Command Center")
     
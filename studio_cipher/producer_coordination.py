@@ -7,6 +7,8 @@ Processing user feedback and directing agents to fix issues
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def process_user_responses():
     """Producer processes user responses and coordinates team"""
     
@@ -91,5 +93,4 @@ if __name__ == "__main__":
     coordination_result = process_user_responses()
     
     # Save for team coordination
-    with open('runs/20250813_203814/producer/user_responses.json', 'w') as f:
-        json.dump(coordination_result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/producer/user_responses.json', json.dumps(coordination_result, indent=2))
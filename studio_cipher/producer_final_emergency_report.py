@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def producer_final_emergency_report():
     """Producer Agent provides final status after all emergency fixes"""
     
@@ -186,8 +188,7 @@ if __name__ == "__main__":
     
     # Save final coordination results
     os.makedirs('runs/20250813_203814/producer', exist_ok=True)
-    with open('runs/20250813_203814/producer/final_emergency_report.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/producer/final_emergency_report.json', json.dumps(result, indent=2))
     
     print(f"\n🎬 Producer Agent: Final emergency report complete!")
     print(f"🏆 Status: {result['status']}")
@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def producer_functionality_check():
     """Producer Agent conducts post-implementation functionality review"""
     
@@ -129,8 +131,7 @@ if __name__ == "__main__":
     
     # Producer saves results for coordination
     os.makedirs('runs/20250813_203814/producer', exist_ok=True)
-    with open('runs/20250813_203814/producer/functionality_check.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/producer/functionality_check.json', json.dumps(result, indent=2))
     
     print(f"\n📋 Producer Agent: Testing framework saved")
     print(f"🎬 Status: {result['status']}")
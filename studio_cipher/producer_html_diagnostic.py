@@ -7,6 +7,8 @@ Analyzing Route Optimizer and Mileage Calculator issues for user
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def run_html_diagnostic():
     """Producer agent analyzes HTML functionality issues"""
     
@@ -112,5 +114,4 @@ if __name__ == "__main__":
     diagnostic_result = run_html_diagnostic()
     
     # Save diagnostic for other agents
-    with open('runs/20250813_203814/producer/html_diagnostic.json', 'w') as f:
-        json.dump(diagnostic_result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/producer/html_diagnostic.json', json.dumps(diagnostic_result, indent=2))
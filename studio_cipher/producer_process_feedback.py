@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def producer_process_user_feedback():
     """Producer Agent processes user feedback and coordinates agent fixes"""
     
@@ -158,8 +160,7 @@ if __name__ == "__main__":
     
     # Save coordination results
     os.makedirs('runs/20250813_203814/producer', exist_ok=True)
-    with open('runs/20250813_203814/producer/user_feedback_processing.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/producer/user_feedback_processing.json', json.dumps(result, indent=2))
     
     print(f"\n🎬 Producer Agent: User feedback processed")
     print(f"🚨 Status: {result['status']}")
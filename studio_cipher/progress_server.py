@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Progress Server
+Run and deliverable status over HTTP - JSON snapshots plus a Server-Sent Events feed
+"""
+
+import asyncio
+import json
+import sys
+from contextlib import closing
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from cipher_runs import RUNS_DIR
+import run_index
+
+HEARTBEAT_SECONDS = 15
+
+DASHBOARD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Studio Cipher - Progress</title>
+<style>
+body { font-family: system-ui, sans-serif; background: #111; color: #eee; margin: 2rem; }
+a { color: #7cf; cursor: pointer; }
+.bar { background: #333; height: 8px; width: 240px; display: inline-block; vertical-align: middle; }
+.bar span { background: #6c6; height: 100%; display: block; }
+li { margin: .25rem 0; }
+</style>
+</head>
+<body>
+<h1>🎤 Studio Cipher Progress</h1>
+<ul id="runs"></ul>
+<div id="run"></div>
+<script>
+const bar = (done, total) => `<span class="bar"><span style="width:${total ? 100 * done / total : 100}%"></span></span>`;
+const esc = s => String(s ?? "").replace(/[&<>"]/g, c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c]));
+let runFeed = null;
+new EventSource("/events").addEventListener("runs", e => {
+  document.getElementById("runs").innerHTML = JSON.parse(e.data).map(r =>
+    `<li><a data-run="${esc(r.run_id)}">${esc(r.run_id)}</a> [${esc(r.status)}] ${bar(r.done, r.total)} ${r.done}/${r.total} ${esc(r.goal)}</li>`).join("");
+});
+document.getElementById("runs").addEventListener("click", e => {
+  const id = e.target.dataset.run;
+  if (!id) return;
+  if (runFeed) runFeed.close();
+  runFeed = new EventSource(`/events?run=${encodeURIComponent(id)}`);
+  runFeed.addEventListener("run", ev => {
+    const run = JSON.parse(ev.data);
+    if (!run) return;
+    const done = run.deliverables.filter(d => d.done).length;
+    document.getElementById("run").innerHTML =
+      `<h2>${esc(run.run_id)} - ${esc(run.goal)}</h2>${bar(done, run.deliverables.length)} ${done}/${run.deliverables.length}<ul>` +
+      run.deliverables.map(d => `<li>${d.done ? "✅" : "⏳"} ${esc(d.category)}/${esc(d.item)}</li>`).join("") +
+      `</ul>` + run.qa_scores.map(s => `<div>🎬 ${esc(s.source)} round ${esc(s.round)}: ${s.score ?? "-"}</div>`).join("");
+  });
+});
+</script>
+</body>
+</html>
+"""
+
+class ProgressHub:
+    """One shared view of the run index, recomputed only when the runner writes to it.
+
+    The mission runner marks deliverables as each agent unit commits and the
+    build pipeline as each stage finishes, so the index moves while a
+    run is still going.
+
+    SQLite's `data_version` moves whenever another connection commits, so a
+    single cheap pragma per tick tells the hub the index changed. The run
+    list (and every run somebody is watching) is then rebuilt once and
+    pushed to all subscribers - viewers never touch the disk themselves.
+    """
+
+    def __init__(self, runs_dir=None, interval=0.25):
+        self.runs_dir = Path(runs_dir or RUNS_DIR)
+        self.interval = interval
+        self.runs = []
+        self.details = {}  # run_id -> progress, until the next change
+        self.subscribers = {}  # queue -> run_id or None for the run list
+        self.version = None
+        self.conn = None
+
+    def _snapshot(self, run_ids):
+        runs = run_index.list_runs(self.runs_dir)
+        return runs, {run_id: run_index.progress(self.runs_dir / run_id) for run_id in run_ids}
+
+    async def refresh(self):
+        loop = asyncio.get_running_loop()
+        watched = {run_id for run_id in self.subscribers.values() if run_id}
+        runs, details = await loop.run_in_executor(None, self._snapshot, watched)
+        if runs != self.runs:
+            self.runs = runs
+            self._publish(None, "runs", runs)
+        previous, self.details = self.details, details  # unwatched runs are recomputed on request
+        for run_id, run in details.items():
+            if run != previous.get(run_id):
+                self._publish(run_id, "run", run)
+
+    def _publish(self, run_id, event, data):
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+        for queue, wanted in self.subscribers.items():
+            if wanted == run_id:
+                queue.put_nowait(message)
+
+    async def run_detail(self, run_id):
+        if run_id not in self.details:
+            loop = asyncio.get_running_loop()
+            self.details[run_id] = await loop.run_in_executor(
+                None, run_index.progress, self.runs_dir / run_id)
+        return self.details[run_id]
+
+    def subscribe(self, run_id=None):
+        queue = asyncio.Queue()
+        self.subscribers[queue] = run_id
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.pop(queue, None)
+
+    async def watch(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, run_index.ensure_indexed, self.runs_dir)
+        self.conn = run_index.connect(self.runs_dir)
+        with closing(self.conn):
+            while True:
+                version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+                if version != self.version:
+                    self.version = version
+                    await self.refresh()
+                await asyncio.sleep(self.interval)
+
+async def _respond(writer, status, body, content_type="application/json"):
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode("utf-8")
+    writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                 f"Content-Length: {len(body)}\r\nCache-Control: no-cache\r\n"
+                 "Connection: close\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+
+async def _stream(hub, writer, run_id):
+    queue = hub.subscribe(run_id)
+    try:
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+        # Current state first, then only changes
+        if run_id:
+            first = f"event: run\ndata: {json.dumps(await hub.run_detail(run_id))}\n\n"
+        else:
+            first = f"event: runs\ndata: {json.dumps(hub.runs)}\n\n"
+        writer.write(first.encode("utf-8"))
+        await writer.drain()
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                message = b": ping\n\n"  # keeps proxies open and finds dead viewers
+            writer.write(message)
+            await writer.drain()
+    finally:
+        hub.unsubscribe(queue)
+
+async def handle(hub, reader, writer):
+    try:
+        request = await reader.readline()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass  # headers are not needed
+        parts = request.decode("latin-1").split()
+        if len(parts) < 2 or parts[0] != "GET":
+            await _respond(writer, "405 Method Not Allowed", {"error": "GET only"})
+            return
+        url = urlsplit(parts[1])
+        path = unquote(url.path).rstrip("/") or "/"
+
+        if path == "/":
+            await _respond(writer, "200 OK", DASHBOARD.encode("utf-8"), "text/html; charset=utf-8")
+        elif path == "/api/runs":
+            await _respond(writer, "200 OK", hub.runs)
+        elif path.startswith("/api/runs/"):
+            run = await hub.run_detail(path.rsplit("/", 1)[1])
+            await _respond(writer, "200 OK" if run else "404 Not Found", run or {"error": "unknown run"})
+        elif path == "/events":
+            await _stream(hub, writer, parse_qs(url.query).get("run", [None])[0])
+        else:
+            await _respond(writer, "404 Not Found", {"error": "not found"})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass  # viewer went away
+    finally:
+        writer.close()
+
+async def serve(host="127.0.0.1", port=8765, runs_dir=None):
+    hub = ProgressHub(runs_dir)
+    server = await asyncio.start_server(lambda r, w: handle(hub, r, w), host, port)
+    print(f"📡 Progress server on http://{host}:{server.sockets[0].getsockname()[1]}/ (Ctrl+C to stop)")
+    async with server:
+        await asyncio.gather(server.serve_forever(), hub.watch())
+
+def main():
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if any(a in ("-h", "--help") for a in sys.argv[1:]):
+        print("🎤 Usage: python progress_server.py [--host=127.0.0.1] [--port=8765]")
+        print("   GET /  /api/runs  /api/runs/<run_id>  /events[?run=<run_id>]")
+        sys.exit(1)
+    try:
+        asyncio.run(serve(options.get("host", "127.0.0.1"), int(options.get("port", 8765))))
+    except KeyboardInterrupt:
+        print("\n👋 Progress server stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Progress Watch
+Follow a run's deliverables live - inotify on Linux, cheap polling everywhere else
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+import run_index
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+class InotifyWatcher:
+    """Recursive inotify watch on a run directory - yields run-relative paths that changed"""
+
+    def __init__(self, root):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.root = Path(root)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        self.overflowed = False
+        self._watch_tree(self.root)
+
+    def _watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.dirs[wd] = Path(directory)
+
+    def _watch_tree(self, top):
+        """Watch a directory and everything under it; returns the files already inside"""
+        found = []
+        self._watch(top)
+        for dirpath, dirnames, filenames in os.walk(top):
+            for name in dirnames:
+                self._watch(Path(dirpath) / name)
+            found.extend(Path(dirpath) / name for name in filenames)
+        return found
+
+    def _relative(self, path):
+        return Path(path).relative_to(self.root).as_posix()
+
+    def changes(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changed, offset = [], 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True  # the caller re-checks everything once
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # Files can land before the new directory is watched - pick them up here
+                try:
+                    changed.extend(self._relative(p) for p in self._watch_tree(path))
+                except (FileNotFoundError, OSError):
+                    pass
+            changed.append(self._relative(path))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Fallback without inotify: stat only the directories deliverables live in.
+
+    A directory's mtime moves whenever an entry is created, removed or
+    renamed in it, so one stat per directory per tick is enough. Only the
+    deliverable paths in a directory that changed get stat'ed again.
+    """
+
+    def __init__(self, root, paths, interval=0.5):
+        self.root = Path(root)
+        self.interval = interval
+        self.by_dir = {}
+        for path in paths:
+            self.by_dir.setdefault(Path(path).parent.as_posix(), []).append(path)
+        self.mtimes = {d: self._mtime(d) for d in self.by_dir}
+        self.overflowed = False
+
+    def _mtime(self, directory):
+        try:
+            return os.stat(self.root / directory).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def changes(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        changed = []
+        for directory, paths in self.by_dir.items():
+            mtime = self._mtime(directory)
+            if mtime != self.mtimes[directory]:
+                self.mtimes[directory] = mtime
+                changed.extend(paths)
+        return changed
+
+    def close(self):
+        pass
+
+def make_watcher(root, paths, polling=False):
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass  # no inotify (container limits, odd libc) - poll instead
+    return PollingWatcher(root, paths)
+
+class DeliverableBoard:
+    """Deliverable status kept up to date one changed path at a time"""
+
+    def __init__(self, run_dir, run):
+        self.run_dir = Path(run_dir)
+        self.goal = run["goal"]
+        self.deliverables = [(d["category"], d["item"]) for d in run["deliverables"]]
+        self.paths = {}
+        for key in self.deliverables:
+            for path in run_index.deliverable_paths(*key):
+                self.paths.setdefault(path, []).append(key)
+        self.present = {key: set() for key in self.deliverables}
+        existing = run_index.scan_paths(self.run_dir, self.paths) & self.paths.keys()
+        for path in existing:
+            for key in self.paths[path]:
+                self.present[key].add(path)
+        run_index.mark_written(self.run_dir, sorted(existing))
+
+    def refresh(self, paths):
+        """Re-stat just these paths - returns deliverables whose status flipped"""
+        flipped, written, gone = [], [], []
+        for path in paths:
+            keys = self.paths.get(path)
+            if not keys:
+                continue
+            exists = (self.run_dir / path).exists()
+            for key in keys:
+                was_done = self.done(key)
+                (self.present[key].add if exists else self.present[key].discard)(path)
+                if self.done(key) != was_done:
+                    flipped.append(key)
+            (written if exists else gone).append(path)
+        if written:
+            run_index.mark_written(self.run_dir, written)
+        if gone:
+            run_index.mark_missing(self.run_dir, gone, set().union(*self.present.values()))
+        return flipped
+
+    def done(self, key):
+        return bool(self.present[key])
+
+    @property
+    def completed(self):
+        return sum(1 for key in self.deliverables if self.done(key))
+
+    def render(self):
+        total = len(self.deliverables)
+        pct = (self.completed / total * 100) if total else 100.0
+        lines = [f"👀 WATCHING {self.run_dir.name} - {time.strftime('%H:%M:%S')} (Ctrl+C to stop)",
+                 f"🎯 {self.goal}"]
+        category = None
+        for key in self.deliverables:
+            if key[0] != category:
+                category = key[0]
+                lines.append(f"\n📦 {category.upper()}:")
+            lines.append(f"  {'✅' if self.done(key) else '⏳'} {key[1]}")
+        filled = int(30 * pct / 100)
+        lines.append(f"\n🎵 [{'█' * filled}{'░' * (30 - filled)}] {self.completed}/{total} ({pct:.1f}%)")
+        return "\n".join(lines)
+
+def watch_progress(run_dir, polling=False, until_complete=True):
+    """Live deliverables view for a run - redraws only when a deliverable flips"""
+    run_dir = Path(run_dir)
+    run = run_index.progress(run_dir)
+    if run is None:
+        run_index.index_run(run_dir)
+        run = run_index.progress(run_dir)
+
+    board = DeliverableBoard(run_dir, run)
+    watcher = make_watcher(run_dir, list(board.paths), polling)
+    tty = sys.stdout.isatty()
+    print(f"🛰️ {'inotify' if isinstance(watcher, InotifyWatcher) else 'polling'} on {run_dir}")
+    print("\033[H\033[2J" + board.render() if tty else board.render(), flush=True)
+
+    try:
+        while not (until_complete and board.completed == len(board.deliverables)):
+            changed = watcher.changes(timeout=1.0)
+            if watcher.overflowed:
+                watcher.overflowed = False
+                changed = list(board.paths)
+            flipped = board.refresh(changed)
+            if not flipped:
+                continue
+            if tty:
+                print("\033[H\033[2J" + board.render(), flush=True)
+            else:
+                for key in flipped:
+                    print(f"  {'✅' if board.done(key) else '❌'} {key[0]}/{key[1]} "
+                          f"({board.completed}/{len(board.deliverables)})", flush=True)
+        print("\n🎉 MISSION COMPLETE! 🎉")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+    return board
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Render Pool
+Generate a builder's pages and assets across processes, then write them in one pass
+"""
+
+import importlib
+import importlib.util
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_manifest import write_artifact
+from cipher_trace import span
+
+class RenderJob:
+    """One output file: `function(*args)` from `source` returns its text.
+
+    `source` is an importable module name or the path of a builder script -
+    builders are loaded by path, so workers import them the same way.
+    """
+
+    def __init__(self, path, source, function, *args):
+        self.path = path
+        self.source = str(source)
+        self.function = function
+        self.args = args
+
+_modules = {}
+
+def _load(source):
+    if source not in _modules:
+        if source.endswith(".py"):
+            spec = importlib.util.spec_from_file_location(f"cipher_render_{Path(source).stem}", source)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        else:
+            module = importlib.import_module(source)
+        _modules[source] = module
+    return _modules[source]
+
+def render_job(job):
+    with span(f"render {job.path}", phase="render", file=job.path) as render_span:
+        text = getattr(_load(job.source), job.function)(*job.args)
+        render_span.add_bytes(len(text.encode("utf-8")))
+    return job.path, text
+
+RENDER_JOBS_ENV = "CIPHER_RENDER_JOBS"
+
+def render_workers():
+    """CIPHER_RENDER_JOBS, or one worker per core"""
+    return int(os.environ.get(RENDER_JOBS_ENV) or os.cpu_count() or 1)
+
+def limit_render_workers(workers):
+    """Cap this process's render pool - for pool workers that already share the cores with siblings"""
+    os.environ[RENDER_JOBS_ENV] = str(max(1, min(workers, render_workers())))
+
+def render_all(jobs, workers=None):
+    """(path, text) for every job, in job order whichever worker finishes first"""
+    workers = min(workers or render_workers(), len(jobs))
+    if workers <= 1:
+        return [render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_job, jobs))
+
+def write_all(run_dir, base_dir, rendered):
+    """The one write phase: every rendered file through the manifest, in order - returns their paths"""
+    for path, text in rendered:
+        write_artifact(run_dir, Path(base_dir) / path, text)
+    return [path for path, _ in rendered]
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Run Archive
+Pack finished runs into compressed tarballs so runs/ only holds the recent ones
+"""
+
+import json
+import os
+import shutil
+import sys
+import tarfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from build_manifest import file_hash, write_atomic
+from cipher_runs import RUNS_DIR, list_run_dirs
+from phase_journal import PhaseJournal
+import run_index
+
+ARCHIVE_DIR_NAME = ".archive"
+INDEX_NAME = "index.json"
+SUFFIXES = {"gz": ".tar.gz", "bz2": ".tar.bz2", "xz": ".tar.xz"}
+
+def archive_dir(runs_dir=None):
+    return Path(runs_dir or RUNS_DIR) / ARCHIVE_DIR_NAME
+
+def load_index(runs_dir=None):
+    """run_id -> archive entry for every archived run"""
+    path = archive_dir(runs_dir) / INDEX_NAME
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("runs", {})
+
+def save_index(index, runs_dir=None):
+    path = archive_dir(runs_dir) / INDEX_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"updated_at": datetime.now().isoformat(), "runs": dict(sorted(index.items()))}
+    write_atomic(path, json.dumps(data, indent=2).encode("utf-8"))
+
+def is_finished(run_dir):
+    """A run nobody is still writing: no journaled step left hanging"""
+    journal = PhaseJournal(run_dir)
+    kinds = {r["kind"] for r in journal.records()}
+    return not any(journal.pending(kind) for kind in kinds)
+
+def _mission_goal(run_dir):
+    mission_file = Path(run_dir) / "mission.json"
+    try:
+        with open(mission_file, encoding="utf-8") as f:
+            return json.load(f).get("goal", "")
+    except (OSError, ValueError):
+        return ""
+
+def archive_run(run_dir, compression="xz", index=None):
+    """Pack one run into .archive/<run_id>.tar.<ext>, verify it, then drop the run tree"""
+    run_dir = Path(run_dir)
+    runs_dir = run_dir.parent
+    target_dir = archive_dir(runs_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    archive = target_dir / f"{run_dir.name}{SUFFIXES[compression]}"
+    tmp = archive.with_name(f".{archive.name}.{os.getpid()}.tmp")
+
+    files, size = 0, 0
+    with tarfile.open(tmp, f"w:{compression}") as tar:
+        for path in sorted(run_dir.rglob("*")):
+            if path.is_file():
+                files += 1
+                size += path.stat().st_size
+        # Hardlinked copies inside one run (see blob_store) are stored once
+        tar.add(run_dir, arcname=run_dir.name)
+
+    with tarfile.open(tmp) as tar:
+        stored = sum(1 for member in tar.getmembers() if member.isfile() or member.islnk())
+    if stored != files:
+        tmp.unlink()
+        raise RuntimeError(f"{run_dir.name}: archived {stored} of {files} files - run left in place")
+    os.replace(tmp, archive)
+
+    entry = {
+        "archive": archive.name,
+        "goal": _mission_goal(run_dir),
+        "files": files,
+        "bytes": size,
+        "packed_bytes": archive.stat().st_size,
+        "sha256": file_hash(archive),
+        "archived_at": datetime.now().isoformat(),
+    }
+    if index is not None:
+        index[run_dir.name] = entry
+    shutil.rmtree(run_dir)
+    run_index.set_archived(runs_dir, run_dir.name, True)
+    return entry
+
+def archive_runs(runs_dir=None, keep=50, compression="xz", dry_run=False):
+    """Archive every finished run except the newest `keep` - returns (archived, skipped)"""
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    candidates = list_run_dirs(runs_dir)[:-keep] if keep else list_run_dirs(runs_dir)
+    index = load_index(runs_dir)
+    archived, skipped = [], []
+    for run_dir in candidates:
+        if not is_finished(run_dir):
+            skipped.append(run_dir.name)
+            continue
+        if dry_run:
+            archived.append((run_dir.name, None))
+            continue
+        archived.append((run_dir.name, archive_run(run_dir, compression, index)))
+        save_index(index, runs_dir)  # after every run - a crash never loses a finished archive
+    return archived, skipped
+
+def _safe_members(tar, dest):
+    dest = Path(dest).resolve()
+    for member in tar.getmembers():
+        target = (dest / member.name).resolve()
+        if dest not in target.parents and target != dest:
+            raise RuntimeError(f"Refusing to extract {member.name} outside {dest}")
+        if member.issym() or member.isdev():
+            raise RuntimeError(f"Refusing to extract special file {member.name}")
+        yield member
+
+def extract_run(run_id, dest, runs_dir=None):
+    """Unpack an archived run into dest/<run_id> - the archive stays put"""
+    entry = load_index(runs_dir).get(run_id)
+    if not entry:
+        raise FileNotFoundError(f"Run {run_id} is not in the archive")
+    archive = archive_dir(runs_dir) / entry["archive"]
+    if file_hash(archive) != entry["sha256"]:
+        raise RuntimeError(f"{archive.name} does not match its index checksum")
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(dest, members=_safe_members(tar, dest))
+    return dest / run_id
+
+def restore_run(run_id, runs_dir=None):
+    """Move an archived run back into runs/ and drop its archive"""
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    if (runs_dir / run_id).exists():
+        raise FileExistsError(f"Run {run_id} is already in {runs_dir}")
+    run_dir = extract_run(run_id, runs_dir, runs_dir)
+    index = load_index(runs_dir)
+    entry = index.pop(run_id)
+    save_index(index, runs_dir)
+    (archive_dir(runs_dir) / entry["archive"]).unlink()
+    run_index.set_archived(runs_dir, run_id, False)
+    return run_dir
+
+def prune(runs_dir=None, max_age_days=0):
+    """Retention: delete archives older than max_age_days (0 keeps them forever)"""
+    if not max_age_days:
+        return []
+    cutoff = time.time() - max_age_days * 86400
+    index = load_index(runs_dir)
+    removed = []
+    for run_id, entry in list(index.items()):
+        if datetime.fromisoformat(entry["archived_at"]).timestamp() < cutoff:
+            (archive_dir(runs_dir) / entry["archive"]).unlink(missing_ok=True)
+            del index[run_id]
+            removed.append(run_id)
+    if removed:
+        save_index(index, runs_dir)
+    return removed
+
+def archive_settings():
+    from config_cache import load_yaml
+    settings_file = Path("settings.yml")
+    settings = load_yaml(settings_file) if settings_file.exists() else {}
+    return {"keep_hot": 50, "compression": "xz", "max_age_days": 0, **settings.get("archive", {})}
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    commands = ("archive", "list", "extract", "restore", "prune")
+    if not args or args[0] not in commands or (args[0] in ("extract", "restore") and len(args) < 2):
+        print("🎤 Usage: python run_archive.py archive [--keep=50] [--dry-run]")
+        print("         python run_archive.py list")
+        print("         python run_archive.py extract <run_id> [--to=<dir>]")
+        print("         python run_archive.py restore <run_id>")
+        print("         python run_archive.py prune [--days=N]")
+        sys.exit(1)
+
+    config = archive_settings()
+    command = args[0]
+    try:
+        if command == "archive":
+            keep = int(options.get("keep", config["keep_hot"]))
+            archived, skipped = archive_runs(keep=keep, compression=config["compression"],
+                                             dry_run="--dry-run" in sys.argv)
+            for run_id, entry in archived:
+                if entry:
+                    print(f"🗜️ {run_id}: {entry['files']} files, {entry['bytes']:,} → "
+                          f"{entry['packed_bytes']:,} bytes")
+                else:
+                    print(f"🗜️ {run_id}: would archive")
+            for run_id in skipped:
+                print(f"⏸️ {run_id}: has unfinished journal steps - left in runs/")
+            print(f"📦 {len(archived)} runs archived, {len(list_run_dirs())} kept hot")
+        elif command == "list":
+            index = load_index()
+            for run_id, entry in sorted(index.items(), reverse=True):
+                print(f"  🗄️ {run_id} - {entry['goal'][:50]} ({entry['packed_bytes']:,} bytes)")
+            print(f"📦 {len(index)} archived runs, {len(list_run_dirs())} hot")
+        elif command == "extract":
+            print(f"📂 Extracted to {extract_run(args[1], options.get('to', '.'))}")
+        elif command == "restore":
+            print(f"📂 Restored {restore_run(args[1])}")
+        else:
+            removed = prune(max_age_days=int(options.get("days", config["max_age_days"])))
+            print(f"🧹 Pruned {len(removed)} archives past retention")
+    except (FileNotFoundError, FileExistsError, RuntimeError) as exc:
+        print(f"❌ {exc}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
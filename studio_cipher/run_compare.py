@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Run Compare
+What changed between two runs - per-file byte deltas, diffs and page weight regressions
+"""
+
+import difflib
+import json
+import os
+import posixpath
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+
+from build_manifest import MANIFEST_NAME
+from cipher_runs import resolve_run
+
+CHUNK_SIZE = 1 << 16
+TEXT_SUFFIXES = {".html", ".htm", ".css", ".js", ".json", ".md", ".txt", ".yml", ".yaml", ".svg"}
+PAGE_SUFFIXES = {".html", ".htm"}
+ASSET_REF = re.compile(r"""(?:src|href)\s*=\s*["']([^"'#?]+)""", re.IGNORECASE)
+
+def scan_tree(root):
+    """run-relative path -> os.stat_result for every file, one os.scandir walk"""
+    files, stack = {}, [("", os.fspath(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue  # temp files from atomic writes, merge sessions
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((f"{prefix}{entry.name}/", entry.path))
+                elif entry.is_file():
+                    files[prefix + entry.name] = entry.stat()
+    return files
+
+def _manifest_hashes(root, files):
+    """Hashes the run's build manifest vouches for - only where size and mtime still match"""
+    try:
+        with open(Path(root) / MANIFEST_NAME, encoding="utf-8") as f:
+            artifacts = json.load(f).get("artifacts", {})
+    except (OSError, ValueError):
+        return {}
+    fresh = {}
+    for key, entry in artifacts.items():
+        stat = files.get(key)
+        if stat and entry.get("bytes") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            fresh[key] = entry["sha256"]
+    return fresh
+
+def same_content(path_a, path_b, chunk_size=CHUNK_SIZE):
+    """Stream both files chunk by chunk and stop at the first difference"""
+    with open(path_a, "rb") as a, open(path_b, "rb") as b:
+        while True:
+            chunk_a, chunk_b = a.read(chunk_size), b.read(chunk_size)
+            if chunk_a != chunk_b:
+                return False
+            if not chunk_a:
+                return True
+
+class RunComparison:
+    """Files of run B against run A: added, removed, changed (with byte deltas) and unchanged.
+
+    Most files are settled without opening them: a size difference means
+    changed, a shared inode (blob store hardlinks) or matching manifest
+    hashes mean unchanged. Only the rest are streamed, in parallel, and
+    each comparison stops at the first chunk that differs.
+    """
+
+    def __init__(self, run_a, run_b, workers=8):
+        self.run_a, self.run_b = Path(run_a), Path(run_b)
+        self.files_a, self.files_b = scan_tree(self.run_a), scan_tree(self.run_b)
+        hashes_a = _manifest_hashes(self.run_a, self.files_a)
+        hashes_b = _manifest_hashes(self.run_b, self.files_b)
+
+        self.added = sorted(self.files_b.keys() - self.files_a.keys())
+        self.removed = sorted(self.files_a.keys() - self.files_b.keys())
+        self.changed, self.unchanged, to_stream = [], [], []
+        for key in sorted(self.files_a.keys() & self.files_b.keys()):
+            a, b = self.files_a[key], self.files_b[key]
+            if a.st_size != b.st_size:
+                self.changed.append(key)
+            elif (a.st_dev, a.st_ino) == (b.st_dev, b.st_ino):
+                self.unchanged.append(key)
+            elif key in hashes_a and key in hashes_b:
+                (self.unchanged if hashes_a[key] == hashes_b[key] else self.changed).append(key)
+            else:
+                to_stream.append(key)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            same = pool.map(lambda key: same_content(self.run_a / key, self.run_b / key), to_stream)
+            for key, equal in zip(to_stream, same):
+                (self.unchanged if equal else self.changed).append(key)
+        self.changed.sort()
+        self.streamed = len(to_stream)
+
+    def size(self, side, key):
+        files = self.files_a if side == "a" else self.files_b
+        return files[key].st_size if key in files else 0
+
+    def delta(self, key):
+        return self.size("b", key) - self.size("a", key)
+
+    def diff(self, key, max_lines=200):
+        """Unified diff of a changed text asset, cut at max_lines"""
+        if PurePosixPath(key).suffix.lower() not in TEXT_SUFFIXES:
+            return []
+        def lines(root):
+            path = root / key
+            return path.read_text(encoding="utf-8", errors="replace").splitlines(keepends=True) if path.exists() else []
+        diff = list(difflib.unified_diff(lines(self.run_a), lines(self.run_b),
+                                         f"{self.run_a.name}/{key}", f"{self.run_b.name}/{key}"))
+        if len(diff) > max_lines:
+            diff = diff[:max_lines] + [f"... {len(diff) - max_lines} more diff lines\n"]
+        return diff
+
+    def page_weight(self, side, page):
+        """Bytes a page pulls in: itself plus every local script, stylesheet and image it references"""
+        root, files = (self.run_a, self.files_a) if side == "a" else (self.run_b, self.files_b)
+        if page not in files:
+            return 0
+        html = (root / page).read_text(encoding="utf-8", errors="replace")
+        base = PurePosixPath(page).parent
+        assets = set()
+        for ref in ASSET_REF.findall(html):
+            if "://" in ref or ref.startswith(("data:", "mailto:", "//")):
+                continue
+            target = posixpath.normpath(ref.lstrip("/") if ref.startswith("/") else (base / ref).as_posix())
+            if target != page and target in files and PurePosixPath(target).suffix.lower() not in PAGE_SUFFIXES:
+                assets.add(target)  # links to other pages are navigation, not weight
+        return files[page].st_size + sum(files[a].st_size for a in assets)
+
+    def pages(self):
+        keys = self.files_a.keys() | self.files_b.keys()
+        return sorted(k for k in keys if PurePosixPath(k).suffix.lower() in PAGE_SUFFIXES)
+
+    def page_weights(self):
+        """page -> (weight in A, weight in B)"""
+        return {page: (self.page_weight("a", page), self.page_weight("b", page)) for page in self.pages()}
+
+def _percent(before, after):
+    return (after - before) / before * 100 if before else 100.0
+
+def report(comparison, show_diffs=False, max_diff_lines=200, threshold=5.0):
+    """Print the comparison - returns the pages whose weight grew past threshold percent"""
+    c = comparison
+    total_a = sum(s.st_size for s in c.files_a.values())
+    total_b = sum(s.st_size for s in c.files_b.values())
+    print(f"🔍 {c.run_a.name} → {c.run_b.name}: {len(c.added)} added, {len(c.removed)} removed, "
+          f"{len(c.changed)} changed, {len(c.unchanged)} unchanged ({c.streamed} files streamed)")
+    print(f"📦 Total: {total_a:,} → {total_b:,} bytes ({total_b - total_a:+,})")
+
+    for icon, keys in (("➕", c.added), ("➖", c.removed), ("✏️", c.changed)):
+        for key in keys:
+            print(f"  {icon} {key}: {c.size('a', key):,} → {c.size('b', key):,} ({c.delta(key):+,})")
+
+    if show_diffs:
+        for key in c.changed:
+            diff = c.diff(key, max_diff_lines)
+            if diff:
+                print()
+                sys.stdout.writelines(line if line.endswith("\n") else line + "\n" for line in diff)
+
+    weights = c.page_weights()
+    regressions = []
+    if weights:
+        weight_a = sum(a for a, _ in weights.values())
+        weight_b = sum(b for _, b in weights.values())
+        print(f"\n⚖️ PAGE WEIGHT: {weight_a:,} → {weight_b:,} bytes ({weight_b - weight_a:+,}, "
+              f"{_percent(weight_a, weight_b):+.1f}%) across {len(weights)} pages")
+        for page, (a, b) in weights.items():
+            if a != b:
+                grew = a and b and _percent(a, b) > threshold
+                if grew:
+                    regressions.append(page)
+                print(f"  {'🔺' if grew else '  '} {page}: {a:,} → {b:,} ({b - a:+,})")
+    if regressions:
+        print(f"\n❌ {len(regressions)} pages grew more than {threshold:g}%")
+    return regressions
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if not 1 <= len(args) <= 2:
+        print("🎤 Usage: python run_compare.py <run_a> [<run_b>] [--diff] [--max-diff-lines=200] "
+              "[--threshold=5] [--fail-on-regression]")
+        print("   run_b defaults to the latest run; runs are ids under runs/ or paths")
+        sys.exit(1)
+
+    def locate(arg):
+        return Path(arg) if os.sep in arg or Path(arg).is_absolute() else resolve_run(arg)
+    run_a, run_b = locate(args[0]), locate(args[1]) if len(args) > 1 else resolve_run()
+    for run in (run_a, run_b):
+        if not run or not run.is_dir():
+            print(f"❌ Run {run} not found!")
+            sys.exit(1)
+
+    comparison = RunComparison(run_a, run_b)
+    regressions = report(comparison, "--diff" in sys.argv, int(options.get("max-diff-lines", 200)),
+                         float(options.get("threshold", 5)))
+    if regressions and "--fail-on-regression" in sys.argv:
+        sys.exit(2)
+
+if __name__ == "__main__":
+    main()
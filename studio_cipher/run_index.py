@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Run Index
+SQLite record of every run - missions, deliverables, timings and QA scores without a directory crawl
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+
+from cipher_runs import RUNS_DIR, list_run_dirs
+
+INDEX_NAME = ".index.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    mission TEXT,
+    goal TEXT,
+    acceptance TEXT,
+    status TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_mission ON runs (mission);
+CREATE INDEX IF NOT EXISTS runs_by_status ON runs (status);
+
+CREATE TABLE IF NOT EXISTS deliverables (
+    run_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    item TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    done_at TEXT,
+    PRIMARY KEY (run_id, category, item)
+);
+
+-- Every run-relative path that satisfies a deliverable
+CREATE TABLE IF NOT EXISTS deliverable_paths (
+    run_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    category TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (run_id, path, category, item)
+);
+
+CREATE TABLE IF NOT EXISTS timings (
+    run_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    seconds REAL,
+    recorded_at TEXT,
+    PRIMARY KEY (run_id, kind, name)
+);
+
+CREATE TABLE IF NOT EXISTS qa_scores (
+    run_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    round TEXT NOT NULL,
+    score REAL,
+    issues INTEGER,
+    recorded_at TEXT,
+    PRIMARY KEY (run_id, source, round)
+);
+"""
+
+def index_path(runs_dir=None):
+    return Path(runs_dir or RUNS_DIR) / INDEX_NAME
+
+def connect(runs_dir=None):
+    """Open (and create) the index - WAL lets the runner write while progress reads"""
+    path = index_path(runs_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def _now():
+    return datetime.now().isoformat()
+
+def _run(run_dir):
+    """(runs_dir, run_id) for a run directory"""
+    run_dir = Path(run_dir)
+    return run_dir.parent, run_dir.name
+
+def deliverable_paths(category, item):
+    """Run-relative paths that count as a deliverable being there (same rules as check_progress)"""
+    primary = item if item.startswith("src/") else f"{category}/{item}"
+    return sorted({primary, f"{category}/{Path(item).name}"})
+
+def scan_paths(run_dir, wanted=None):
+    """Every run-relative path under run_dir, from a single os.scandir walk.
+
+    Given `wanted` paths, only the directories leading to them are entered,
+    so a run full of agent scratch files costs one listing per deliverable
+    folder rather than a stat per candidate path.
+    """
+    dirs = None
+    if wanted is not None:
+        dirs = {parent.as_posix() for path in wanted for parent in PurePosixPath(path).parents}
+    found, stack = set(), [("", os.fspath(run_dir))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                path = prefix + entry.name
+                found.add(path)
+                if entry.is_dir(follow_symlinks=False) and (dirs is None or path in dirs):
+                    stack.append((path + "/", entry.path))
+    return found
+
+def present_paths(run_dir, deliverables):
+    """Paths of these (category, item) deliverables that exist in run_dir - one walk for all of them"""
+    wanted = {path for category, item in deliverables for path in deliverable_paths(category, item)}
+    return sorted(wanted & scan_paths(run_dir, wanted))
+
+def record_run(run_dir, mission_name, mission, status="running", created_at=None):
+    """Register a run and its mission's deliverables (all pending)"""
+    runs_dir, run_id = _run(run_dir)
+    mission = mission or {}
+    with closing(connect(runs_dir)) as conn, conn:
+        conn.execute(
+            "INSERT INTO runs (run_id, mission, goal, acceptance, status, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (run_id) DO UPDATE SET "
+            "mission = excluded.mission, goal = excluded.goal, acceptance = excluded.acceptance, "
+            "status = excluded.status, updated_at = excluded.updated_at",
+            (run_id, mission_name, mission.get("goal", ""), json.dumps(mission.get("acceptance", [])),
+             status, created_at or _now(), _now()))
+        position = 0
+        for category, items in (mission.get("deliverables") or {}).items():
+            for item in items:
+                conn.execute("INSERT OR IGNORE INTO deliverables (run_id, category, item, position) "
+                             "VALUES (?, ?, ?, ?)", (run_id, category, item, position))
+                conn.executemany("INSERT OR IGNORE INTO deliverable_paths VALUES (?, ?, ?, ?)",
+                                 [(run_id, path, category, item) for path in deliverable_paths(category, item)])
+                position += 1
+
+def set_status(run_dir, status):
+    runs_dir, run_id = _run(run_dir)
+    with closing(connect(runs_dir)) as conn, conn:
+        conn.execute("UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?", (status, _now(), run_id))
+
+def set_archived(runs_dir, run_id, archived=True):
+    with closing(connect(runs_dir)) as conn, conn:
+        conn.execute("UPDATE runs SET archived = ?, updated_at = ? WHERE run_id = ?",
+                     (int(archived), _now(), run_id))
+
+def mark_written(run_dir, paths):
+    """Tick off every deliverable one of these run-relative paths satisfies"""
+    runs_dir, run_id = _run(run_dir)
+    paths = [p for p in paths if p]
+    if not paths:
+        return 0
+    with closing(connect(runs_dir)) as conn, conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS written (path TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM written")
+        conn.executemany("INSERT OR IGNORE INTO written VALUES (?)", [(str(p),) for p in paths])
+        cursor = conn.execute(
+            "UPDATE deliverables SET done = 1, done_at = ? WHERE run_id = ? AND done = 0 AND "
+            "(category, item) IN (SELECT category, item FROM deliverable_paths "
+            " WHERE run_id = ? AND path IN (SELECT path FROM written))", (_now(), run_id, run_id))
+        conn.execute("UPDATE runs SET updated_at = ? WHERE run_id = ?", (_now(), run_id))
+        return cursor.rowcount
+
+def mark_missing(run_dir, paths, present=None):
+    """Un-tick every deliverable one of these gone paths satisfied, unless another of its paths is there.
+
+    `present` is every run-relative path known to exist, when the caller
+    has just walked the run; otherwise the other candidate paths are stat'ed.
+    """
+    runs_dir, run_id = _run(run_dir)
+    paths = [p for p in paths if p]
+    if not paths:
+        return 0
+    with closing(connect(runs_dir)) as conn, conn:
+        placeholders = ",".join("?" * len(paths))
+        affected = conn.execute(
+            "SELECT DISTINCT d.category, d.item FROM deliverables d JOIN deliverable_paths p "
+            "ON p.run_id = d.run_id AND p.category = d.category AND p.item = d.item "
+            f"WHERE d.run_id = ? AND d.done = 1 AND p.path IN ({placeholders})",
+            (run_id, *map(str, paths))).fetchall()
+        gone = []
+        for category, item in affected:
+            others = deliverable_paths(category, item)
+            if present is not None:
+                still_there = any(path in present for path in others)
+            else:
+                still_there = any((Path(run_dir) / path).exists() for path in others)
+            if not still_there:
+                gone.append((category, item))
+        conn.executemany("UPDATE deliverables SET done = 0, done_at = NULL "
+                         "WHERE run_id = ? AND category = ? AND item = ?",
+                         [(run_id, category, item) for category, item in gone])
+        if gone:
+            conn.execute("UPDATE runs SET updated_at = ? WHERE run_id = ?", (_now(), run_id))
+        return len(gone)
+
+def record_timings(run_dir, kind, timings):
+    """name -> seconds for gates, pipeline stages and the like"""
+    runs_dir, run_id = _run(run_dir)
+    with closing(connect(runs_dir)) as conn, conn:
+        conn.executemany("INSERT OR REPLACE INTO timings VALUES (?, ?, ?, ?, ?)",
+                         [(run_id, kind, name, seconds, _now()) for name, seconds in timings.items()])
+
+def record_qa(run_dir, source, round_name, score=None, issues=None):
+    if run_dir is None:
+        return
+    runs_dir, run_id = _run(run_dir)
+    with closing(connect(runs_dir)) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO qa_scores VALUES (?, ?, ?, ?, ?, ?)",
+                     (run_id, source, str(round_name), score, issues, _now()))
+
+def index_run(run_dir):
+    """Backfill a run written before the index existed - reads it from disk once"""
+    run_dir = Path(run_dir)
+    mission, mission_name = {}, None
+    mission_file = run_dir / "mission.json"
+    if mission_file.exists():
+        with open(mission_file, encoding="utf-8") as f:
+            mission = json.load(f)
+    from phase_journal import PhaseJournal
+    started = PhaseJournal(run_dir).last_start("mission")
+    if started:
+        mission_name = started.get("mission")
+    created = datetime.fromtimestamp(run_dir.stat().st_mtime).isoformat()
+    record_run(run_dir, mission_name, mission, status="indexed", created_at=created)
+
+    mark_written(run_dir, present_paths(run_dir, [(category, item) for category, items in
+                                                  (mission.get("deliverables") or {}).items() for item in items]))
+
+def forget_runs(runs_dir, run_ids):
+    with closing(connect(runs_dir)) as conn, conn:
+        for table in ("runs", "deliverables", "deliverable_paths", "timings", "qa_scores"):
+            conn.executemany(f"DELETE FROM {table} WHERE run_id = ?", [(r,) for r in run_ids])
+
+def ensure_indexed(runs_dir=None):
+    """Index every hot run the index has not seen yet - returns how many were added.
+
+    Runs deleted by hand (gone from runs/ without being archived) are dropped.
+    """
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    with closing(connect(runs_dir)) as conn:
+        known = {row["run_id"]: row["archived"] for row in conn.execute("SELECT run_id, archived FROM runs")}
+    hot = list_run_dirs(runs_dir)
+    hot_names = {d.name for d in hot}
+    gone = [run_id for run_id, archived in known.items() if run_id not in hot_names and not archived]
+    if gone:
+        forget_runs(runs_dir, gone)
+    missing = [d for d in hot if d.name not in known]
+    for run_dir in missing:
+        index_run(run_dir)
+    return len(missing)
+
+def list_runs(runs_dir=None, mission=None, status=None, include_archived=False):
+    """Runs newest first with deliverable counts - one indexed query"""
+    query = ("SELECT r.*, COUNT(d.item) AS total, COALESCE(SUM(d.done), 0) AS done FROM runs r "
+             "LEFT JOIN deliverables d ON d.run_id = r.run_id WHERE 1 = 1")
+    params = []
+    if mission:
+        query += " AND r.mission = ?"
+        params.append(mission)
+    if status:
+        query += " AND r.status = ?"
+        params.append(status)
+    if not include_archived:
+        query += " AND r.archived = 0"
+    query += " GROUP BY r.run_id ORDER BY r.run_id DESC"
+    with closing(connect(runs_dir)) as conn:
+        return [dict(row) for row in conn.execute(query, params)]
+
+def progress(run_dir):
+    """Goal, acceptance and deliverable status of one run - None when it is not indexed"""
+    runs_dir, run_id = _run(run_dir)
+    with closing(connect(runs_dir)) as conn:
+        run = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if run is None:
+            return None
+        deliverables = conn.execute("SELECT category, item, done FROM deliverables WHERE run_id = ? "
+                                    "ORDER BY position", (run_id,)).fetchall()
+        timings = conn.execute("SELECT kind, name, seconds FROM timings WHERE run_id = ? "
+                               "ORDER BY kind, name", (run_id,)).fetchall()
+        scores = conn.execute("SELECT source, round, score, issues FROM qa_scores WHERE run_id = ? "
+                              "ORDER BY recorded_at", (run_id,)).fetchall()
+    return {
+        **dict(run),
+        "acceptance": json.loads(run["acceptance"] or "[]"),
+        "deliverables": [dict(d) for d in deliverables],
+        "timings": [dict(t) for t in timings],
+        "qa_scores": [dict(s) for s in scores],
+    }
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if not args or args[0] not in ("rebuild", "list", "show") or (args[0] == "show" and len(args) < 2):
+        print("🎤 Usage: python run_index.py list [--mission=<name>] [--status=<status>] [--archived]")
+        print("         python run_index.py show <run_id>")
+        print("         python run_index.py rebuild")
+        sys.exit(1)
+
+    if args[0] == "rebuild":
+        index_path().unlink(missing_ok=True)
+        print(f"🗂️ Indexed {ensure_indexed()} runs into {index_path()}")
+    elif args[0] == "list":
+        ensure_indexed()
+        for run in list_runs(mission=options.get("mission"), status=options.get("status"),
+                             include_archived="--archived" in sys.argv):
+            flag = " 🗄️" if run["archived"] else ""
+            print(f"  📁 {run['run_id']} [{run['status']}] {run['done']}/{run['total']} - "
+                  f"{(run['goal'] or '')[:50]}{flag}")
+    else:
+        run = progress(Path(RUNS_DIR) / args[1])
+        if not run:
+            print(f"❌ Run {args[1]} is not indexed")
+            sys.exit(1)
+        print(f"📁 {run['run_id']} [{run['status']}] {run['mission'] or ''} - {run['goal']}")
+        for d in run["deliverables"]:
+            print(f"  {'✅' if d['done'] else '⏳'} {d['category']}/{d['item']}")
+        for t in run["timings"]:
+            print(f"  ⏱️ {t['kind']} {t['name']}: {t['seconds']:.3f}s")
+        for s in run["qa_scores"]:
+            score = f"{s['score']:.1f}" if s["score"] is not None else "-"
+            print(f"  🎬 {s['source']} round {s['round']}: score {score}, issues {s['issues']}")
+
+if __name__ == "__main__":
+    main()
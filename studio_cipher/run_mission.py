@@ -5,9 +5,14 @@ Execute multi-agent development missions with hip-hop professional crew
 """
 
 from pathlib import Path
-import yaml
 import json
 from datetime import datetime
+from agent_engine import DEFAULT_GATES, AgentEngine
+from build_manifest import write_text_atomic
+from config_cache import load_yaml
+from phase_journal import PhaseJournal
+import cipher_trace
+import run_index
 
 def load_mission(mission_name):
     """Load mission configuration"""
@@ -15,55 +20,32 @@ def load_mission(mission_name):
     if not mission_file.exists():
         mission_file = Path(f"missions/{mission_name}")
     
-    with open(mission_file, 'r', encoding='utf-8-sig') as f:  # Handle BOM
-        return yaml.safe_load(f)
+    return load_yaml(mission_file)  # Snapshot cache, BOM handled
 
 def load_settings():
     """Load system settings"""
-    with open('settings.yml', 'r', encoding='utf-8-sig') as f:
-        return yaml.safe_load(f)
+    return load_yaml('settings.yml')
 
-def run_mission(mission_name):
-    """Execute a mission with the multi-agent crew"""
-    
-    # Load mission and settings
-    mission = load_mission(mission_name)
-    settings = load_settings()
-    
-    # Create output directory
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    outdir = Path(settings['paths']['runs_dir']) / timestamp
-    outdir.mkdir(parents=True, exist_ok=True)
-    
-    print("🎤" * 20)
-    print("STUDIO CIPHER - HIP-HOP DEVELOPMENT CREW")  
-    print("🎤" * 20)
-    print(f"\n🎯 MISSION: {mission['goal']}")
-    print(f"📁 OUTPUT: {outdir}")
-    print("\n🎵 CREW ASSEMBLING...")
-    
-    # Load agent prompts
-    agents = {}
-    for agent_name in ['producer', 'lyricist', 'designer', 'security']:
-        prompt_file = Path(f"prompts/{agent_name}-simple.yml")
-        if prompt_file.exists():
-            with open(prompt_file, 'r', encoding='utf-8-sig') as f:
-                agents[agent_name] = yaml.safe_load(f)
-            print(f"  ✓ {agent_name.title()} loaded and ready")
-        else:
-            print(f"  ⚠ {agent_name.title()} prompt not found")
+def write_agent_status(outdir, agent_name, prompt, status):
+    """Drop a status.json for an agent"""
+    agent_dir = outdir / agent_name
+    agent_dir.mkdir(exist_ok=True)
+    
+    status_data = {
+        "agent": agent_name,
+        "status": status,
+        "updated_at": datetime.now().isoformat(),
+        "responsibilities": prompt.get('responsibilities', []),
+        "outputs": prompt.get('outputs', [])
+    }
     
-    print(f"\n🚀 STARTING MISSION: {mission_name}")
-    print("\n" + "="*60)
-    print("PHASE 1: ARCHITECTURE & PLANNING")
-    print("="*60)
+    status_file = agent_dir / "status.json"
+    write_text_atomic(status_file, json.dumps(status_data, indent=2))
     
-    # Save mission details
-    mission_file = outdir / "mission.json"
-    with open(mission_file, 'w') as f:
-        json.dump(mission, f, indent=2)
-    
-    # Create initial plan (like your terminal showed)
+    return f"{agent_name}/status.json"
+
+def producer_execution_plan(outdir):
+    """Producer lays down the execution plan"""
     plan = [
         "✓ Mission loaded and crew assembled",
         "✓ Output directory created", 
@@ -74,41 +56,16 @@ def run_mission(mission_name):
     
     plan_text = "# Studio Cipher Execution Plan\n\n" + "\n".join(f"- {p}" for p in plan)
     plan_file = outdir / "execution-plan.md"
-    plan_file.write_text(plan_text, encoding="utf-8")
-    
-    print("📋 EXECUTION PLAN CREATED")
-    
-    # Now actually start the agents working
-    print("\n🎵 AGENTS STARTING WORK...")
-    
-    # Create agent output directories
-    for agent_name in agents.keys():
-        agent_dir = outdir / agent_name
-        agent_dir.mkdir(exist_ok=True)
-        
-        # Create a status file for each agent
-        status = {
-            "agent": agent_name,
-            "status": "working",
-            "started_at": datetime.now().isoformat(),
-            "responsibilities": agents[agent_name].get('responsibilities', []),
-            "outputs": agents[agent_name].get('outputs', [])
-        }
-        
-        status_file = agent_dir / "status.json"
-        with open(status_file, 'w') as f:
-            json.dump(status, f, indent=2)
-        
-        print(f"  🎤 {agent_name.title()} started working...")
-    
-    # Create some sample deliverables to show progress
-    print("\n🔥 CREATING INITIAL DELIVERABLES...")
+    write_text_atomic(plan_file, plan_text)
     
+    return "execution-plan.md"
+
+def designer_login_component(outdir):
+    """Designer drops the LoginCypher component"""
     # Create frontend structure
     frontend_dir = outdir / "frontend" / "src"
     frontend_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create a sample component
     login_component = """import React, { useState } from 'react';
 import styles from './LoginCypher.module.css';
 
@@ -180,15 +137,15 @@ export default LoginCypher;
     
     login_file = frontend_dir / "components" / "auth" / "LoginCypher.jsx"
     login_file.parent.mkdir(parents=True, exist_ok=True)
-    login_file.write_text(login_component, encoding="utf-8")
-    
-    print("  ✅ LoginCypher.jsx created")
+    write_text_atomic(login_file, login_component)
     
-    # Create backend structure  
+    return "frontend/src/components/auth/LoginCypher.jsx"
+
+def lyricist_auth_route(outdir):
+    """Lyricist drops the auth route"""
     backend_dir = outdir / "backend" / "server"
     backend_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create auth route
     auth_route = """const express = require('express');
 const argon2 = require('argon2');
 const rateLimit = require('express-rate-limit');
@@ -235,11 +192,12 @@ module.exports = router;
     
     auth_file = backend_dir / "routes" / "auth-cipher.js"  
     auth_file.parent.mkdir(parents=True, exist_ok=True)
-    auth_file.write_text(auth_route, encoding="utf-8")
-    
-    print("  ✅ auth-cipher.js created")
+    write_text_atomic(auth_file, auth_route)
     
-    # Create security documentation
+    return "backend/server/routes/auth-cipher.js"
+
+def security_threat_model(outdir):
+    """Security Guard writes the threat model"""
     security_dir = outdir / "security" / "docs" / "security"
     security_dir.mkdir(parents=True, exist_ok=True)
     
@@ -282,26 +240,204 @@ This document outlines the security threats and mitigations for the Claim Cipher
 """
     
     threat_file = security_dir / "threat-model.md"
-    threat_file.write_text(threat_model, encoding="utf-8")
+    write_text_atomic(threat_file, threat_model)
+    
+    return "security/docs/security/threat-model.md"
+
+def agent_generation(outdir, agent_name, prompt, mission, settings):
+    """Agent writes its verse for the mission through the model backend"""
+    from generation_cache import cache_from_settings, generation_key
+    from model_backend import agent_request, backend_identity, shared_pool
+    
+    model = settings['models']['default']
+    request = agent_request(agent_name, prompt, mission)
+    cache = cache_from_settings(settings)
+    key = generation_key(model, agent_name, prompt, mission, request.payload(model), backend_identity(settings))
+    cached = cache.get(key) if cache else None
+    
+    with cipher_trace.span(f"{agent_name}.generate", agent=agent_name, phase="model", cached=bool(cached)):
+        if cached:
+            # Same prompt, mission, backend, model and role as an earlier run - reuse its verse
+            text, note = cached['text'], f"{cached['model']} - cached"
+        else:
+            response = shared_pool(settings).generate(request)
+            text, note = response.text, f"{response.model} - {response.attempts} attempt(s)"
+            if cache:
+                cache.put(key, response.text, response.model, response.usage, agent=agent_name)
+    
+    agent_dir = outdir / agent_name
+    agent_dir.mkdir(exist_ok=True)
+    generation = f"# {prompt.get('role', agent_name.title())} - Generation\n\n"
+    generation += f"*Model: {note}*\n\n{text}\n"
+    write_text_atomic(agent_dir / "generation.md", generation)
+    
+    return f"{agent_name}/generation.md"
+
+# Which deliverables each agent drops during the integration gate
+AGENT_DELIVERABLES = {
+    "producer": [],
+    "lyricist": [lyricist_auth_route],
+    "designer": [designer_login_component],
+    "security": [security_threat_model],
+}
+
+def build_engine(settings, agents, outdir, use_processes=False, journal=None, mission=None):
+    """Wire every agent's work units into the engine's review gates"""
+    # Tick deliverables off in the run index the moment a unit lands, not when the mission ends
+    engine = AgentEngine(settings, use_processes=use_processes, journal=journal,
+                         on_commit=lambda unit, artifacts: run_index.mark_written(outdir, artifacts))
+    # By name, so settings.yml may rename, reorder or drop review gates
+    architecture, integration, production = (engine.gate(name) for name in DEFAULT_GATES)
+    
+    engine.schedule("producer", architecture, producer_execution_plan, outdir)
+    for agent_name, prompt in agents.items():
+        if architecture != production:  # one gate for both would race "working" against "complete"
+            engine.schedule(agent_name, architecture, write_agent_status, outdir, agent_name, prompt, "working")
+        for deliverable in AGENT_DELIVERABLES.get(agent_name, []):
+            engine.schedule(agent_name, integration, deliverable, outdir)
+        if mission is not None:
+            engine.schedule(agent_name, integration, agent_generation, outdir, agent_name, prompt, mission, settings)
+        engine.schedule(agent_name, production, write_agent_status, outdir, agent_name, prompt, "complete")
+    
+    return engine
+
+def run_mission(mission_name=None, use_processes=False, resume=None, use_model=False):
+    """Execute a mission with the multi-agent crew - or pick a crashed run back up"""
+    
+    settings = load_settings()
+    
+    if resume:
+        # Continue in the same run directory from the last committed work
+        outdir = Path(settings['paths']['runs_dir']) / resume
+        journal = PhaseJournal(outdir)
+        started = journal.last_start("mission")
+        if not started:
+            raise FileNotFoundError(f"No mission journal in {outdir} - nothing to resume")
+        mission_name = mission_name or started["mission"]
+    else:
+        # Create output directory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        outdir = Path(settings['paths']['runs_dir']) / timestamp
+        outdir.mkdir(parents=True, exist_ok=True)
+        journal = PhaseJournal(outdir)
+        journal.start("mission", mission=mission_name)
+    
+    mission = load_mission(mission_name)
+    cipher_trace.configure(outdir)
+    run_index.record_run(outdir, mission_name, mission)
+    
+    print("🎤" * 20)
+    print("STUDIO CIPHER - HIP-HOP DEVELOPMENT CREW")  
+    print("🎤" * 20)
+    print(f"\n🎯 MISSION: {mission['goal']}")
+    print(f"📁 OUTPUT: {outdir}")
+    print("\n🎵 CREW ASSEMBLING...")
+    
+    # Load agent prompts
+    agents = {}
+    for agent_name in ['producer', 'lyricist', 'designer', 'security']:
+        prompt_file = Path(f"prompts/{agent_name}-simple.yml")
+        if prompt_file.exists():
+            agents[agent_name] = load_yaml(prompt_file)
+            print(f"  ✓ {agent_name.title()} loaded and ready")
+        else:
+            print(f"  ⚠ {agent_name.title()} prompt not found")
+    
+    print(f"\n🚀 {'RESUMING' if resume else 'STARTING'} MISSION: {mission_name}")
     
-    print("  ✅ threat-model.md created")
-    print("\n🎵 READY TO DROP THOSE VERSES!")
+    # Save mission details
+    mission_file = outdir / "mission.json"
+    if not resume or not mission_file.exists():
+        write_text_atomic(mission_file, json.dumps(mission, indent=2))
+    run_index.mark_written(outdir, ["mission.json"])
+    
+    # Every agent works at once - review gates keep the verses in order
+    engine = build_engine(settings, agents, outdir, use_processes=use_processes, journal=journal,
+                          mission=mission if use_model else None)
+    print(f"🎛️ ENGINE: {engine.mode} ({engine.max_workers} workers)")
+    if use_model:
+        from model_backend import shared_pool
+        # Started before the engine so process workers inherit the backend location
+        pool = shared_pool(settings)
+        print(f"🤖 MODEL: {settings['models']['default']} via {pool.backend.host} "
+              f"({pool.max_workers} workers, batch {pool.batch_size})")
+    if engine.committed:
+        print(f"📓 JOURNAL: {len(engine.committed)} committed steps will be skipped")
+    
+    with cipher_trace.span(f"mission {mission_name}", phase="mission", resumed=bool(resume)):
+        reports = engine.run()
+    
+    for report in reports:
+        print("\n" + "="*60)
+        print(f"REVIEW GATE: {report['gate'].upper()}")
+        print("="*60)
+        for agent_name in report['agents']:
+            for outcome in engine.results[agent_name]:
+                if outcome['phase'] != report['gate']:
+                    continue
+                if outcome['error']:
+                    print(f"  ❌ {agent_name.title()}: {outcome['unit']} failed - {outcome['error']}")
+                elif outcome['skipped']:
+                    print(f"  ⏭️ {agent_name.title()}: {outcome['result']} (already done)")
+                else:
+                    print(f"  ✅ {agent_name.title()}: {outcome['result']}")
+        print(f"⏱️ {report['wall_seconds']:.3f}s wall / {report['agent_seconds']:.3f}s agent time")
+        if not report['passed']:
+            print(f"🛑 {report['reviewer'].title()} blocked the {report['gate']} gate")
+    
+    status = "initialized" if engine.passed else "blocked"
+    
+    # Units already ticked themselves off as they committed - this also covers
+    # units a resume skipped, so progress and history never crawl the run
+    written = ["mission.json"]
+    for outcomes in engine.results.values():
+        for outcome in outcomes:
+            result = outcome['result']
+            written.extend(result if isinstance(result, (list, tuple)) else [result] if result else [])
+    run_index.mark_written(outdir, written)
+    run_index.record_timings(outdir, "gate", {r['gate']: r['wall_seconds'] for r in reports})
+    run_index.set_status(outdir, "complete" if engine.passed else "blocked")
+    
+    print("\n🎵 READY TO DROP THOSE VERSES!" if engine.passed else "\n⚠ Mission paused at a review gate")
     print(f"\n📁 Check your progress in: {outdir}")
     print("\n" + "🎤" * 20)
     
-    return {"status": "initialized", "output_dir": str(outdir), "agents_loaded": len(agents)}
+    return {"status": status, "output_dir": str(outdir), "agents_loaded": len(agents)}
 
-if __name__ == "__main__":
+def main():
     import sys
     
-    if len(sys.argv) != 2:
-        print("🎤 Usage: python run_mission.py <mission_name>")
+    argv = sys.argv[1:]
+    resume = None
+    if "--resume" in argv:
+        at = argv.index("--resume")
+        resume = argv[at + 1] if at + 1 < len(argv) else None
+        argv = argv[:at] + argv[at + 2:]
+    args = [a for a in argv if not a.startswith("--")]
+    use_processes = "--processes" in argv
+    use_model = "--model" in argv
+    
+    missing_resume_id = "--resume" in sys.argv and not resume
+    if missing_resume_id or len(args) > 1 or (not args and not resume):
+        print("🎤 Usage: python run_mission.py <mission_name> [--processes] [--model]")
+        print("         python run_mission.py --resume <run_id>")
         print("\n🎯 Available missions:")
         missions_dir = Path("missions")
         for mission_file in missions_dir.glob("*.yml"):
             print(f"  • {mission_file.stem}")
         sys.exit(1)
     
-    mission_name = sys.argv[1]
-    result = run_mission(mission_name)
-    print(f"\n✅ Mission initialized successfully!")
+    mission_name = args[0] if args else None
+    try:
+        result = run_mission(mission_name, use_processes=use_processes, resume=resume, use_model=use_model)
+    except FileNotFoundError as exc:
+        print(f"❌ {exc}")
+        sys.exit(1)
+    if result["status"] == "initialized":
+        print(f"\n✅ Mission initialized successfully!")
+    else:
+        print(f"\n❌ Mission blocked at a review gate")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
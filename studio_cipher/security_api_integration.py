@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from build_manifest import write_text_atomic
+
 def integrate_google_maps_api():
     """Security Agent integrates Google Maps API key into applications"""
     
@@ -325,5 +327,4 @@ if __name__ == "__main__":
     
     # Save results
     os.makedirs('runs/20250813_203814/security', exist_ok=True)
-    with open('runs/20250813_203814/security/api_integration.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    write_text_atomic('runs/20250813_203814/security/api_integration.json', json.dumps(result, indent=2))
@@ -6,8 +6,9 @@ Adding authentication, session management, and security features
 
 import os
 from datetime import datetime
+from merge_engine import commit_edit, report
 
-def security_command_center():
+def security_command_center(app_dir="C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"):
     """Security Agent adds authentication and security to Command Center"""
     
     print("🔒" * 50)
@@ -18,8 +19,6 @@ def security_command_center():
     print("🎯 MISSION: Authentication, session management, secure navigation")
     print("🛡️ APPROACH: Session validation, secure logout, auth guards")
     
-    app_dir = "C:/Users/vlong/Projects/studio_cipher/claim_cipher_app"
-    
     print("🔍 Security Agent: Adding security features to Command Center...")
     
     # Create security enhancement JavaScript
@@ -541,16 +540,24 @@ setTimeout(addSecurityStatus, 1000);'''
     command_center_path = f"{app_dir}/command-center.html"
     
     with open(command_center_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+        base_html = f.read()
+    html_content = base_html
     
     # Add security script before the main command center script
     security_script_tag = '    <script src="scripts/command-center-security.js"></script>\n    <script src="scripts/command-center.js"></script>'
     
-    # Replace the existing script tag
-    html_content = html_content.replace(
-        '    <script src="scripts/command-center.js"></script>',
-        security_script_tag
-    )
+    if 'scripts/command-center.js' in html_content:
+        # Replace the existing script tag
+        html_content = html_content.replace(
+            '    <script src="scripts/command-center.js"></script>',
+            security_script_tag
+        )
+    else:
+        # Lyricist is still working - the merge puts our script ahead of theirs
+        html_content = html_content.replace(
+            '</body>',
+            '    <script src="scripts/command-center-security.js"></script>\n</body>'
+        )
     
     # Add security styling
     security_css = '''
@@ -587,15 +594,21 @@ setTimeout(addSecurityStatus, 1000);'''
     }
     '''
     
-    # Add security CSS to the HTML
-    html_content = html_content.replace(
-        '</style>\n</head>',
-        security_css + '\n    </style>\n</head>'
-    )
-    
-    # Write updated HTML
-    with open(command_center_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Add security CSS to the HTML - into the designer's head stylesheet, or a block of our own
+    if '</style>\n</head>' in html_content:
+        html_content = html_content.replace(
+            '</style>\n</head>',
+            security_css + '\n    </style>\n</head>'
+        )
+    else:
+        html_content = html_content.replace(
+            '</head>',
+            '    <style>' + security_css + '\n    </style>\n</head>',
+            1
+        )
+    
+    # Merge against the page we read - other agents may be editing it right now
+    report(commit_edit(command_center_path, "security", base_html, html_content), "Security Agent: ")
     
     print("✅ Security Agent: Security features integrated into Command Center")
     
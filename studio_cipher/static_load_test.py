@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Static Load Test
+The static server against python -m http.server on the same dist - throughput, latency and bytes on the wire
+"""
+
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+from asset_bundler import APP_NAME, DIST_NAME
+from cipher_runs import STUDIO_DIR, resolve_run
+from precompress import ENCODINGS
+
+ACCEPT_ENCODING = "br, gzip"  # what every current browser sends
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(name, root, port):
+    if name == "http.server":
+        command = [sys.executable, "-m", "http.server", str(port), "--bind", "127.0.0.1", "--directory", str(root)]
+    else:
+        command = [sys.executable, str(STUDIO_DIR / "static_server.py"), str(root), f"--port={port}"]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"{name} did not start on port {port}")
+
+def site_paths(root):
+    """URL paths of every file a browser would ask for - compressed siblings are the server's business"""
+    suffixes = tuple(ENCODINGS.values())
+    return ["/" + quote(p.relative_to(root).as_posix()) for p in sorted(Path(root).rglob("*"))
+            if p.is_file() and not p.name.endswith(suffixes) and not p.name.startswith(".")]
+
+class Client:
+    """One browser-like connection: keep-alive when the server allows it, reconnect when it does not"""
+
+    def __init__(self, port, stats):
+        self.port = port
+        self.stats = stats
+        self.reader = self.writer = None
+
+    async def get(self, path, headers):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+            self.stats["connections"] += 1
+        lines = [f"GET {path} HTTP/1.1", "Host: 127.0.0.1", f"Accept-Encoding: {ACCEPT_ENCODING}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        version, status = status_line.decode("latin-1").split()[:2]
+        response = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            response[name.strip().lower()] = value.strip()
+        if status in ("304", "204"):
+            body = b""
+        elif "content-length" in response:
+            body = await self.reader.readexactly(int(response["content-length"]))
+        else:
+            body = await self.reader.read()
+        self.stats["bytes"] += len(status_line) + sum(len(k) + len(v) + 4 for k, v in response.items()) + len(body)
+        keep = (version == "HTTP/1.1" and response.get("connection", "").lower() != "close") or \
+            response.get("connection", "").lower() == "keep-alive"
+        if not keep:
+            self.close()
+        return int(status), response
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+async def visit(port, paths, total, concurrency, validators=None):
+    """`total` requests over `concurrency` connections; validators (path -> headers) make it a revisit.
+
+    On a revisit a path whose validators are None was cached as fresh the
+    first time round - a browser would not ask for it at all.
+    """
+    stats = {"connections": 0, "bytes": 0, "statuses": {}, "latencies": [], "from_cache": 0}
+    learned = {}
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(paths[i % len(paths)])
+
+    async def worker():
+        client = Client(port, stats)
+        try:
+            while not queue.empty():
+                path = queue.get_nowait()
+                if validators is not None and validators.get(path, {}) is None:
+                    stats["from_cache"] += 1
+                    continue
+                started = time.perf_counter()
+                status, response = await client.get(path, (validators or {}).get(path) or {})
+                stats["latencies"].append(time.perf_counter() - started)
+                stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+                cached = {}
+                if "etag" in response:
+                    cached["If-None-Match"] = response["etag"]
+                if "last-modified" in response:
+                    cached["If-Modified-Since"] = response["last-modified"]
+                fresh = "immutable" in response.get("cache-control", "")
+                learned[path] = None if fresh else cached
+        finally:
+            client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats["wall_seconds"] = time.perf_counter() - started
+    stats["learned"] = learned
+    return stats
+
+def summarize(stats):
+    latencies = sorted(stats["latencies"])
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+    return {"requests": len(latencies), "from_cache": stats["from_cache"],
+            "throughput": (len(latencies) + stats["from_cache"]) / stats["wall_seconds"],
+            "p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99), "bytes": stats["bytes"],
+            "connections": stats["connections"], "statuses": dict(sorted(stats["statuses"].items()))}
+
+def load_test(root, total=2000, concurrency=32):
+    """First visit and revisit against each server - name -> {scenario: summary}"""
+    paths = site_paths(root)
+    report = {}
+    for name in ("http.server", "static_server"):
+        port = free_port()
+        process = start_server(name, root, port)
+        try:
+            first = asyncio.run(visit(port, paths, total, concurrency))
+            again = asyncio.run(visit(port, paths, total, concurrency, first["learned"]))
+        finally:
+            process.terminate()
+            process.wait()
+        report[name] = {"first visit": summarize(first), "revisit": summarize(again)}
+    return report
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if len(args) > 1 or any(a in ("-h", "--help") for a in sys.argv[1:]):
+        print("🎤 Usage: python static_load_test.py [<run_id> | <dist_dir>] [--requests=2000] [--concurrency=32]")
+        print(f"   Serves the same {DIST_NAME} with both servers and replays every file against each")
+        sys.exit(1)
+
+    target = args[0] if args else None
+    if target and Path(target).is_dir() and not (Path(target) / APP_NAME).is_dir():
+        root = Path(target)
+    else:
+        run_dir = resolve_run(target)
+        root = run_dir / DIST_NAME if run_dir else None
+    if not root or not root.is_dir():
+        print(f"❌ No {DIST_NAME} to serve - run `python cipher.py bundle` first, or give a directory")
+        sys.exit(1)
+
+    total, concurrency = int(options.get("requests", 2000)), int(options.get("concurrency", 32))
+    report = load_test(root, total, concurrency)
+
+    print(f"🏁 STATIC SERVER LOAD TEST - {root}")
+    print("=" * 60)
+    print(f"  {total} requests per scenario over {concurrency} connections, Accept-Encoding: {ACCEPT_ENCODING}")
+    for name, scenarios in report.items():
+        print(f"\n  🖥️ {name}")
+        for scenario, r in scenarios.items():
+            statuses = ", ".join(f"{count} × {status}" for status, count in r["statuses"].items())
+            print(f"    {scenario:<12} {r['throughput']:8.0f} req/s   p50 {r['p50'] * 1000:6.1f} ms   "
+                  f"p95 {r['p95'] * 1000:6.1f} ms   p99 {r['p99'] * 1000:6.1f} ms")
+            if r["from_cache"]:
+                statuses += f", {r['from_cache']} never requested (immutable)"
+            print(f"    {'':<12} {r['bytes']:>10,} bytes   {r['connections']:,} connections   {statuses}")
+    baseline, ours = report["http.server"], report["static_server"]
+    for scenario in ("first visit", "revisit"):
+        print(f"\n  ⚡ {scenario}: {ours[scenario]['throughput'] / baseline[scenario]['throughput']:.1f}× the "
+              f"throughput, {ours[scenario]['bytes'] / max(baseline[scenario]['bytes'], 1):.0%} of the bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Static Server
+Serves a bundled app - precompressed variants, strong ETags, immutable bundles, keep-alive and ranges
+"""
+
+import asyncio
+import json
+import mimetypes
+import os
+import re
+import sys
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from asset_bundler import BUNDLE_DIR, HASH_LENGTH
+from build_manifest import MANIFEST_NAME, content_hash, file_hash
+from precompress import ENCODINGS
+
+mimetypes.add_type("text/javascript", ".js")
+mimetypes.add_type("text/javascript", ".mjs")
+mimetypes.add_type("image/svg+xml", ".svg")
+mimetypes.add_type("text/markdown", ".md")
+TEXT_TYPES = ("text/", "application/json", "image/svg+xml")
+
+# Bundle names carry their content hash, so a URL never changes meaning - cache it for a year
+HASHED = re.compile(rf"(^|/){re.escape(BUNDLE_DIR)}/[^/]+\.[0-9a-f]{{{HASH_LENGTH}}}\.\w+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"  # pages keep their URL across builds - always check the ETag
+KEEPALIVE_SECONDS = 15    # idle time allowed between requests, and to send one request's head
+MAX_HEADERS = 100
+MAX_BODY_BYTES = 8 << 10   # GET and HEAD have no use for a body - anything bigger is refused unread
+CACHE_BYTES = 64 << 20      # file bodies held in memory, all files together
+MAX_CACHED_FILE = 1 << 20   # bigger files are read from disk per request
+CHUNK_BYTES = 256 << 10
+RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def accepted_encodings(header):
+    """Content-Encodings the client takes, by its q-values - `gzip;q=0` rules gzip out"""
+    weights = {}
+    for part in (header or "").split(","):
+        name, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if name:
+            weights[name.lower()] = q
+    wildcard = weights.get("*", 0.0)
+    return [encoding for encoding in ENCODINGS if weights.get(encoding, wildcard) > 0]
+
+def content_type(path):
+    kind, packed = mimetypes.guess_type(path.name)
+    if packed:
+        return "application/gzip" if packed == "gzip" else "application/octet-stream"  # x.tar.gz is an archive
+    kind = kind or "application/octet-stream"
+    return f"{kind}; charset=utf-8" if kind.startswith(TEXT_TYPES) else kind
+
+def byte_range(header, size):
+    """(start, end inclusive) of a single `bytes=` range, None to send everything, or False if unsatisfiable"""
+    match = RANGE.match((header or "").strip())
+    if not match or match.groups() == ("", ""):
+        return None  # several ranges or another unit - a full 200 is always allowed
+    first, last = match.groups()
+    if not first:
+        length = int(last)
+        return (max(size - length, 0), size - 1) if length and size else False
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None  # invalid - ignored, not refused
+    return (start, end) if start < size else False
+
+def etag_matches(header, etag):
+    """If-None-Match: weak comparison, so W/"x" matches "x" as well"""
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in (t[2:] if t.startswith("W/") else t for t in tags)
+
+class FileEntry:
+    """What one file on disk answers with, valid while its size and mtime stay put"""
+
+    def __init__(self, path, stat, etag, data=None):
+        self.path = path
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.etag = etag
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.data = data
+
+    def fresh(self, stat):
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+class StaticSite:
+    """One directory of files, resolved safely and matched to the best stored encoding.
+
+    ETags are the sha256 the build manifest recorded for the exact file
+    sent - the gzip variant has its own, as a strong validator must. The
+    manifest is trusted only while a file's size and mtime still match
+    it; anything else (or a dist built outside a run) is hashed once and
+    remembered until the file changes. Small files stay in memory.
+    """
+
+    def __init__(self, root, cache_bytes=CACHE_BYTES):
+        self.root = Path(root).resolve()
+        self.cache_bytes = cache_bytes
+        self.cached_bytes = 0
+        self.entries = {}
+        self.manifest_path = self.root.parent / MANIFEST_NAME
+        self.manifest = {}
+        self.manifest_mtime = None
+
+    def inside(self, path):
+        """Whether path really lives under the root - a symlink in dist must not lead out of it"""
+        return path.resolve().is_relative_to(self.root)
+
+    def resolve(self, url_path):
+        """The file a URL path names, or None - nothing outside the root, no dot files.
+
+        A stored .gz/.br sibling is not a URL of its own: asked for directly
+        it would go out labelled as its page with no Content-Encoding.
+        """
+        parts = [p for p in unquote(url_path).split("/") if p not in ("", ".")]
+        if any(p == ".." or p.startswith(".") or "\\" in p or "\0" in p for p in parts):
+            return None
+        path = self.root.joinpath(*parts)
+        if path.is_dir():
+            path = path / "index.html"
+        if not path.is_file() or not self.inside(path):
+            return None
+        suffix = next((s for s in ENCODINGS.values() if path.name.endswith(s)), None)
+        if suffix and path.with_name(path.name[:-len(suffix)]).is_file():
+            return None
+        return path
+
+    def variant(self, path, accept_encoding):
+        """(file to send, its Content-Encoding or None) - the smallest stored variant the client takes"""
+        for encoding in accepted_encodings(accept_encoding):
+            candidate = path.with_name(path.name + ENCODINGS[encoding])
+            if candidate.is_file() and self.inside(candidate):
+                return candidate, encoding
+        return path, None
+
+    def compressible(self, path):
+        return any(path.with_name(path.name + suffix).is_file() for suffix in ENCODINGS.values())
+
+    def cache_control(self, path):
+        return IMMUTABLE if HASHED.search(path.relative_to(self.root).as_posix()) else REVALIDATE
+
+    def _manifest_hash(self, path, stat):
+        try:
+            mtime = self.manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime != self.manifest_mtime:
+            self.manifest_mtime = mtime
+            self.manifest = json.loads(self.manifest_path.read_text()).get("artifacts", {}) if mtime else {}
+        entry = self.manifest.get(path.relative_to(self.root.parent).as_posix())
+        if entry and entry.get("bytes") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+        return None
+
+    def _load(self, path, stat):
+        digest = self._manifest_hash(path, stat)
+        data = None
+        if stat.st_size <= MAX_CACHED_FILE and self.cached_bytes + stat.st_size <= self.cache_bytes:
+            data = path.read_bytes()
+            if len(data) != stat.st_size:
+                data = None  # changed under us - serve from disk until it settles
+            elif digest is None:
+                digest = content_hash(data)
+        return FileEntry(path, stat, f'"{(digest or file_hash(path))[:32]}"', data)
+
+    async def entry(self, path):
+        stat = path.stat()
+        entry = self.entries.get(path)
+        if entry is None or not entry.fresh(stat):
+            if entry is not None and entry.data is not None:
+                self.cached_bytes -= len(entry.data)
+            loop = asyncio.get_running_loop()
+            entry = await loop.run_in_executor(None, self._load, path, stat)
+            self.entries[path] = entry
+            if entry.data is not None:
+                self.cached_bytes += len(entry.data)
+        return entry
+
+def _read_slice(path, start, length):
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(length)
+
+async def _read_head(reader):
+    request = await reader.readline()
+    if not request:
+        return None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise ValueError("too many header fields")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return request, headers
+
+async def _read_request(reader):
+    """(method, target, version, headers), None once the client is gone or idle.
+
+    The whole head shares one deadline - a client trickling header lines
+    cannot hold the connection open any longer than an idle one.
+    """
+    try:
+        head = await asyncio.wait_for(_read_head(reader), KEEPALIVE_SECONDS)
+    except asyncio.TimeoutError:
+        return None
+    if head is None:
+        return None
+    request, headers = head
+    parts = request.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        return "", "", "HTTP/1.0", headers
+    return parts[0], parts[1], parts[2], headers
+
+def _keep_alive(version, headers):
+    tokens = {t.strip().lower() for t in headers.get("connection", "").split(",")}
+    if version == "HTTP/1.1":
+        return "close" not in tokens
+    return "keep-alive" in tokens
+
+async def _respond(writer, status, headers, body=b""):
+    head = f"HTTP/1.1 {status}\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
+    await writer.drain()
+
+async def _error(writer, status, keep_alive, method="GET", extra=None):
+    body = f"{status}\n".encode("utf-8")
+    await _respond(writer, status, {
+        "Date": formatdate(usegmt=True), "Content-Type": "text/plain; charset=utf-8",
+        "Content-Length": len(body), **(extra or {}),
+        "Connection": "keep-alive" if keep_alive else "close"}, body if method != "HEAD" else b"")
+
+async def _send_file(site, writer, method, path, headers, keep_alive):
+    sent, encoding = site.variant(path, headers.get("accept-encoding"))
+    try:
+        entry = await site.entry(sent)
+    except FileNotFoundError:
+        # A rebuild unlinked it (an old hashed bundle) between resolve() and here
+        await _error(writer, "404 Not Found", keep_alive, method)
+        return
+    response = {"Date": formatdate(usegmt=True), "Content-Type": content_type(path),
+                "ETag": entry.etag, "Last-Modified": entry.last_modified,
+                "Cache-Control": site.cache_control(path), "Accept-Ranges": "bytes"}
+    if encoding:
+        response["Content-Encoding"] = encoding
+    if encoding or site.compressible(path):
+        response["Vary"] = "Accept-Encoding"  # caches must not hand gzip to a client that never asked
+    response["Connection"] = "keep-alive" if keep_alive else "close"
+
+    if "if-none-match" in headers:
+        not_modified = etag_matches(headers["if-none-match"], entry.etag)
+    else:
+        try:
+            since = parsedate_to_datetime(headers["if-modified-since"]).timestamp()
+            not_modified = entry.mtime_ns // 1_000_000_000 <= since
+        except (KeyError, TypeError, ValueError):
+            not_modified = False
+    if not_modified:
+        # Validators and caching headers only - there is no body for Content-* to describe
+        await _respond(writer, "304 Not Modified", {name: value for name, value in response.items()
+                                                    if name in ("Date", "ETag", "Cache-Control", "Vary", "Connection")})
+        return
+
+    status, start, length = "200 OK", 0, entry.size
+    if_range = headers.get("if-range")
+    if method == "GET" and "range" in headers and (if_range is None or if_range in (entry.etag, entry.last_modified)):
+        span = byte_range(headers["range"], entry.size)
+        if span is False:
+            await _error(writer, "416 Range Not Satisfiable", keep_alive, method,
+                         {"Content-Range": f"bytes */{entry.size}"})
+            return
+        if span:
+            status, start, length = "206 Partial Content", span[0], span[1] - span[0] + 1
+            response["Content-Range"] = f"bytes {span[0]}-{span[1]}/{entry.size}"
+    response["Content-Length"] = length
+
+    if method == "HEAD":
+        await _respond(writer, status, response)
+    elif entry.data is not None:
+        await _respond(writer, status, response, entry.data[start:start + length])
+    else:
+        await _respond(writer, status, response)
+        loop = asyncio.get_running_loop()
+        while length > 0:
+            try:
+                chunk = await loop.run_in_executor(None, _read_slice, sent, start, min(length, CHUNK_BYTES))
+            except FileNotFoundError:
+                raise ConnectionError("file removed while sending") from None
+            if not chunk:
+                raise ConnectionError("file shrank while sending")
+            writer.write(chunk)
+            await writer.drain()
+            start, length = start + len(chunk), length - len(chunk)
+
+async def handle(site, reader, writer):
+    """Requests on one connection, one after another, until either side closes or it idles out"""
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except ValueError:
+                await _error(writer, "431 Request Header Fields Too Large", False)
+                return
+            if request is None:
+                return
+            method, target, version, headers = request
+            keep_alive = _keep_alive(version, headers)
+            if not method:
+                await _error(writer, "400 Bad Request", False)
+                return
+            if "transfer-encoding" in headers:
+                await _error(writer, "400 Bad Request", False)  # no request bodies to read here
+                return
+            if method not in ("GET", "HEAD"):
+                # Answered without reading whatever body it came with, so the connection cannot be reused
+                await _error(writer, "405 Method Not Allowed", False, method, {"Allow": "GET, HEAD"})
+                return
+            if headers.get("content-length", "0") != "0":
+                try:
+                    length = int(headers["content-length"])
+                except ValueError:
+                    await _error(writer, "400 Bad Request", False)
+                    return
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    await _error(writer, "413 Content Too Large", False, method)
+                    return
+                try:
+                    await asyncio.wait_for(reader.readexactly(length), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    return
+            path = site.resolve(urlsplit(target).path)
+            if path is None:
+                await _error(writer, "404 Not Found", keep_alive, method)
+            else:
+                await _send_file(site, writer, method, path, headers, keep_alive)
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass  # client went away
+    finally:
+        writer.close()
+
+async def serve(root, host="127.0.0.1", port=8080):
+    site = StaticSite(root)
+    server = await asyncio.start_server(lambda r, w: handle(site, r, w), host, port, backlog=1024)
+    print(f"🚀 Serving {site.root} on http://{host}:{server.sockets[0].getsockname()[1]}/ (Ctrl+C to stop)",
+          flush=True)
+    async with server:
+        await server.serve_forever()
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    if len(args) != 1 or not os.path.isdir(args[0]):
+        print("🎤 Usage: python static_server.py <dir> [--host=127.0.0.1] [--port=8080]")
+        print("   Serves <dir>, sending a file's .br or .gz sibling to clients that accept it")
+        sys.exit(1)
+    try:
+        asyncio.run(serve(args[0], options.get("host", "127.0.0.1"), int(options.get("port", 8080))))
+    except KeyboardInterrupt:
+        print("\n👋 Static server stopped")
+
+if __name__ == "__main__":
+    main()
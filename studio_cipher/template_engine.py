@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Studio Cipher Template Engine
+Page templates with layouts, blocks and partials - compiled once to bytecode and cached
+"""
+
+import ast
+import builtins
+import hashlib
+import html
+import marshal
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+STUDIO_DIR = Path(__file__).resolve().parent
+TEMPLATES_DIR = STUDIO_DIR / "templates"
+CACHE_DIR = STUDIO_DIR / ".cipher_cache" / "templates"
+ENGINE_VERSION = 1
+
+TOKEN = re.compile(r"(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})", re.DOTALL)
+STATEMENT = re.compile(r"\{%.*?%\}|\{#.*?#\}", re.DOTALL)
+
+class TemplateError(Exception):
+    """A template that does not parse, or one that cannot be found"""
+
+    def __init__(self, message, name=None, line=None):
+        where = f"{name}:{line}: " if name and line else f"{name}: " if name else ""
+        super().__init__(f"{where}{message}")
+
+class Loop:
+    """`loop` inside a for block - index is 1-based like the output people count"""
+
+    def __init__(self, index0, length):
+        self.index0 = index0
+        self.index = index0 + 1
+        self.length = length
+        self.first = index0 == 0
+        self.last = index0 == length - 1
+
+def escape(value):
+    if value is None:
+        return ""
+    return html.escape(value if isinstance(value, str) else str(value), quote=True)
+
+def _attr(obj, name):
+    """`a.b` in a template: a key of a dict, otherwise an attribute"""
+    try:
+        return obj[name]
+    except (KeyError, TypeError, IndexError):
+        return getattr(obj, name, None)
+
+# -- parsing -----------------------------------------------------------------
+
+def tokenize(source, name=None):
+    """(kind, value, line) for text, {{ expressions }} and {% statements %}.
+
+    A statement or comment alone on its line takes the whole line with it -
+    its indent and its newline - so layouts read like the HTML they make.
+    """
+    tokens, position = [], 0
+    for match in TOKEN.finditer(source):
+        start, end = match.span()
+        text = source[position:start]
+        tag = match.group(0)
+        line = source.count("\n", 0, start) + 1
+        if tag[1] in "%#":
+            line_start = source.rfind("\n", 0, start) + 1
+            if not STATEMENT.sub("", source[line_start:start]).strip(" \t"):
+                text = text[:len(text) - (start - max(line_start, position))]
+                if source.startswith("\n", end):
+                    end += 1
+        if text:
+            tokens.append(("text", text, line))
+        if tag[1] == "{":
+            tokens.append(("var", tag[2:-2].strip(), line))
+        elif tag[1] == "%":
+            tokens.append(("stmt", tag[2:-2].strip(), line))
+        position = end
+    if position < len(source):
+        tokens.append(("text", source[position:], source.count("\n", 0, position) + 1))
+    return tokens
+
+def parse(tokens, name, position=0, until=()):
+    """Nested nodes up to one of the `until` statements - returns (nodes, stop statement, position)"""
+    nodes = []
+    while position < len(tokens):
+        kind, value, line = tokens[position]
+        position += 1
+        if kind != "stmt":
+            nodes.append((kind, value, line))
+            continue
+        keyword, _, rest = value.partition(" ")
+        rest = rest.strip()
+        if keyword in until:
+            return nodes, (keyword, rest, line), position
+        if keyword == "if":
+            branches, otherwise = [], []
+            condition = rest
+            while True:
+                body, stop, position = parse(tokens, name, position, ("elif", "else", "endif"))
+                branches.append((condition, body))
+                if stop[0] == "elif":
+                    condition = stop[1]
+                elif stop[0] == "else":
+                    otherwise, stop, position = parse(tokens, name, position, ("endif",))
+                    break
+                else:
+                    break
+            nodes.append(("if", (branches, otherwise), line))
+        elif keyword == "for":
+            target, _, iterable = rest.partition(" in ")
+            if not iterable:
+                raise TemplateError(f"expected 'for <name> in <expression>', got '{value}'", name, line)
+            body, _, position = parse(tokens, name, position, ("endfor",))
+            names = tuple(t.strip() for t in target.split(","))
+            nodes.append(("for", (names, iterable.strip(), body), line))
+        elif keyword == "block":
+            body, _, position = parse(tokens, name, position, ("endblock",))
+            nodes.append(("block", (rest, body), line))
+        elif keyword == "set":
+            target, _, expression = rest.partition("=")
+            nodes.append(("set", (target.strip(), expression.strip()), line))
+        elif keyword in ("include", "extends"):
+            nodes.append((keyword, rest, line))
+        else:
+            raise TemplateError(f"unknown statement '{keyword}'", name, line)
+    if until:
+        raise TemplateError(f"missing {{% {until[-1]} %}}", name, tokens[-1][2] if tokens else None)
+    return nodes, None, position
+
+# -- code generation -----------------------------------------------------------
+
+class _ContextNames(ast.NodeTransformer):
+    """Rewrite a Python expression so names come from the template context"""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+
+    def visit_Name(self, node):
+        if not isinstance(node.ctx, ast.Load):
+            return node
+        call = ast.Call(ast.Name("_lookup", ast.Load()), [ast.Name(self.ctx, ast.Load()), ast.Constant(node.id)], [])
+        return ast.copy_location(call, node)
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        return ast.copy_location(ast.Call(ast.Name("_attr", ast.Load()), [node.value, ast.Constant(node.attr)], []), node)
+
+class Compiler:
+    """Template nodes -> Python source for one module: render(), a function per block, BLOCKS"""
+
+    def __init__(self, name):
+        self.name = name
+        self.functions = []
+        self.blocks = {}
+        self.counter = 0
+
+    def expression(self, source, ctx, line):
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError as exc:
+            raise TemplateError(f"bad expression '{source}': {exc.msg}", self.name, line) from None
+        return ast.unparse(ast.fix_missing_locations(_ContextNames(ctx).visit(tree)))
+
+    def body(self, nodes, ctx, out, indent):
+        pad = "    " * indent
+        for kind, value, line in nodes:
+            if kind == "text":
+                out.append(f"{pad}_w({value!r})")
+            elif kind == "var":
+                raw = value.endswith("|safe")
+                code = self.expression(value[:-5] if raw else value, ctx, line)
+                out.append(f"{pad}_w(_str({code}))" if raw else f"{pad}_w(_escape({code}))")
+            elif kind == "if":
+                branches, otherwise = value
+                for i, (condition, branch) in enumerate(branches):
+                    out.append(f"{pad}{'if' if i == 0 else 'elif'} {self.expression(condition, ctx, line)}:")
+                    self.body(branch, ctx, out, indent + 1)
+                    out.append(f"{pad}    pass")
+                if otherwise:
+                    out.append(f"{pad}else:")
+                    self.body(otherwise, ctx, out, indent + 1)
+            elif kind == "for":
+                names, iterable, branch = value
+                self.counter += 1
+                n, inner = self.counter, f"ctx{self.counter}"
+                out.append(f"{pad}_seq{n} = list({self.expression(iterable, ctx, line)} or ())")
+                out.append(f"{pad}for _i{n}, _item{n} in enumerate(_seq{n}):")
+                out.append(f"{pad}    {inner} = {{**{ctx}, 'loop': _Loop(_i{n}, len(_seq{n}))}}")
+                if len(names) == 1:
+                    out.append(f"{pad}    {inner}[{names[0]!r}] = _item{n}")
+                else:
+                    out.append(f"{pad}    {inner}.update(zip({names!r}, _item{n}))")
+                self.body(branch, inner, out, indent + 1)
+            elif kind == "block":
+                block_name, branch = value
+                self.define_block(block_name, branch, line)
+                out.append(f"{pad}_w(blocks[{block_name!r}]({ctx}, blocks, env))")
+            elif kind == "include":
+                out.append(f"{pad}_w(env.get_template({self.expression(value, ctx, line)}).render_with({ctx}))")
+            elif kind == "set":
+                target, expression = value
+                out.append(f"{pad}{ctx} = {{**{ctx}, {target!r}: {self.expression(expression, ctx, line)}}}")
+
+    def define_block(self, block_name, nodes, line):
+        if block_name in self.blocks:
+            raise TemplateError(f"block '{block_name}' defined twice", self.name, line)
+        function = f"_block_{len(self.blocks)}"
+        self.blocks[block_name] = function
+        out = [f"def {function}(ctx, blocks, env):", "    _out = []", "    _w = _out.append"]
+        self.body(nodes, "ctx", out, 1)
+        out.append("    return ''.join(_out)")
+        self.functions.append("\n".join(out))
+
+    def compile(self, source):
+        nodes, _, _ = parse(tokenize(source, self.name), self.name)
+        parent = None
+        for kind, value, line in nodes:
+            if kind == "extends":
+                parent = value
+        out = ["def render(ctx, blocks, env):", "    _out = []", "    _w = _out.append"]
+        if parent:
+            # A child only contributes blocks and top-level sets - its other text is dropped
+            kept = [node for node in nodes if node[0] in ("set", "block")]
+            self.body([n for n in kept if n[0] == "set"], "ctx", out, 1)
+            for kind, value, line in kept:
+                if kind == "block":
+                    self.define_block(value[0], value[1], line)
+            out.append(f"    return env.get_template({self.expression(parent, 'ctx', 1)}).render_with(ctx, blocks)")
+        else:
+            self.body(nodes, "ctx", out, 1)
+            out.append("    return ''.join(_out)")
+        blocks = ", ".join(f"{name!r}: {function}" for name, function in self.blocks.items())
+        return "\n\n".join(self.functions + ["\n".join(out), f"BLOCKS = {{{blocks}}}"]) + "\n"
+
+# -- runtime ---------------------------------------------------------------------
+
+class Template:
+    def __init__(self, env, name, code):
+        namespace = {"_lookup": env._lookup, "_attr": _attr, "_escape": escape, "_str": env._str, "_Loop": Loop}
+        exec(code, namespace)
+        self.env = env
+        self.name = name
+        self._render = namespace["render"]
+        self.blocks = namespace["BLOCKS"]
+
+    def render_with(self, ctx, blocks=None):
+        merged = dict(self.blocks)
+        if blocks:
+            merged.update(blocks)  # the most derived template's blocks win
+        return self._render(ctx, merged, self.env)
+
+    def render(self, **context):
+        return self.render_with(context)
+
+class Environment:
+    """Loads templates from a directory and keeps their compiled form.
+
+    Each template is compiled to a Python code object once; the code is kept
+    in memory and marshalled to the cache directory, keyed by the template's
+    source, so other processes skip compiling too. With auto_reload, a
+    template whose file changed is recompiled on its next use.
+    """
+
+    def __init__(self, directory=None, cache_dir=CACHE_DIR, auto_reload=True, globals=None):
+        self.directory = Path(directory or TEMPLATES_DIR)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.auto_reload = auto_reload
+        self.globals = dict(globals or {})
+        self.templates = {}
+        self.stats = {"compiled": 0, "loaded": 0}
+
+    def _lookup(self, ctx, name):
+        if name in ctx:
+            return ctx[name]
+        if name in self.globals:
+            return self.globals[name]
+        return getattr(builtins, name, None)
+
+    @staticmethod
+    def _str(value):
+        return "" if value is None else str(value)
+
+    def _code(self, name, source):
+        key = hashlib.sha256(f"{ENGINE_VERSION}\0{sys.implementation.cache_tag}\0{name}\0{source}"
+                             .encode("utf-8")).hexdigest()
+        cached = self.cache_dir / f"{key}.bin" if self.cache_dir else None
+        if cached:
+            try:
+                code = marshal.loads(cached.read_bytes())
+                self.stats["loaded"] += 1
+                return code
+            except (OSError, ValueError, EOFError, TypeError):
+                pass
+        code = compile(Compiler(name).compile(source), f"<template {name}>", "exec")
+        self.stats["compiled"] += 1
+        if cached:
+            try:
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(marshal.dumps(code))
+                os.replace(tmp, cached)
+            except OSError:
+                pass  # read-only checkout - compile again next time
+        return code
+
+    def get_template(self, name):
+        path = self.directory / name
+        entry = self.templates.get(name)
+        if entry and not self.auto_reload:
+            return entry[1]
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise TemplateError("template not found", name) from None
+        if entry and entry[0] == mtime:
+            return entry[1]
+        template = Template(self, name, self._code(name, path.read_text(encoding="utf-8")))
+        self.templates[name] = (mtime, template)
+        return template
+
+    def render(self, name, **context):
+        return self.get_template(name).render(**context)
+
+_default = None
+
+def environment():
+    """The shared environment over studio_cipher/templates"""
+    global _default
+    if _default is None:
+        _default = Environment()
+    return _default
+
+def page_names():
+    return sorted(p.name for p in (TEMPLATES_DIR / "pages").glob("*.html"))
+
+def render_page(page, **context):
+    """One app page from templates/pages/ - `page` marks it active in the sidebar"""
+    return environment().render(f"pages/{page}", page=page, **context)
+
+def render_pages(pages=None, **context):
+    """Every app page in one pass over the shared layout -> {page: html}"""
+    return {page: render_page(page, **context) for page in (pages or page_names())}
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args or args[0] not in ("render", "bench") or (args[0] == "render" and len(args) < 2):
+        print("🎤 Usage: python template_engine.py render <out_dir>")
+        print("         python template_engine.py bench [--rounds=50]")
+        sys.exit(1)
+
+    if args[0] == "render":
+        out_dir = Path(args[1])
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for page, text in render_pages().items():
+            (out_dir / page).write_text(text, encoding="utf-8")
+            print(f"  📄 {page} ({len(text.encode('utf-8')):,} bytes)")
+        return
+
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    rounds = int(options.get("rounds", 50))
+    pages = page_names()
+
+    env = Environment(cache_dir=None)
+    started = time.perf_counter()
+    for page in pages:
+        env.render(f"pages/{page}", page=page)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            env.render(f"pages/{page}", page=page)
+    warm = (time.perf_counter() - started) / rounds
+
+    # A sidebar edit: the partial recompiles once, then every page renders again
+    env.templates.pop("partials/sidebar.html", None)
+    started = time.perf_counter()
+    for page in pages:
+        env.render(f"pages/{page}", page=page)
+    sidebar = time.perf_counter() - started
+
+    print(f"🧩 {len(pages)} pages, {len(env.templates)} templates")
+    print(f"   compile + render all: {cold * 1000:7.2f} ms")
+    print(f"   render all (warm):    {warm * 1000:7.2f} ms")
+    print(f"   sidebar change:       {sidebar * 1000:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
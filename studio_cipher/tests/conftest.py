@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The studio modules import each other by bare name, the way the scripts run
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from agent_engine import AgentEngine
+from run_mission import build_engine
+
+def _gates(review_gates):
+    engine = AgentEngine({"orchestration": {"review_gates": review_gates}})
+    return [engine.gate(name) for name in ("architecture", "integration", "production")]
+
+def test_gates_are_found_by_name_then_by_position():
+    assert _gates(["architecture", "security", "integration", "production"]) == \
+        ["architecture", "integration", "production"]
+    assert _gates(["design", "ship"]) == ["design", "ship", "ship"]
+    assert _gates(["review"]) == ["review", "review", "review"]
+
+def test_a_single_review_gate_still_builds_the_mission(tmp_path):
+    engine = build_engine({"orchestration": {"review_gates": ["review"]}}, {"lyricist": {}}, Path(tmp_path))
+    assert {unit.phase for unit in engine.units} == {"review"}
+    assert [u.name for u in engine.units if u.agent == "lyricist"].count("write_agent_status") == 1
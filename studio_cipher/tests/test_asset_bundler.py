@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from asset_bundler import BUNDLE_MANIFEST, BundleError, bundle_app
+from build_manifest import BuildManifest
+
+PAGE = '<html><head><link rel="stylesheet" href="style.css"></head><body class="card">hi</body></html>'
+
+def _app(root, css=".card { color: red }"):
+    app = root / "claim_cipher_app"
+    app.mkdir(exist_ok=True)
+    (app / "index.html").write_text(PAGE)
+    (app / "style.css").write_text(css)
+    return app
+
+def _bundles(out_dir):
+    return sorted(p.name for p in (out_dir / "bundles").iterdir())
+
+def test_rebuild_removes_only_files_the_last_bundle_wrote(tmp_path):
+    app, out = _app(tmp_path), tmp_path / "claim_cipher_dist"
+    manifest = BuildManifest(tmp_path)
+    bundle_app(app, out, manifest.write_bytes, compress=False, remove=manifest.remove)
+    manifest.save()
+    [old] = _bundles(out)
+
+    _app(tmp_path, ".card { color: blue }")
+    manifest = BuildManifest(tmp_path)
+    bundle_app(app, out, manifest.write_bytes, compress=False, remove=manifest.remove)
+    [new] = _bundles(out)
+    assert new != old
+    assert manifest.summary()["removed"] == [f"claim_cipher_dist/bundles/{old}"]
+    manifest.save()
+    saved = json.loads((tmp_path / manifest.path.name).read_text())["artifacts"]
+    assert f"claim_cipher_dist/bundles/{old}" not in saved and f"claim_cipher_dist/bundles/{new}" in saved
+    assert json.loads((out / BUNDLE_MANIFEST).read_text())["files"] == [f"bundles/{new}", "index.html"]
+
+def test_refuses_a_directory_of_someone_elses_files(tmp_path):
+    app = _app(tmp_path)
+    elsewhere = tmp_path / "site"
+    elsewhere.mkdir()
+    (elsewhere / "notes.txt").write_text("mine")
+    with pytest.raises(BundleError):
+        bundle_app(app, elsewhere, compress=False)
+    with pytest.raises(BundleError):
+        bundle_app(app, app, compress=False)
+    assert (elsewhere / "notes.txt").read_text() == "mine"
+    assert sorted(p.name for p in app.iterdir()) == ["index.html", "style.css"]
+
+def test_files_added_by_hand_after_a_bundle_are_left_alone(tmp_path):
+    app, out = _app(tmp_path), tmp_path / "claim_cipher_dist"
+    bundle_app(app, out, compress=False)
+    (out / "robots.txt").write_text("User-agent: *")
+    bundle_app(app, out, compress=False)
+    assert (out / "robots.txt").exists()
@@ -0,0 +1,72 @@
+import json
+
+import blob_store
+from build_manifest import file_hash
+from build_pipeline import run_pipeline
+from phase_journal import PhaseJournal
+
+def _new_run(runs_dir, run_id):
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "mission.json").write_text(json.dumps({"goal": "x", "deliverables": {}, "acceptance_criteria": []}))
+    (run_dir / "producer").mkdir()
+    (run_dir / "producer" / "status.json").write_text('{"status": "done"}')
+    return run_dir
+
+def _blobs_intact(runs_dir):
+    blobs = list(blob_store.iter_blobs(runs_dir))
+    assert blobs
+    for digest, blob in blobs:
+        assert file_hash(blob) == digest, f"blob {digest} was written through a run file"
+
+def test_resume_after_dedupe_leaves_blobs_untouched(tmp_path):
+    runs_dir = tmp_path / "runs"
+    runs = [_new_run(runs_dir, run_id) for run_id in ("20250101_000000", "20250102_000000")]
+    for run_dir in runs:
+        run_pipeline(run_dir, serial=True)
+    for run_dir in runs:
+        blob_store.store_run(run_dir)
+    _blobs_intact(runs_dir)
+    assert runs[1].joinpath("claim_cipher_app", "index.html").stat().st_nlink > 1
+
+    # Resuming appends to the journal and the trace and rewrites status files in place
+    run_pipeline(runs[1], serial=True, resume=True)
+    PhaseJournal(runs[1]).start("mission")
+    (runs[1] / "producer" / "status.json").write_text('{"status": "again"}')
+    _blobs_intact(runs_dir)
+    assert (runs[0] / "producer" / "status.json").read_text() == '{"status": "done"}'
+
+def test_store_run_unlinks_mutable_files_an_older_store_shared(tmp_path):
+    runs_dir = tmp_path / "runs"
+    run_dir = _new_run(runs_dir, "20250101_000000")
+    PhaseJournal(run_dir).start("pipeline")
+    blob = blob_store.blob_path(runs_dir, file_hash(run_dir / "journal.jsonl"))
+    blob.parent.mkdir(parents=True)
+    blob.hardlink_to(run_dir / "journal.jsonl")  # what store_run used to do
+
+    blob_store.store_run(run_dir)
+    assert (run_dir / "journal.jsonl").stat().st_nlink == 1
+    PhaseJournal(run_dir).start("pipeline")
+    _blobs_intact(runs_dir)
+
+def test_editing_a_deduped_file_leaves_its_sibling_run_alone(tmp_path):
+    import run_mission
+    from build_manifest import write_text_atomic
+
+    runs_dir = tmp_path / "runs"
+    runs = [_new_run(runs_dir, run_id) for run_id in ("20250101_000000", "20250102_000000")]
+    for run_dir in runs:
+        run_mission.producer_execution_plan(run_dir)
+        run_mission.lyricist_auth_route(run_dir)
+        blob_store.store_run(run_dir)
+    plan = runs[0] / "execution-plan.md"
+    original = plan.read_text(encoding="utf-8")
+    assert plan.stat().st_nlink > 1
+
+    # A resumed mission writes its files again, and anyone may edit one afterwards
+    run_mission.producer_execution_plan(runs[1])
+    run_mission.lyricist_auth_route(runs[1])
+    write_text_atomic(runs[1] / "execution-plan.md", "# edited")
+    assert (runs[1] / "execution-plan.md").read_text() == "# edited"
+    assert plan.read_text(encoding="utf-8") == original
+    _blobs_intact(runs_dir)
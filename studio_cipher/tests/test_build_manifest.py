@@ -0,0 +1,61 @@
+import json
+
+from build_manifest import BuildManifest
+from build_pipeline import BUILDERS, Stage, run_pipeline
+
+def _mtimes(run_dir):
+    return {p.relative_to(run_dir).as_posix(): p.stat().st_mtime_ns
+            for p in run_dir.rglob("*") if p.is_file() and p.parent.name != run_dir.name}
+
+def test_same_bytes_are_not_written_again(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    assert manifest.write_text(tmp_path / "a.html", "<html></html>") == "added"
+    before = (tmp_path / "a.html").stat().st_mtime_ns
+    again = BuildManifest(tmp_path)
+    assert again.write_text(tmp_path / "a.html", "<html></html>") == "unchanged"
+    assert (tmp_path / "a.html").stat().st_mtime_ns == before
+    assert again.summary() == {"added": [], "changed": [], "unchanged": ["a.html"], "removed": []}
+
+def test_no_two_builders_write_the_same_file():
+    owners = {}
+    for stage in (Stage.from_builder(path) for path in BUILDERS):
+        for path in stage.writes:
+            if not path.endswith("/"):
+                assert path not in owners, f"{path} is written by {owners[path]} and {stage.name}"
+                owners[path] = stage.name
+
+def test_unchanged_rebuild_touches_nothing(tmp_path):
+    run_dir = tmp_path / "runs" / "20250101_000000"
+    run_dir.mkdir(parents=True)
+    (run_dir / "mission.json").write_text(json.dumps({"goal": "x", "deliverables": {}, "acceptance_criteria": []}))
+    run_pipeline(run_dir, serial=True)
+    before = _mtimes(run_dir)
+
+    _, summary = run_pipeline(run_dir, serial=True)
+    assert summary["added"] == summary["changed"] == summary["removed"] == []
+    assert _mtimes(run_dir) == before
+
+def test_resume_keeps_manifest_entries_of_stages_committed_before_a_crash(tmp_path):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    first = tmp_path / "first.py"
+    first.write_text("import build_manifest\nWRITES = ['a.txt']\n"
+                     "def build(run_dir):\n"
+                     "    build_manifest.write_artifact(run_dir, run_dir / 'a.txt', 'a')\n")
+    second = tmp_path / "second.py"
+    second.write_text("import build_manifest\nREADS = ['a.txt']\nWRITES = ['b.txt']\n"
+                      "def build(run_dir):\n"
+                      "    if (run_dir / 'crash').exists():\n"
+                      "        raise RuntimeError('crash')\n"
+                      "    build_manifest.write_artifact(run_dir, run_dir / 'b.txt', 'b')\n")
+    (run_dir / "crash").write_text("")
+    try:
+        run_pipeline(run_dir, builders=[first, second], serial=True)
+    except RuntimeError:
+        pass
+    assert "a.txt" in BuildManifest(run_dir).entries
+
+    (run_dir / "crash").unlink()
+    results, _ = run_pipeline(run_dir, builders=[first, second], serial=True, resume=True)
+    assert results["first"] == ([], 0.0, {})
+    assert set(BuildManifest(run_dir).entries) == {"a.txt", "b.txt"}
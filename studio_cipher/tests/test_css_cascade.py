@@ -0,0 +1,47 @@
+from css_cascade import Cascade, consolidate
+
+def _rules(css):
+    return [line.strip() for line in consolidate(css).splitlines()]
+
+def test_later_rule_overrides_only_what_it_sets():
+    assert _rules(".a { color: red; margin: 0 }\n.a { color: blue }") == [".a { margin: 0 }", ".a { color: blue }"]
+
+def test_important_beats_a_later_normal_declaration():
+    assert _rules(".a { color: red !important }\n.a { color: blue }") == \
+        [".a { color: red !important }", ".a { color: blue }"]
+
+def test_selector_lists_must_all_be_overridden():
+    assert _rules(".a, .b { color: red }\n.a { color: blue }") == [".a, .b { color: red }", ".a { color: blue }"]
+    assert _rules(".a, .b { color: red }\n.b, .a { color: blue }") == [".b, .a { color: blue }"]
+
+def test_media_contexts_are_separate():
+    css = ".a { color: red }\n@media (max-width: 600px) { .a { color: blue } }"
+    assert Cascade(css).stats()["declarations_after"] == 2
+
+def test_fallbacks_within_a_rule_survive():
+    assert _rules(".a { display: -webkit-box; display: flex }") == [".a { display: -webkit-box; display: flex }"]
+
+def test_vendor_values_do_not_hide_earlier_ones():
+    assert _rules(".a { display: flex }\n.a { display: -webkit-box }") == \
+        [".a { display: flex }", ".a { display: -webkit-box }"]
+
+def test_newer_units_and_functions_keep_the_earlier_value_as_a_fallback():
+    assert _rules(".a { height: 100vh }\n.a { height: 100dvh }") == [".a { height: 100vh }", ".a { height: 100dvh }"]
+    assert _rules(".a { width: 10px }\n.a { width: clamp(1rem, 5vw, 3rem) }") == \
+        [".a { width: 10px }", ".a { width: clamp(1rem, 5vw, 3rem) }"]
+    assert _rules(".a { height: 100dvh }\n.a { height: 100vh }") == [".a { height: 100vh }"]
+
+def test_custom_properties_keep_their_case():
+    assert _rules(":root { --Gap: 1px }\n:root { --gap: 2px }") == [":root { --Gap: 1px }", ":root { --gap: 2px }"]
+    assert _rules(":root { --gap: 1px }\n:root { --gap: 2px }") == [":root { --gap: 2px }"]
+    assert _rules(".a { MARGIN: 1px }\n.a { margin: 2px }") == [".a { margin: 2px }"]
+
+def test_later_keyframes_replace_earlier_ones():
+    css = "@keyframes spin { from { opacity: 0 } }\n@keyframes spin { to { opacity: 1 } }"
+    assert _rules(css) == ["@keyframes spin { to { opacity: 1 } }"]
+
+def test_selector_lists_with_newer_pseudo_classes_keep_the_earlier_rule():
+    for pseudo in (".b:has(img)", ":is(.b) p", ":where(.b)", ".b:focus-visible", ".b::-moz-focus-inner"):
+        css = f".a {{ color: red }}\n.a, {pseudo} {{ color: blue }}"
+        assert _rules(css) == [".a { color: red }", f".a, {pseudo} {{ color: blue }}"]
+    assert _rules(".a { color: red }\n.a, .b:hover { color: blue }") == [".a, .b:hover { color: blue }"]
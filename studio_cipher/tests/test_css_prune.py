@@ -0,0 +1,39 @@
+from css_prune import Vocabulary, prune_css
+
+PAGE = """<body><nav id="main" class="nav open"><a class="nav-link" onclick="toggle('drawer')">Go</a></nav>
+<script>el.classList.add('is-active'); toast.className = `toast-${type}`; badge.className = 'status-' + state;</script>
+</body>"""
+
+def _vocabulary(safelist=()):
+    vocabulary = Vocabulary(safelist)
+    vocabulary.add_markup(PAGE)
+    return vocabulary
+
+def _selectors(css, safelist=()):
+    return [line.split(" {")[0].strip() for line in prune_css(css, _vocabulary(safelist)).splitlines()
+            if "{" in line and not line.strip().startswith("@")]
+
+def test_names_from_markup_and_scripts_are_kept():
+    css = ".nav {a:1} #main .nav-link {a:1} .is-active {a:1} .drawer {a:1} .gone {a:1} table td {a:1}"
+    assert _selectors(css) == [".nav", "#main .nav-link", ".is-active", ".drawer"]
+
+def test_dynamic_prefixes_keep_their_whole_family():
+    assert _selectors(".toast-error {a:1} .status-done {a:1} .state-x {a:1}") == [".toast-error", ".status-done"]
+
+def test_selector_lists_lose_only_the_dead_selectors():
+    assert _selectors(".gone, .nav, .also-gone {a:1}") == [".nav"]
+
+def test_vendor_pseudo_lists_stay_whole():
+    css = ".nav::-webkit-scrollbar, .gone {a:1}"
+    assert _selectors(css) == [".nav::-webkit-scrollbar, .gone"]
+
+def test_safelist_patterns_and_pseudo_classes():
+    assert _selectors(".modal-open {a:1} .nav:hover {a:1} a:not(.gone) {a:1}", ["modal-*"]) == \
+        [".modal-open", ".nav:hover", "a:not(.gone)"]
+
+def test_empty_media_blocks_and_unused_keyframes_go():
+    css = ("@media (max-width: 600px) { .gone {a:1} }\n@media print { .nav {a:1} }\n"
+           "@keyframes fade { to { opacity: 0 } }\n@keyframes spin { to { opacity: 1 } }\n.nav { animation: spin 1s }")
+    pruned = prune_css(css, _vocabulary())
+    assert "600px" not in pruned and "@media print" in pruned
+    assert "@keyframes spin" in pruned and "fade" not in pruned
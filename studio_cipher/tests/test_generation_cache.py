@@ -0,0 +1,35 @@
+from generation_cache import GenerationCache, generation_key
+from model_backend import backend_identity
+
+PROMPT = {"role": "Lyricist"}
+MISSION = {"goal": "login"}
+
+def _key(models):
+    return generation_key("gpt-4o-mini", "lyricist", PROMPT, MISSION, backend=backend_identity({"models": models}))
+
+def test_same_model_name_on_another_backend_is_another_generation():
+    standin = _key({"backend": "standin"})
+    openai = _key({"backend": "openai"})
+    proxy = _key({"backend": "openai", "base_url": "http://localhost:11434/v1"})
+    assert len({standin, openai, proxy}) == 3
+    assert openai == _key({"backend": "openai", "base_url": "https://api.openai.com/v1/"})
+
+def test_standin_keys_survive_its_port_changing(monkeypatch):
+    monkeypatch.setenv("CIPHER_MODEL_URL", "http://127.0.0.1:40001")
+    first = _key({"backend": "standin"})
+    monkeypatch.setenv("CIPHER_MODEL_URL", "http://127.0.0.1:40002")
+    assert _key({"backend": "standin"}) == first
+
+def test_puts_only_sweep_the_directory_when_a_limit_is_crossed(tmp_path, monkeypatch):
+    cache = GenerationCache(tmp_path, max_entries=10)
+    sweeps = []
+    entries = cache.entries
+    monkeypatch.setattr(cache, "entries", lambda: sweeps.append(1) or entries())
+    for number in range(10):
+        cache.put(f"{number:064x}", "verse", "gpt-4o-mini")
+    cache.put(f"{3:064x}", "a longer verse", "gpt-4o-mini")  # replacing an entry does not add one
+    assert len(sweeps) == 1
+
+    cache.put(f"{10:064x}", "verse", "gpt-4o-mini")
+    assert len(sweeps) == 2
+    assert cache.stats()["entries"] == 9
@@ -0,0 +1,126 @@
+import shutil
+
+import pytest
+
+import command_center_crew
+from merge_engine import MergeConflictError, commit_edit, merge_edits
+
+RANKS = {"security": 1, "producer": 2, "lyricist": 3, "designer": 4}
+BASE = "".join(f"line {i}\n" for i in range(1, 9))
+
+def edit(base, replace=None, insert=None):
+    """base with {line number: new lines or None} replaced and {before line number: lines} inserted"""
+    out = []
+    for number, line in enumerate(base.splitlines(keepends=True), 1):
+        out.extend(insert.get(number, []) if insert else [])
+        if replace and number in replace:
+            out.extend(replace[number] or [])
+        else:
+            out.append(line)
+    return "".join(out)
+
+def test_edits_to_different_lines_all_apply():
+    result = merge_edits(BASE, {
+        "designer": edit(BASE, replace={2: None}),
+        "security": edit(BASE, insert={6: ["guard\n"]}),
+    }, RANKS)
+    assert result.text == edit(BASE, replace={2: None}, insert={6: ["guard\n"]})
+    assert result.clean
+
+def test_insertions_at_one_spot_are_all_kept_best_rank_first():
+    result = merge_edits(BASE, {
+        "lyricist": edit(BASE, insert={8: ["<script app>\n"]}),
+        "security": edit(BASE, insert={8: ["<script security>\n"]}),
+    }, RANKS)
+    assert result.text == edit(BASE, insert={8: ["<script security>\n", "<script app>\n"]})
+    assert result.combined == 1 and result.clean
+
+def test_identical_deletions_apply_once():
+    deleted = edit(BASE, replace={3: None, 4: None})
+    result = merge_edits(BASE, {"designer": deleted, "lyricist": deleted}, RANKS)
+    assert result.text == deleted and result.clean
+
+def test_overlapping_replacements_go_to_the_best_rank():
+    result = merge_edits(BASE, {
+        "designer": edit(BASE, replace={4: ["designer 4\n"]}),
+        "producer": edit(BASE, replace={4: ["producer 4\n"]}),
+    }, RANKS)
+    assert result.text == edit(BASE, replace={4: ["producer 4\n"]})
+    assert [(c.winner, c.overruled) for c in result.conflicts] == [("producer", ["designer"])]
+
+def test_deletion_outranking_an_insertion_wins_with_a_conflict():
+    result = merge_edits(BASE, {
+        "security": edit(BASE, replace={4: None, 5: None, 6: None}),
+        "designer": edit(BASE, insert={5: ["banner\n"]}),
+    }, RANKS)
+    assert result.text == edit(BASE, replace={4: None, 5: None, 6: None})
+    assert len(result.conflicts) == 1
+
+def test_insertion_outranking_a_deletion_refuses_to_merge():
+    # Taking security's side would quietly bring back the lines designer deleted
+    with pytest.raises(MergeConflictError):
+        merge_edits(BASE, {
+            "designer": edit(BASE, replace={4: None, 5: None, 6: None}),
+            "security": edit(BASE, insert={5: ["<script security>\n"]}),
+        }, RANKS)
+
+def test_commit_edit_leaves_the_file_alone_when_the_merge_fails(tmp_path):
+    page = tmp_path / "page.html"
+    page.write_text(BASE)
+    settings = {"conflict_resolution": {"hierarchy": {rank: agent for agent, rank in RANKS.items()}}}
+    commit_edit(page, "designer", BASE, edit(BASE, replace={4: None, 5: None, 6: None}), settings)
+    with pytest.raises(MergeConflictError):
+        commit_edit(page, "security", BASE, edit(BASE, insert={5: ["<script security>\n"]}), settings)
+    assert page.read_text() == edit(BASE, replace={4: None, 5: None, 6: None})
+    # The refused edit is not left behind to poison the next agent's merge
+    commit_edit(page, "lyricist", BASE, edit(BASE, insert={1: ["<!-- app -->\n"]}), settings)
+    assert page.read_text() == edit(BASE, replace={4: None, 5: None, 6: None}, insert={1: ["<!-- app -->\n"]})
+
+def test_agents_one_after_another_merge_by_rank_whatever_the_order(tmp_path):
+    settings = {"conflict_resolution": {"hierarchy": {rank: agent for agent, rank in RANKS.items()}}}
+    inserts = {"lyricist": ["<script app>\n"], "producer": ["<script tests>\n"], "security": ["<script security>\n"]}
+    pages = []
+    for order in (["lyricist", "security", "producer"], ["producer", "lyricist", "security"]):
+        page = tmp_path / f"{order[0]}.html"
+        page.write_text(BASE)
+        for agent in order:
+            seen = page.read_text()
+            lines = seen.splitlines(keepends=True)
+            lines[-1:-1] = inserts[agent]  # each agent adds its script just before the last line
+            commit_edit(page, agent, seen, "".join(lines), settings)
+        pages.append(page.read_text())
+    expected = edit(BASE, insert={8: inserts["security"] + inserts["producer"] + inserts["lyricist"]})
+    assert pages == [expected, expected]
+
+@pytest.fixture
+def app_copy(tmp_path):
+    def make(name):
+        target = tmp_path / name
+        shutil.copytree(command_center_crew.SOURCE_APP_DIR, target)
+        return target
+    return make
+
+def test_crew_in_parallel_matches_the_serial_run(app_copy):
+    serial, parallel = app_copy("serial"), app_copy("parallel")
+    command_center_crew.run_crew(serial, serial=True)
+    command_center_crew.run_crew(parallel)
+    serial_page = (serial / "command-center.html").read_text(encoding="utf-8")
+    page = (parallel / "command-center.html").read_text(encoding="utf-8")
+
+    assert page == serial_page
+    assert not (parallel / ".cipher_merge").exists()
+    assert ".security-notification" in page
+    for script in ("command-center.js", "command-center-security.js", "command-center-tests.js"):
+        assert page.count(f'src="scripts/{script}"') == 1
+    assert page.index("command-center-security.js") < page.index('src="scripts/command-center.js"')
+
+def test_all_four_against_the_shipped_page_refuse_to_merge(app_copy):
+    # The designer replaces the page; security's insertion lands among the script tags it removed
+    base = (command_center_crew.SOURCE_APP_DIR / "command-center.html").read_text(encoding="utf-8")
+    edits = {}
+    for name in [command_center_crew.DESIGNER, *command_center_crew.EDITORS]:
+        app_dir = app_copy(name)
+        command_center_crew.run_agent(name, app_dir)
+        edits[name.split("_")[0]] = (app_dir / "command-center.html").read_text(encoding="utf-8")
+    with pytest.raises(MergeConflictError):
+        merge_edits(base, edits, RANKS)
@@ -0,0 +1,45 @@
+import shutil
+import subprocess
+
+import pytest
+
+from asset_bundler import minify_css, minify_js
+
+def test_css_loses_comments_and_spaces_but_not_strings():
+    css = "/* header */ b > c , d { color: red ; content: \"a  ;  b\" ; }\n\n e{ margin: 0 }"
+    assert minify_css(css) == 'b>c,d{color:red;content:"a  ;  b"}e{margin:0}'
+
+def test_css_keeps_the_descendant_space_before_a_pseudo_class():
+    assert minify_css("a :hover { color: red }") == "a :hover{color:red}"
+
+def test_js_keeps_newlines_automatic_semicolons_rely_on():
+    assert minify_js("let a = 1\nlet b = a\n(c)") == "let a=1\nlet b=a\n(c)"
+    assert minify_js("if (a) {\n  // comment\n  b()\n}\n") == "if(a){b()}"
+
+def test_js_never_joins_operators_into_new_ones():
+    assert minify_js("x = a - -b; y = a + +b; z = 1 .toString()") == "x=a - -b;y=a + +b;z=1 .toString()"
+
+def test_js_copies_strings_regexes_and_templates_verbatim():
+    assert minify_js("s = 'a  // b'; t = \"/* c */\"") == "s='a  // b';t=\"/* c */\""
+    assert minify_js("return /a b\\/[/]/g.test(x) // tail") == "return /a b\\/[/]/g.test(x)"
+    assert minify_js("const s = `x  ${ {a: 1}.a }  y ${b}`") == "const s=`x  ${{a:1}.a}  y ${b}`"
+
+SCRIPT = """
+// totals, with every construct the minifier has to tread carefully around
+const items = [ { name: 'a // not a comment', price: 2 }, { name: "b /* nor this */", price: 3 } ];
+let total = 0
+for (const item of items) {
+  total += item.price   /* inline */
+}
+const label = `total: ${ items.map(i => { return i.name.length }).join(',') } = ${total}`
+const re = /\\/[a-z]+\\//g
+let n = 5 - -1 + +'2'
+const out = [label, '/x/ y /z/'.match(re).length, n]
+console.log(JSON.stringify(out))
+"""
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_minified_js_behaves_the_same():
+    def run(source):
+        return subprocess.run(["node", "-e", source], capture_output=True, text=True, check=True).stdout
+    assert run(minify_js(SCRIPT)) == run(SCRIPT)
@@ -0,0 +1,36 @@
+from model_backend import ModelError, ModelPool, ModelRequest, ModelResponse, retry_after_seconds
+
+class ShortBatchBackend:
+    """Answers only the first request of each batch"""
+    supports_batch = True
+
+    def __init__(self):
+        self.calls = []
+
+    def complete(self, requests):
+        self.calls.append([r.agent for r in requests])
+        return [ModelResponse(f"verse for {requests[0].agent}", "standin")]
+
+def test_retry_after_takes_seconds_or_an_http_date():
+    assert retry_after_seconds("2") == 2.0
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:05 GMT", now=1445412480.0) == 5.0
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412485.0) == 0.0
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds(None) is None
+
+def test_requests_a_batch_answer_leaves_out_are_retried():
+    backend = ShortBatchBackend()
+    with ModelPool(backend, max_workers=1, batch_size=3, batch_wait=0.5, max_retries=3, backoff=0) as pool:
+        futures = [pool.submit(ModelRequest(agent, "verse")) for agent in ("lyricist", "designer", "producer")]
+        texts = [f.result(timeout=5).text for f in futures]
+    assert texts == ["verse for lyricist", "verse for designer", "verse for producer"]
+    assert backend.calls == [["lyricist", "designer", "producer"], ["designer", "producer"], ["producer"]]
+    assert pool.stats["retries"] == 3
+
+def test_a_batch_that_never_answers_fails_instead_of_hanging():
+    backend = ShortBatchBackend()
+    with ModelPool(backend, max_workers=1, batch_size=2, batch_wait=0.5, max_retries=0) as pool:
+        futures = [pool.submit(ModelRequest(agent, "verse")) for agent in ("lyricist", "designer")]
+        assert futures[0].result(timeout=5).text == "verse for lyricist"
+        error = futures[1].exception(timeout=5)
+    assert isinstance(error, ModelError) and error.retryable
@@ -0,0 +1,17 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from render_pool import RENDER_JOBS_ENV, limit_render_workers, render_workers
+
+def test_limit_never_raises_an_explicit_setting(monkeypatch):
+    monkeypatch.setenv(RENDER_JOBS_ENV, "8")
+    limit_render_workers(2)
+    assert render_workers() == 2
+    limit_render_workers(4)
+    assert render_workers() == 2
+    limit_render_workers(0)
+    assert render_workers() == 1
+
+def test_pool_workers_render_with_their_share(monkeypatch):
+    monkeypatch.delenv(RENDER_JOBS_ENV, raising=False)
+    with ProcessPoolExecutor(max_workers=2, initializer=limit_render_workers, initargs=(1,)) as pool:
+        assert pool.submit(render_workers).result() == 1
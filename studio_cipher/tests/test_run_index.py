@@ -0,0 +1,78 @@
+import run_index
+from check_progress import check_progress
+from progress_watch import DeliverableBoard
+
+MISSION = {"goal": "login", "deliverables": {
+    "frontend": ["LoginCypher.jsx", "src/components/Header.jsx"],
+    "backend": ["auth.py"],
+}}
+
+def _run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run_dir = tmp_path / "runs" / "20250101_000000"
+    run_dir.mkdir(parents=True)
+    run_index.record_run(run_dir, "login", MISSION)
+    return run_dir
+
+def _done(run_dir):
+    return {d["item"]: bool(d["done"]) for d in run_index.progress(run_dir)["deliverables"]}
+
+def _write(run_dir, path):
+    (run_dir / path).parent.mkdir(parents=True, exist_ok=True)
+    (run_dir / path).write_text("x")
+
+def test_mark_missing_unticks_only_deliverables_with_no_path_left(tmp_path, monkeypatch):
+    run_dir = _run(tmp_path, monkeypatch)
+    for path in ("frontend/LoginCypher.jsx", "src/components/Header.jsx", "frontend/Header.jsx"):
+        _write(run_dir, path)
+    run_index.mark_written(run_dir, ["frontend/LoginCypher.jsx", "src/components/Header.jsx", "frontend/Header.jsx"])
+    assert _done(run_dir) == {"LoginCypher.jsx": True, "src/components/Header.jsx": True, "auth.py": False}
+
+    (run_dir / "frontend/LoginCypher.jsx").unlink()
+    (run_dir / "src/components/Header.jsx").unlink()  # frontend/Header.jsx still satisfies it
+    assert run_index.mark_missing(run_dir, ["frontend/LoginCypher.jsx", "src/components/Header.jsx"]) == 1
+    assert _done(run_dir) == {"LoginCypher.jsx": False, "src/components/Header.jsx": True, "auth.py": False}
+
+def test_check_progress_notices_a_deleted_deliverable(tmp_path, monkeypatch):
+    run_dir = _run(tmp_path, monkeypatch)
+    _write(run_dir, "frontend/LoginCypher.jsx")
+    _write(run_dir, "backend/auth.py")
+    check_progress(run_dir.name)
+    assert _done(run_dir)["LoginCypher.jsx"]
+
+    (run_dir / "frontend/LoginCypher.jsx").unlink()
+    check_progress(run_dir.name)
+    assert _done(run_dir) == {"LoginCypher.jsx": False, "src/components/Header.jsx": False, "auth.py": True}
+
+def test_board_refresh_marks_deletions_in_the_index(tmp_path, monkeypatch):
+    run_dir = _run(tmp_path, monkeypatch)
+    _write(run_dir, "frontend/LoginCypher.jsx")
+    board = DeliverableBoard(run_dir, run_index.progress(run_dir))
+    assert _done(run_dir)["LoginCypher.jsx"]
+
+    (run_dir / "frontend/LoginCypher.jsx").unlink()
+    assert board.refresh(["frontend/LoginCypher.jsx"]) == [("frontend", "LoginCypher.jsx")]
+    assert not _done(run_dir)["LoginCypher.jsx"]
+
+    _write(run_dir, "frontend/LoginCypher.jsx")
+    board.refresh(["frontend/LoginCypher.jsx"])
+    assert _done(run_dir)["LoginCypher.jsx"]
+
+def test_agent_units_tick_deliverables_off_as_they_commit(tmp_path, monkeypatch):
+    from agent_engine import AgentEngine
+
+    run_dir = _run(tmp_path, monkeypatch)
+    seen = []
+
+    def write_login():
+        _write(run_dir, "frontend/LoginCypher.jsx")
+        return "frontend/LoginCypher.jsx"
+
+    engine = AgentEngine({"orchestration": {"review_gates": ["integration", "production"]}},
+                         on_commit=lambda unit, artifacts: run_index.mark_written(run_dir, artifacts))
+    engine.schedule("lyricist", "integration", write_login)
+    engine.schedule("producer", "production", lambda: seen.append(_done(run_dir)))
+    engine.run()
+
+    assert engine.passed
+    assert seen == [{"LoginCypher.jsx": True, "src/components/Header.jsx": False, "auth.py": False}]
@@ -0,0 +1,119 @@
+import asyncio
+import gzip
+
+import static_server
+from static_server import StaticSite, handle
+
+PAGE = b"<html>" + b"cipher " * 100 + b"</html>"
+
+def _site(tmp_path):
+    root = tmp_path / "dist"
+    root.mkdir()
+    (root / "index.html").write_bytes(PAGE)
+    (root / "index.html.gz").write_bytes(gzip.compress(PAGE, mtime=0))
+    return root
+
+async def _exchange(root, raw):
+    """Send raw bytes to a fresh server - the status line and headers of each response"""
+    server = await asyncio.start_server(lambda r, w: handle(StaticSite(root), r, w), "127.0.0.1", 0)
+    async with server:
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        writer.write(raw)
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+    responses = []
+    for head in data.split(b"\r\n\r\n"):
+        lines = head.decode("latin-1").split("\r\n")
+        if lines[0].startswith("HTTP/1.1"):
+            responses.append((lines[0].split(" ", 2)[1],
+                              {k.lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:])}))
+    return responses
+
+def _get(path, *headers):
+    return "\r\n".join([f"GET {path} HTTP/1.1", "Host: x", "Connection: close", *headers]).encode() + b"\r\n\r\n"
+
+def test_not_modified_carries_only_validators(tmp_path):
+    root = _site(tmp_path)
+    [(status, first)] = asyncio.run(_exchange(root, _get("/", "Accept-Encoding: gzip")))
+    assert status == "200" and first["content-encoding"] == "gzip"
+    [(status, again)] = asyncio.run(_exchange(root, _get("/", "Accept-Encoding: gzip", f"If-None-Match: {first['etag']}")))
+    assert status == "304"
+    assert again["etag"] == first["etag"] and again["vary"] == "Accept-Encoding"
+    assert not {"content-encoding", "content-type", "content-length"} & again.keys()
+
+def test_compressed_siblings_are_not_urls(tmp_path):
+    root = _site(tmp_path)
+    (root / "backup.tar.gz").write_bytes(gzip.compress(b"x"))
+    [(status, _)] = asyncio.run(_exchange(root, _get("/index.html.gz")))
+    assert status == "404"
+    [(status, archive)] = asyncio.run(_exchange(root, _get("/backup.tar.gz")))
+    assert status == "200" and archive["content-type"] == "application/gzip"
+    assert "content-encoding" not in archive
+
+def test_symlinks_out_of_the_root_are_not_served(tmp_path):
+    root = _site(tmp_path)
+    (tmp_path / "secret.txt").write_text("key")
+    (root / "leak.txt").symlink_to(tmp_path / "secret.txt")
+    [(status, _)] = asyncio.run(_exchange(root, _get("/leak.txt")))
+    assert status == "404"
+
+def test_trickled_headers_share_the_idle_deadline(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_server, "KEEPALIVE_SECONDS", 0.3)
+    root = _site(tmp_path)
+
+    async def trickle():
+        server = await asyncio.start_server(lambda r, w: handle(StaticSite(root), r, w), "127.0.0.1", 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(b"GET / HTTP/1.1\r\n")
+            for i in range(10):
+                await asyncio.sleep(0.1)
+                if reader.at_eof():
+                    break
+                writer.write(f"X-Slow-{i}: 1\r\n".encode())
+            closed = await asyncio.wait_for(reader.read(), 2)
+            writer.close()
+            return i, closed
+
+    lines_sent, reply = asyncio.run(trickle())
+    assert reply == b"" and lines_sent < 9
+
+def test_request_bodies_are_capped_and_never_read_for_other_methods(tmp_path):
+    root = _site(tmp_path)
+    huge = _get("/").replace(b"\r\n\r\n", b"\r\nContent-Length: 1000000000\r\n\r\n")
+    assert [status for status, _ in asyncio.run(_exchange(root, huge))] == ["413"]
+    post = b"POST / HTTP/1.1\r\nHost: x\r\nContent-Length: 1000000000\r\n\r\n"
+    [(status, response)] = asyncio.run(_exchange(root, post))
+    assert status == "405" and response["connection"] == "close"
+    small = _get("/").replace(b"\r\n\r\n", b"\r\nContent-Length: 2\r\n\r\nok")
+    assert [status for status, _ in asyncio.run(_exchange(root, small))] == ["200"]
+
+def test_a_trickled_body_shares_the_idle_deadline(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_server, "KEEPALIVE_SECONDS", 0.3)
+    root = _site(tmp_path)
+
+    async def trickle():
+        server = await asyncio.start_server(lambda r, w: handle(StaticSite(root), r, w), "127.0.0.1", 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(b"GET / HTTP/1.1\r\nHost: x\r\nContent-Length: 100\r\n\r\nab")
+            reply = await asyncio.wait_for(reader.read(), 2)
+            writer.close()
+            return reply
+
+    assert asyncio.run(trickle()) == b""
+
+def test_a_file_unlinked_mid_request_is_a_404(tmp_path, monkeypatch):
+    root = _site(tmp_path)
+    (root / "bundle.js").write_text("x")
+    resolve = StaticSite.resolve
+
+    def resolve_then_rebuild(self, url_path):
+        path = resolve(self, url_path)
+        path.unlink()  # a rebuild dropped the old hashed bundle just now
+        return path
+
+    monkeypatch.setattr(StaticSite, "resolve", resolve_then_rebuild)
+    [(status, _)] = asyncio.run(_exchange(root, _get("/bundle.js")))
+    assert status == "404"
@@ -5,16 +5,18 @@ Designer, Lyricist, Security working together to address all Producer issues
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 
-def get_latest_run():
-    """Get the most recent run directory"""
-    runs_dir = Path("studio_cipher/runs")
-    run_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
-    latest = sorted(run_dirs, key=lambda x: x.name)[-1]
-    return latest
+sys.path.insert(0, str(Path(__file__).resolve().parent / "studio_cipher"))
+from build_manifest import finish_build, write_artifact
+from cipher_trace import traced
+from cipher_runs import get_latest_run
 
+RUNS_DIR = Path(__file__).resolve().parent / "studio_cipher" / "runs"
+
+@traced(phase="build")
 def designer_fixes(run_dir):
     """🎨 DESIGNER: Fix all UI/UX and responsive design issues"""
     created = []
@@ -202,7 +204,7 @@ def designer_fixes(run_dir):
     box-shadow: 0 4px 12px rgba(255, 215, 0, 0.25);
 }"""
     
-    (styles_dir / "mobile-enhancements.css").write_text(mobile_nav_css, encoding="utf-8")
+    write_artifact(run_dir, styles_dir / "mobile-enhancements.css", mobile_nav_css)
     created.append("mobile-enhancements.css")
     
     # 2. Enhanced Sidebar Active State JavaScript
@@ -312,11 +314,12 @@ window.initializeEnhancedNavigation = initializeEnhancedNavigation;
 
 console.log('🧭 Enhanced Navigation JavaScript loaded!');"""
     
-    (app_dir / "scripts" / "enhanced-navigation.js").write_text(enhanced_nav_js, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "scripts" / "enhanced-navigation.js", enhanced_nav_js)
     created.append("enhanced-navigation.js")
     
     return created
 
+@traced(phase="build")
 def lyricist_fixes(run_dir):
     """✍️ LYRICIST: Fix all content and messaging issues"""
     created = []
@@ -484,11 +487,12 @@ window.cipherMessages = cipherMessages;
 
 console.log('✍️ Cipher Content System loaded - messages on point!');"""
     
-    (app_dir / "scripts" / "cipher-content.js").write_text(content_js, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "scripts" / "cipher-content.js", content_js)
     created.append("cipher-content.js")
     
     return created
 
+@traced(phase="build")
 def security_fixes(run_dir):
     """🔒 SECURITY: Fix all functionality and security issues"""
     created = []
@@ -787,63 +791,91 @@ window.initializeCipherSecurity = initializeCipherSecurity;
 
 console.log('🔒 Cipher Security and Functionality loaded - system secured!');"""
     
-    (app_dir / "scripts" / "cipher-security.js").write_text(security_js, encoding="utf-8")
+    write_artifact(run_dir, app_dir / "scripts" / "cipher-security.js", security_js)
     created.append("cipher-security.js")
     
     return created
 
+# Every app page gets the team's shared CSS, scripts and init calls
+HTML_FILES = [
+    "login-cypher.html",
+    "command-center.html", 
+    "mileage-cypher.html",
+    "route-cypher.html",
+    "jobs-studio.html",
+    "firms-directory.html",
+    "settings-booth.html"
+]
+
+def patch_page(content):
+    """An app page with mobile-enhancements.css, the navigation/content/security scripts and their init calls"""
+    # Add new CSS files
+    if 'mobile-enhancements.css' not in content:
+        content = content.replace(
+            '<link rel="stylesheet" href="styles/cipher-core.css">',
+            '<link rel="stylesheet" href="styles/cipher-core.css">\n    <link rel="stylesheet" href="styles/mobile-enhancements.css">'
+        )
+
+    # Add new JavaScript files
+    if 'enhanced-navigation.js' not in content:
+        content = content.replace(
+            '<script src="scripts/cipher-core.js"></script>',
+            '<script src="scripts/cipher-core.js"></script>\n    <script src="scripts/enhanced-navigation.js">\n    <script src="scripts/cipher-content.js"></script>\n    <script src="scripts/cipher-security.js"></script>'
+        )
+
+    # Add initialization calls
+    if 'initializeEnhancedNavigation' not in content:
+        content = content.replace(
+            'initializeCipherUserContext();',
+            'initializeCipherUserContext();\n            initializeEnhancedNavigation();\n            initializeCipherContent();\n            initializeCipherSecurity();'
+        )
+    
+    return content
+
+# Page -> patch, applied by page_fixes as pages are rendered so each is written once, final
+PAGE_PATCHES = {filename: patch_page for filename in HTML_FILES}
+
+@traced(phase="build")
 def update_all_html_files(run_dir):
-    """Update all HTML files to include the new enhancements"""
+    """Update HTML files already on disk (pages rendered before these patches existed)"""
     updated = []
     app_dir = run_dir / "claim_cipher_app"
     
-    # Files to update
-    html_files = [
-        "login-cypher.html",
-        "command-center.html", 
-        "mileage-cypher.html",
-        "route-cypher.html",
-        "jobs-studio.html",
-        "firms-directory.html",
-        "settings-booth.html"
-    ]
-    
-    for filename in html_files:
+    for filename in HTML_FILES:
         file_path = app_dir / filename
         if file_path.exists():
-            content = file_path.read_text(encoding="utf-8")
-            
-            # Add new CSS files
-            if 'mobile-enhancements.css' not in content:
-                content = content.replace(
-                    '<link rel="stylesheet" href="styles/cipher-core.css">',
-                    '<link rel="stylesheet" href="styles/cipher-core.css">\n    <link rel="stylesheet" href="styles/mobile-enhancements.css">'
-                )
-            
-            # Add new JavaScript files
-            if 'enhanced-navigation.js' not in content:
-                content = content.replace(
-                    '<script src="scripts/cipher-core.js"></script>',
-                    '<script src="scripts/cipher-core.js"></script>\n    <script src="scripts/enhanced-navigation.js">\n    <script src="scripts/cipher-content.js"></script>\n    <script src="scripts/cipher-security.js"></script>'
-                )
-            
-            # Add initialization calls
-            if 'initializeEnhancedNavigation' not in content:
-                content = content.replace(
-                    'initializeCipherUserContext();',
-                    'initializeCipherUserContext();\n            initializeEnhancedNavigation();\n            initializeCipherContent();\n            initializeCipherSecurity();'
-                )
-            
-            file_path.write_text(content, encoding="utf-8")
+            content = patch_page(file_path.read_text(encoding="utf-8"))
+            write_artifact(run_dir, file_path, content)
             updated.append(filename)
     
     return updated
 
+# Build pipeline contract - paths are relative to the run directory
+READS = [
+    "claim_cipher_app/styles/",
+    "claim_cipher_app/scripts/",
+]
+WRITES = [
+    "claim_cipher_app/styles/mobile-enhancements.css",
+    "claim_cipher_app/scripts/enhanced-navigation.js",
+    "claim_cipher_app/scripts/cipher-content.js",
+    "claim_cipher_app/scripts/cipher-security.js",
+]
+
+def build(run_dir):
+    """Run every step of this builder against a run directory"""
+    created = []
+    created += designer_fixes(run_dir)
+    created += lyricist_fixes(run_dir)
+    created += security_fixes(run_dir)
+    # The pages themselves are rendered with PAGE_PATCHES already applied - see page_fixes
+    return created
+
 def main():
     print("🎨🎤🔒 TEAM COLLABORATION - FIXING ALL PRODUCER ISSUES 🔒🎤🎨")
     print("=" * 75)
     
-    latest_run = get_latest_run()
+    latest_run = get_latest_run(RUNS_DIR)
     print(f"📁 Working in: {latest_run}")
     
     # All teams working together
@@ -851,6 +883,7 @@ def main():
     lyricist_created = lyricist_fixes(latest_run)
     security_created = security_fixes(latest_run)
     html_updated = update_all_html_files(latest_run)
+    finish_build(latest_run)
     
     print(f"\n✅ TEAM COLLABORATION COMPLETE:")
     print(f"🎨 Designer: {len(designer_created)} files created")